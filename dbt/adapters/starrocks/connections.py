@@ -13,6 +13,12 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import json
+import os
+import re
+import threading
+import time
+from collections import deque
 from contextlib import contextmanager
 
 import mysql.connector
@@ -29,7 +35,12 @@ from dbt.adapters.contracts.connection import (
 )
 from dbt.adapters.sql import SQLConnectionManager
 from dbt.adapters.events.logging import AdapterLogger
-from typing import Optional, Union
+from dbt.adapters.starrocks.instrumentation import INSTRUMENTATION, INSTRUMENTATION_FILE, INSTRUMENTATION_MODES, span
+from dbt.adapters.starrocks.query_profile import QUERY_PROFILE_SQL, parse_query_profile
+from typing import TYPE_CHECKING, Any, Callable, Deque, Dict, Iterator, Optional, Tuple, Union
+
+if TYPE_CHECKING:
+    import agate
 
 logger = AdapterLogger("starrocks")
 
@@ -51,7 +62,19 @@ class StarRocksCredentials(Credentials):
     poll_interval: Optional[int] = 1
     poll_max_delay: Optional[int] = 600
     poll_factor: Optional[float] = 2.0
+    shared_task_poller: Optional[bool] = False
     auth_plugin: Optional[str] = ''
+    http_port: Optional[int] = 8030
+    pool_size: Optional[int] = 0
+    pool_idle_timeout: Optional[int] = 300
+    version_cache_ttl: Optional[int] = 0
+    buffered: Optional[bool] = True
+    fetch_chunk_size: Optional[int] = 10000
+    fetch_max_rows: Optional[int] = None
+    column_cache: Optional[bool] = False
+    catalog_batch_size: Optional[int] = 0
+    query_profile: Optional[bool] = False
+    instrumentation: Optional[str] = None
     
     def __init__(self, **kwargs):
         for k, v in kwargs.items():
@@ -94,23 +117,206 @@ class StarRocksCredentials(Credentials):
             "poll_interval",
             "poll_max_delay",
             "poll_factor",
+            "shared_task_poller",
             "auth_plugin",
+            "http_port",
+            "pool_size",
+            "pool_idle_timeout",
+            "version_cache_ttl",
+            "buffered",
+            "fetch_chunk_size",
+            "fetch_max_rows",
+            "column_cache",
+            "catalog_batch_size",
+            "query_profile",
+            "instrumentation",
         )
 
 
+@dataclass
+class StarRocksAdapterResponse(AdapterResponse):
+    rows_loaded: Optional[int] = None
+    rows_filtered: Optional[int] = None
+    # Set with `query_profile: true`, along with `query_id`
+    wall_time_ms: Optional[float] = None
+    cpu_time_ms: Optional[float] = None
+    peak_memory_bytes: Optional[int] = None
+    scan_rows: Optional[int] = None
+    scan_bytes: Optional[int] = None
+
+
+DEFAULT_VERSION = (999, 999, 999)
+VERSION_PATTERN = re.compile(r'(\d+)\.(\d+)(?:\.(\d+))?')
+VERSION_CACHE_FILE = "starrocks_server_version.json"
+DEFAULT_FETCH_CHUNK_SIZE = 10000
+
+
 def _parse_version(result):
-    default_version = (999, 999, 999)
-    first_part = None
+    """
+    Parse the output of `current_version()`, e.g. `3.5.14-a1b2c3d` or `3.1.0 1234567`.
+
+    :param result: The version string reported by the server.
+    :return: A (major, minor, patch) tuple, or `DEFAULT_VERSION` if unparsable.
+    """
+    match = VERSION_PATTERN.match(result.strip()) if result else None
+    if not match:
+        return DEFAULT_VERSION
+    major, minor, patch = match.groups()
+    return int(major), int(minor), int(patch or 0)
+
+
+class ServerVersionCache:
+    """
+    Process-wide cache of the server version detected for each cluster.
+
+    With a positive `version_cache_ttl` the detected versions are also written
+    to the target directory, and reused by later invocations for that many
+    seconds.
+    """
+
+    def __init__(self):
+        self._versions: Dict[Tuple, Tuple[int, int, int]] = {}
+        self._lock = threading.RLock()
+        self.path: Optional[str] = None
+
+    @staticmethod
+    def key(credentials) -> Tuple:
+        return credentials.host, credentials.port
+
+    @staticmethod
+    def _file_key(key: Tuple) -> str:
+        return "{}:{}".format(*key)
+
+    def get(self, key: Tuple) -> Optional[Tuple[int, int, int]]:
+        with self._lock:
+            return self._versions.get(key)
+
+    def set(self, key: Tuple, version: Tuple[int, int, int]) -> None:
+        with self._lock:
+            self._versions[key] = version
+            if self.path:
+                self._dump(key, version)
+
+    def get_or_detect(self, key: Tuple, detect: Callable[[], Tuple[int, int, int]]) -> Tuple[int, int, int]:
+        """
+        Return the cached version, calling `detect` only if there is none yet.
+        Concurrent callers wait for the detection instead of probing too.
+        """
+        with self._lock:
+            version = self._versions.get(key)
+            if version is None:
+                version = detect()
+                self.set(key, version)
+            return version
+
+    def load(self, path: str, ttl: int) -> None:
+        """
+        Configure the persisted cache file and load its fresh entries.
+
+        :param path: The cache file path.
+        :param ttl: How long a persisted version is reused, in seconds.
+        """
+        with self._lock:
+            self.path = path
+            try:
+                with open(path) as f:
+                    entries = json.load(f)
+            except (OSError, ValueError):
+                return
+            now = time.time()
+            for file_key, entry in entries.items():
+                host, _, port = file_key.rpartition(":")
+                try:
+                    if now - entry["detected_at"] > ttl:
+                        continue
+                    key = (host, None if port == "None" else int(port))
+                    self._versions.setdefault(key, tuple(entry["version"]))
+                except (KeyError, TypeError, ValueError):
+                    continue
+
+    def _dump(self, key: Tuple, version: Tuple[int, int, int]) -> None:
+        try:
+            with open(self.path) as f:
+                entries = json.load(f)
+        except (OSError, ValueError):
+            entries = {}
+        entries[self._file_key(key)] = {"version": list(version), "detected_at": time.time()}
+        try:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            with open(self.path, "w") as f:
+                json.dump(entries, f)
+        except OSError as e:
+            logger.debug("Could not persist StarRocks version to '{}': '{}'".format(self.path, e))
+
+
+class StarRocksConnectionPool:
+    """
+    Idle mysql-connector handles kept open to be reused by later dbt connections.
+
+    Handles are borrowed in LIFO order so the warmest one is reused first. A
+    handle idle for longer than `idle_timeout` seconds is closed instead of
+    being reused, and a handle is pinged before being handed out.
+    """
+
+    def __init__(self, size: int, idle_timeout: int):
+        self.size = size
+        self.idle_timeout = idle_timeout
+        self._idle: Deque[Tuple[Any, float]] = deque()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _discard(handle) -> None:
+        try:
+            handle.close()
+        except Exception as e:
+            logger.debug("Failed to close pooled StarRocks connection: '{}'".format(e))
+
+    def _evict_expired(self, now: float) -> None:
+        # The oldest handles are on the left
+        while self._idle and now - self._idle[0][1] > self.idle_timeout:
+            handle, _ = self._idle.popleft()
+            self._discard(handle)
+
+    def borrow(self):
+        """
+        Take a healthy idle handle out of the pool.
+
+        :return: The handle, or None if the pool has none to offer.
+        """
+        while True:
+            with self._lock:
+                self._evict_expired(time.monotonic())
+                if not self._idle:
+                    return None
+                handle, _ = self._idle.pop()
+
+            try:
+                if handle.is_connected():
+                    return handle
+            except Exception:
+                pass
+            self._discard(handle)
 
-    if '-' in result:
-        first_part = result.split('-')[0]
-    if ' ' in result:
-        first_part = result.split(' ')[0]
+    def give_back(self, handle) -> bool:
+        """
+        Return a handle to the pool.
 
-    if first_part and len(first_part.split('.')) == 3:
-        return int(first_part[0]), int(first_part[2]), int(first_part[4])
+        :param handle: The handle to keep open.
+        :return: False if the pool is full and the handle must be closed.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._evict_expired(now)
+            if len(self._idle) >= self.size:
+                return False
+            self._idle.append((handle, now))
+            return True
 
-    return default_version
+    def clear(self) -> None:
+        with self._lock:
+            while self._idle:
+                handle, _ = self._idle.pop()
+                self._discard(handle)
 
 
 class StarRocksConnectionManager(SQLConnectionManager):
@@ -154,17 +360,77 @@ class StarRocksConnectionManager(SQLConnectionManager):
         logger.warning("Unknown StarRocks data type code: %s", type_code)
         return str(type_code)
 
+    _pools: Dict[Tuple, StarRocksConnectionPool] = {}
+    # Set while the adapter runs its own metadata macros, whose results are never capped
+    _metadata_fetch = threading.local()
+    _pools_lock = threading.Lock()
+    _server_versions = ServerVersionCache()
+
+    def __init__(self, profile, mp_context):
+        super().__init__(profile, mp_context)
+        ttl = getattr(profile.credentials, "version_cache_ttl", 0)
+        if ttl and ttl > 0:
+            target_path = getattr(profile, "project_target_path", None) or profile.target_path
+            self._server_versions.load(os.path.join(target_path, VERSION_CACHE_FILE), ttl)
+
+        mode = getattr(profile.credentials, "instrumentation", None)
+        if mode is not None and mode not in INSTRUMENTATION_MODES:
+            raise dbt_common.exceptions.DbtRuntimeError(
+                f"Invalid `instrumentation` '{mode}', expected one of: {', '.join(INSTRUMENTATION_MODES)}")
+        if mode is not None:
+            target_path = getattr(profile, "project_target_path", None) or profile.target_path
+            INSTRUMENTATION.configure(mode, os.path.join(target_path, INSTRUMENTATION_FILE))
+
+    @classmethod
+    def _get_pool(cls, credentials) -> Optional[StarRocksConnectionPool]:
+        """
+        Return the pool shared by all connections opened with these credentials.
+
+        :param credentials: The connection credentials.
+        :return: The pool, or None when pooling is disabled (`pool_size: 0`).
+        """
+        if not credentials.pool_size:
+            return None
+
+        key = (credentials.host, credentials.port, credentials.username,
+               credentials.catalog, credentials.schema, credentials.auth_plugin)
+        with cls._pools_lock:
+            pool = cls._pools.get(key)
+            if pool is None:
+                pool = StarRocksConnectionPool(credentials.pool_size, credentials.pool_idle_timeout)
+                cls._pools[key] = pool
+            return pool
+
     @classmethod
     def open(cls, connection):
         if connection.state == 'open':
             logger.debug('Connection is already open, skipping open.')
             return connection
 
+        with span("connection.open"):
+            return cls._open(connection)
+
+    @classmethod
+    def _open(cls, connection):
         credentials = cls.get_credentials(connection.credentials)
+
+        pool = cls._get_pool(credentials)
+        if pool is not None:
+            handle = pool.borrow()
+            if handle is not None:
+                logger.debug("Reusing a pooled StarRocks connection.")
+                connection.handle = handle
+                connection.state = 'open'
+                return connection
+
         kwargs = {"host": credentials.host, "username": credentials.username,
                   "password": credentials.password, "database": credentials.catalog + "." + credentials.schema, "auth_plugin":credentials.auth_plugin}
 
-        kwargs["buffered"] = True
+        kwargs["buffered"] = credentials.buffered is not False
+        if not kwargs["buffered"]:
+            # Results that are not read to the end (e.g. `fetchone`, or a capped
+            # fetch) are discarded before the next statement.
+            kwargs["consume_results"] = True
 
         if credentials.port:
             kwargs["port"] = credentials.port
@@ -206,15 +472,10 @@ class StarRocksConnectionManager(SQLConnectionManager):
 
                 raise dbt_common.exceptions.ConnectionError(str(e))
 
+        cls._init_session(connection.handle, credentials)
+
         if credentials.version is None:
-            cursor = connection.handle.cursor()
-            try:
-                cursor.execute("select current_version()")
-                connection.handle.server_version = _parse_version(
-                    cursor.fetchone()[0])
-            except Exception as e:
-                logger.debug(
-                    "Got an error when obtain StarRocks version exception: '{}'".format(e))
+            cls._set_server_version(connection, credentials)
         else:
             version = credentials.version.strip().split('.')
             if len(version) == 3:
@@ -228,6 +489,68 @@ class StarRocksConnectionManager(SQLConnectionManager):
 
         return connection
 
+    @classmethod
+    def _set_server_version(cls, connection, credentials) -> None:
+        """
+        Set the server version on the handle. The server is only probed the
+        first time a cluster is connected to.
+        """
+        def _detect():
+            with span("connection.version_probe"):
+                cursor = connection.handle.cursor()
+                cursor.execute("select current_version()")
+                return _parse_version(cursor.fetchone()[0])
+
+        try:
+            connection.handle.server_version = cls._server_versions.get_or_detect(
+                cls._server_versions.key(credentials), _detect)
+        except Exception as e:
+            logger.debug(
+                "Got an error when obtain StarRocks version exception: '{}'".format(e))
+
+    @staticmethod
+    def _init_session(handle, credentials) -> None:
+        """Set the session variables of the adapter on a new or reset handle."""
+        if credentials.query_profile:
+            cursor = handle.cursor()
+            cursor.execute("set enable_profile = true")
+            cursor.close()
+
+    @classmethod
+    def _reset_session(cls, handle, credentials) -> bool:
+        """
+        Reset the session of a handle before it is pooled, so the session
+        variables, catalog and database set by a node (e.g. in a pre-hook or a
+        `sql_header`) do not leak into the next node borrowing it.
+
+        :return: False if the session could not be reset, and the handle must be closed.
+        """
+        try:
+            handle.reset_session()
+            handle.database = credentials.catalog + "." + credentials.schema
+            cls._init_session(handle, credentials)
+        except Exception as e:
+            logger.debug("Could not reset the session of a StarRocks connection: '{}'".format(e))
+            return False
+        return True
+
+    @classmethod
+    def _close_handle(cls, connection: Connection) -> None:
+        credentials = cls.get_credentials(connection.credentials)
+        pool = cls._get_pool(credentials)
+        if (pool is not None and connection.handle is not None
+                and cls._reset_session(connection.handle, credentials) and pool.give_back(connection.handle)):
+            logger.debug("Returned StarRocks connection '{}' to the pool.".format(connection.name))
+            return
+        super()._close_handle(connection)
+
+    def cleanup_all(self) -> None:
+        super().cleanup_all()
+        pool = self._get_pool(self.profile.credentials)
+        if pool is not None:
+            pool.clear()
+        INSTRUMENTATION.export()
+
     @classmethod
     def get_credentials(cls, credentials):
         return credentials
@@ -279,5 +602,133 @@ class StarRocksConnectionManager(SQLConnectionManager):
             code=code
         )
 
+    def execute(
+        self,
+        sql: str,
+        auto_begin: bool = False,
+        fetch: bool = False,
+        limit: Optional[int] = None,
+        profile: bool = False,
+    ) -> Tuple[AdapterResponse, "agate.Table"]:
+        """
+        Execute a statement, streaming the result set when `buffered: false`.
+
+        Unbuffered results are read from the server in `fetch_chunk_size` chunks
+        straight into the agate table, so only the table itself is held in memory.
+        The number of rows is capped by `limit`, or else by `fetch_max_rows`,
+        except for the metadata macros of the adapter (see `metadata_fetch`).
+
+        With `query_profile: true`, the query ID and the runtime statistics of
+        the statement are added to the response when `profile` is set, i.e. for
+        the `main` statements of models, not for the metadata queries.
+        """
+        credentials = self.profile.credentials
+        if not (profile and credentials.query_profile):
+            with span("execute"):
+                return self._execute(sql, auto_begin, fetch, limit)
+
+        start = time.monotonic()
+        with span("execute"):
+            response, table = self._execute(sql, auto_begin, fetch, limit)
+        return self._add_query_profile(response, (time.monotonic() - start) * 1000), table
+
+    def _add_query_profile(self, response: AdapterResponse, wall_time_ms: float) -> StarRocksAdapterResponse:
+        """
+        Add the query ID and the profile of the last statement to its response.
+
+        The profile is read on the same connection, without being logged. It may
+        not be available yet, in which case only the query ID is added.
+        """
+        stats: Dict[str, Any] = {"wall_time_ms": round(wall_time_ms, 3)}
+        try:
+            cursor = self.get_thread_connection().handle.cursor()
+            cursor.execute(QUERY_PROFILE_SQL)
+            row = cursor.fetchone()
+            cursor.close()
+        except mysql.connector.Error as e:
+            logger.debug("Could not read the query profile: '{}'".format(e))
+            row = None
+        if row:
+            stats["query_id"] = row[0]
+            stats.update(parse_query_profile(row[1]))
+
+        fields = {k: v for k, v in response.to_dict(omit_none=False).items() if k not in stats}
+        return StarRocksAdapterResponse.from_dict({**fields, **stats})
+
+    @contextmanager
+    def metadata_fetch(self):
+        """
+        Read whole result sets in this thread, ignoring `fetch_max_rows`: the
+        relations and columns read by the adapter must never be truncated.
+        """
+        depth = getattr(self._metadata_fetch, "depth", 0)
+        self._metadata_fetch.depth = depth + 1
+        try:
+            yield
+        finally:
+            self._metadata_fetch.depth = depth
+
+    def _execute(
+        self,
+        sql: str,
+        auto_begin: bool = False,
+        fetch: bool = False,
+        limit: Optional[int] = None,
+    ) -> Tuple[AdapterResponse, "agate.Table"]:
+        credentials = self.profile.credentials
+        if credentials.buffered is not False or not fetch:
+            return super().execute(sql=sql, auto_begin=auto_begin, fetch=fetch, limit=limit)
+
+        sql = self._add_query_comment(sql)
+        connection, cursor = self.add_query(sql, auto_begin)
+        max_rows = limit
+        if not limit and not getattr(self._metadata_fetch, "depth", 0):
+            max_rows = credentials.fetch_max_rows
+        table = self.get_result_from_cursor_in_chunks(
+            cursor, max_rows, credentials.fetch_chunk_size or DEFAULT_FETCH_CHUNK_SIZE)
+        response = self.get_response(cursor)
+
+        if max_rows and connection.handle.unread_result:
+            if not limit and cursor.fetchone() is not None:
+                logger.warning(
+                    "Result set truncated to {} rows (`fetch_max_rows`).".format(max_rows))
+            connection.handle.consume_results()
+        return response, table
+
+    @classmethod
+    def iter_cursor_rows(cls, cursor, max_rows: Optional[int], chunk_size: int) -> Iterator[Any]:
+        """
+        Yield the rows of an unbuffered cursor, fetching `chunk_size` rows at a time.
+
+        :param cursor: The cursor to read from.
+        :param max_rows: Stop after this many rows, when set.
+        :param chunk_size: The number of rows per `fetchmany` call.
+        """
+        fetched = 0
+        while not max_rows or fetched < max_rows:
+            size = chunk_size if not max_rows else min(chunk_size, max_rows - fetched)
+            rows = cursor.fetchmany(size)
+            if not rows:
+                return
+            fetched += len(rows)
+            yield from rows
+
+    @classmethod
+    def get_result_from_cursor(cls, cursor: Any, limit: Optional[int]) -> "agate.Table":
+        with span("execute.agate_conversion"):
+            return super().get_result_from_cursor(cursor, limit)
+
+    @classmethod
+    def get_result_from_cursor_in_chunks(cls, cursor, max_rows: Optional[int], chunk_size: int) -> "agate.Table":
+        from dbt_common.clients.agate_helper import table_from_data_flat
+
+        if cursor.description is None:
+            return table_from_data_flat([], [])
+
+        column_names = [col[0] for col in cursor.description]
+        rows = cls.iter_cursor_rows(cursor, max_rows, chunk_size)
+        with span("execute.agate_conversion"):
+            return table_from_data_flat(cls.process_results(column_names, rows), column_names)
+
     def add_begin_query(self):
         return self.add_query("", auto_begin=False)
@@ -13,29 +13,51 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 import re
+import threading
 import time
 import uuid
 from concurrent.futures import Future
-from typing import Callable, Dict, List, Optional, Set, FrozenSet, Tuple
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, FrozenSet, Tuple
 from typing_extensions import TypeAlias
 
 import agate
 import dbt.exceptions
 from dbt.adapters.base import available
 from dbt.adapters.base.impl import _expect_row_value, catch_as_completed
-from dbt.adapters.base.relation import InformationSchema
-from dbt.adapters.contracts.connection import AdapterResponse
+from dbt.adapters.capability import Capability, CapabilityDict, CapabilitySupport, Support
+from dbt.adapters.base.relation import BaseRelation, InformationSchema
+from dbt.adapters.contracts.connection import AdapterResponse, Connection
+from dbt.adapters.contracts.relation import RelationConfig
 from dbt.adapters.events.logging import AdapterLogger
+from dbt.adapters.events.types import CatalogGenerationError
 from dbt.adapters.protocol import AdapterConfig
 from dbt.adapters.sql import SQLAdapter
 from dbt.adapters.sql.impl import LIST_RELATIONS_MACRO_NAME, LIST_SCHEMAS_MACRO_NAME
-from dbt_common.clients.agate_helper import table_from_rows
-from dbt_common.utils import executor
+from dbt_common.clients.agate_helper import table_from_data_flat, table_from_rows
+from dbt_common.events.functions import warn_or_error
+from dbt_common.utils import AttrDict, executor
 from typing_extensions import override
 
 from dbt.adapters.starrocks.column import StarRocksColumn
-from dbt.adapters.starrocks.connections import StarRocksConnectionManager
-from dbt.adapters.starrocks.relation import StarRocksRelation
+from dbt.adapters.starrocks.connections import (
+    DEFAULT_FETCH_CHUNK_SIZE,
+    DEFAULT_VERSION,
+    StarRocksAdapterResponse,
+    StarRocksConnectionManager,
+)
+from dbt.adapters.starrocks.instrumentation import span
+from dbt.adapters.starrocks.materialized_views import MaterializedViewChanges, MaterializedViewConfig, get_changes
+from dbt.adapters.starrocks.partitions import (
+    MAX_PARTITION_VALUES,
+    PartitionOverwrite,
+    parse_partitions,
+    partitions_for_values,
+    sql_literal,
+)
+from dbt.adapters.starrocks.relation import COMPLEX_DATA_TYPES, StarRocksRelation
+from dbt.adapters.starrocks.stream_load import StreamLoadClient, batched, encode_rows
+from dbt.adapters.starrocks.task_poller import TASK_RUN_COLUMNS, TaskPoller, TaskRun
 
 
 logger = AdapterLogger("starrocks")
@@ -44,7 +66,56 @@ SQLQueryResult: TypeAlias = Tuple[AdapterResponse, "agate.Table"]
 
 
 SUBMIT_TASK_TEMPLATE = "submit /*+set_var(query_timeout={timeout})*/ task {task_id} as {sql}"
-POLL_TASK_TEMPLATE = "select * from information_schema.task_runs where task_name = '{task_id}'"
+POLL_TASK_TEMPLATE = (
+    "select state, error_message, progress from information_schema.task_runs "
+    "where task_name = '{task_id}' order by create_time desc limit 1"
+)
+# The latest run of each task only, as the refresh tasks of materialized views run many times.
+POLL_TASKS_TEMPLATE = (
+    "select task_name, state, error_message, progress from ("
+    "select task_name, state, error_message, progress, "
+    "row_number() over (partition by task_name order by create_time desc) as run_rank "
+    "from information_schema.task_runs where task_name in ({task_ids})"
+    ") as task_runs where run_rank = 1"
+)
+MATERIALIZED_VIEW_TASK_TEMPLATE = (
+    "select task_name from information_schema.materialized_views "
+    "where table_schema = '{schema}' and table_name = '{identifier}'"
+)
+LATEST_TASK_RUN_TEMPLATE = (
+    "select query_id from information_schema.task_runs "
+    "where task_name = '{task_id}' order by create_time desc limit 1"
+)
+TASK_POLLER_CONNECTION_NAME = "starrocks_task_poller"
+LIST_RELATIONS_IN_SCHEMAS_MACRO_NAME = "starrocks__list_relations_in_schemas"
+LIST_RELATIONS_IN_SCHEMAS_CONNECTION_NAME = "list_relations_in_schemas"
+GET_COLUMNS_IN_SCHEMA_MACRO_NAME = "starrocks__get_columns_in_schema"
+# Above this many relations, reading the columns of a whole schema costs more
+# than the lookups it saves, and the columns are cached per relation instead.
+COLUMN_CACHE_PREFETCH_MAX_RELATIONS = 100
+GET_CATALOG_SQL_MACRO_NAME = "starrocks__get_catalog_sql"
+CATALOG_CONNECTION_NAME = "catalog"
+CATALOG_TEXT_ONLY_COLUMNS = ("table_schema", "table_name")
+IDENTIFIER_PATTERN = re.compile(r"`?(\w+)`?")
+
+# Supported ETL patterns from StarRocks documentation
+# https://docs.starrocks.io/docs/sql-reference/sql-statements/loading_unloading/ETL/SUBMIT_TASK/
+#
+# The goal here is to soft-match the ETL patterns for dbt-generated sql queries.
+# It is not intended to be exhaustive nor to validate SQL statement, this will be left to the engine.
+# Only the leading tokens are matched, after any whitespace, comments and hints. Hints may also
+# follow the INSERT keyword, e.g. `INSERT /*+SET_VAR(...)*/ OVERWRITE`.
+LEADING_COMMENTS_PATTERN = re.compile(r"(?:\s+|/\*.*?\*/|--[^\n]*|#[^\n]*)*", re.DOTALL)
+SUBMITTABLE_ETL_PATTERN = re.compile(
+    r"(?:(create\s+table)|insert\b(?:\s*/\*.*?\*/)*\s*(?:into|overwrite)|cache\s+select)\b",
+    re.IGNORECASE | re.DOTALL)
+# A CREATE TABLE is only submittable with AS SELECT, which follows the table definition.
+CTAS_SELECT_PATTERN = re.compile(r"\bselect\b", re.IGNORECASE)
+SUBMITTABLE_ETL_CACHE_SIZE = 4096
+
+# Decisions of `_is_submittable_etl`, by statement hash.
+_submittable_etl_cache: Dict[int, bool] = {}
+
 
 class StarRocksConfig(AdapterConfig):
     engine: Optional[str] = None
@@ -56,6 +127,18 @@ class StarRocksConfig(AdapterConfig):
     buckets: Optional[int] = None
     properties: Optional[Dict[str, str]] = None
     microbatch_use_dynamic_overwrite: Optional[bool] = None
+    load_method: Optional[str] = None
+    stream_load_batch_size: Optional[int] = None
+    partial_update_columns: Optional[List[str]] = None
+    partial_update_mode: Optional[str] = None
+    partition_scoped_overwrite: Optional[bool] = None
+    view_change_detection: Optional[str] = None
+    refresh_mode: Optional[str] = None
+    refresh_partition_start: Optional[str] = None
+    refresh_partition_end: Optional[str] = None
+    refresh_force: Optional[bool] = None
+    snapshot_merge_method: Optional[str] = None
+    snapshot_hash_function: Optional[str] = None
 
 
 class StarRocksAdapter(SQLAdapter):
@@ -65,6 +148,24 @@ class StarRocksAdapter(SQLAdapter):
     Column = StarRocksColumn
     
     _running_tasks: Dict[str, str] = {}
+    # Tasks not canceled with DROP TASK, e.g. the refresh of a materialized view
+    _task_cancel_statements: Dict[str, str] = {}
+
+    # Every batch writes through its own temp relation, and only replaces its own partitions
+    # (with `microbatch_use_dynamic_overwrite` or the partition-scoped insert overwrite).
+    # A batch whose partitions cannot be determined fails, see `get_insert_overwrite_into_sql`.
+    _capabilities = CapabilityDict({
+        Capability.MicrobatchConcurrency: CapabilitySupport(support=Support.Full),
+    })
+
+    def __init__(self, config, mp_context):
+        super().__init__(config, mp_context)
+        self._task_poller = TaskPoller(self._fetch_task_runs, self._compute_task_poll_delay)
+        self._column_cache: Dict[Tuple[str, str], List[StarRocksColumn]] = {}
+        self._column_cache_schemas: Set[str] = set()
+        self._column_cache_lock = threading.RLock()
+        # Bumped on every invalidation, so a prefetch racing with DDL is dropped.
+        self._column_cache_generation = 0
 
     @staticmethod
     def _compute_poll_delay(attempt: int, poll_interval: int = 1, poll_factor: float = 2.0, poll_max_delay: int = 600) -> float:
@@ -91,25 +192,24 @@ class StarRocksAdapter(SQLAdapter):
 
         Reference: https://docs.starrocks.io/docs/sql-reference/sql-statements/loading_unloading/ETL/SUBMIT_TASK/
 
+        Only the leading tokens are inspected, after comments and optimizer hints,
+        so the cost does not grow with the size of the statement (apart from
+        hashing it); the decision is cached by statement hash. A `sql_header`
+        made of statements, e.g. `set ...;`, is not skipped: SUBMIT TASK runs a
+        single statement, so such statements are executed synchronously.
+
         :param sql: The SQL statement to evaluate.
         :return: True or False depending on whether the SQL statement is a submittable ETL.
         """
-        # Remove newlines and normalize whitespace
-        sql_clean = sql.strip().replace('\n', '')
-        sql_clean = re.sub(r'\s+', ' ', sql_clean).strip().lower()
-
-        # Note: # Supported ETL patterns from StarRocks documentation
-        # https://docs.starrocks.io/docs/sql-reference/sql-statements/loading_unloading/ETL/SUBMIT_TASK/
-        #
-        # The goal here is to soft-match the ETL patterns for dbt-generated sql queries.
-        # It is not intended to be exhaustive nor to validate SQL statement, this will be left to the engine.
-        suitable_etl_patterns = [
-            r'^create\s+table.*select',
-            r'^insert\s+(into|overwrite)\b',
-            r'^cache\s+select\b'
-        ]
-
-        return any(re.search(pattern, sql_clean) for pattern in suitable_etl_patterns)
+        with span("execute.is_submittable_etl"):
+            key = hash(sql)
+            submittable = _submittable_etl_cache.get(key)
+            if submittable is None:
+                submittable = _classify_submittable_etl(sql)
+                if len(_submittable_etl_cache) >= SUBMITTABLE_ETL_CACHE_SIZE:
+                    _submittable_etl_cache.clear()
+                _submittable_etl_cache[key] = submittable
+            return submittable
 
     def _cancel_task(self, task_id: str) -> None:
         """
@@ -118,7 +218,7 @@ class StarRocksAdapter(SQLAdapter):
         :param task_id: The task ID to cancel.
         """
         try:
-            _cancel_sql = f"DROP TASK `{task_id}`"
+            _cancel_sql = self._task_cancel_statements.get(task_id, f"DROP TASK `{task_id}`")
             super().execute(sql=_cancel_sql, fetch=False)
         except Exception as e:
             logger.warning(f"Failed to cancel task [{task_id}]: {e}")
@@ -134,7 +234,6 @@ class StarRocksAdapter(SQLAdapter):
         :param task_id: The task ID to poll for.
         :return: A tuple of the execution status and polling results.
         """
-        _poll_sql = POLL_TASK_TEMPLATE.format(task_id=task_id)
         _connection = self.connections.get_if_exists() or self.connections.begin()
         _attempts = 1
 
@@ -144,23 +243,17 @@ class StarRocksAdapter(SQLAdapter):
             self.connections.open(_connection)
 
             # Get the status from task_runs
-            response, task_run_status = super().execute(sql=_poll_sql, fetch=True, limit=1)
-            if response.code != 'SUCCESS':
-                logger.error(
-                    f"Error: Could not poll task [{task_id}]. "
-                    f"Reason: failed with response.code: [{response.code}]"
-                )
-                return response, task_run_status
+            task_run = self._fetch_task_run(task_id)
 
             # Check if we got any results
-            if not task_run_status or len(task_run_status) == 0:
+            if task_run is None:
                 logger.info(f"Task {task_id} not found. Aborting...")
-                return response, task_run_status
+                return self._task_run_result(task_run)
 
             # Validate status
-            status = task_run_status[0].get("STATE", "unknown")
+            status = task_run.get("STATE") or "unknown"
             if status == "FAILED":
-                _error_msg = task_run_status[0].get("ERROR_MESSAGE", "")
+                _error_msg = task_run.get("ERROR_MESSAGE", "")
                 raise dbt.exceptions.DbtRuntimeError(
                     f"Task [{task_id}] failed with status "
                     f"[{status}] and error message: {_error_msg}"
@@ -168,23 +261,132 @@ class StarRocksAdapter(SQLAdapter):
 
             elif status in ["SUCCESS", "MERGED", "unknown"]:
                 logger.info(f"Task [{task_id}] finished with status [{status}]")
-                return response, task_run_status
+                return self._task_run_result(task_run)
 
-            poll_delay = self._compute_poll_delay(
-                _attempts,
-                self.config.credentials.poll_interval,
-                self.config.credentials.poll_factor,
-                self.config.credentials.poll_max_delay,
-            )
+            poll_delay = self._compute_task_poll_delay(_attempts)
             _attempts += 1
 
             # Notify end user
-            progress = task_run_status[0].get("PROGRESS", "unknown")
+            progress = task_run.get("PROGRESS") or "unknown"
             logger.info(f"Task {task_id} progress [{progress}]. Waiting {poll_delay} seconds...")
 
             # Close connection before sleeping to avoid stale connections
             self.connections.close(_connection)
-            time.sleep(poll_delay)
+            with span("task.poll_sleep"):
+                time.sleep(poll_delay)
+
+    def _fetch_task_run(self, task_id: str) -> Optional[TaskRun]:
+        """
+        Fetch the state of the latest run of a task, on the current connection.
+
+        Only the columns needed by the pollers are selected, and the row is read
+        straight from the cursor, without building an agate table.
+
+        :param task_id: The task ID to poll for.
+        :return: The task run, or None if the task is not found.
+        """
+        _poll_sql = POLL_TASK_TEMPLATE.format(task_id=task_id)
+        with span("task.fetch_run"):
+            _, cursor = self.connections.add_select_query(_poll_sql)
+            row = cursor.fetchone()
+        return dict(zip(TASK_RUN_COLUMNS, row)) if row else None
+
+    @staticmethod
+    def _task_run_result(task_run: Optional[TaskRun]) -> SQLQueryResult:
+        rows = [task_run] if task_run else []
+        response = AdapterResponse(_message="SUCCESS {}".format(len(rows)), code="SUCCESS", rows_affected=len(rows))
+        return response, table_from_data_flat(rows, list(TASK_RUN_COLUMNS))
+
+    def _compute_task_poll_delay(self, attempt: int) -> float:
+        credentials = self.config.credentials
+        return self._compute_poll_delay(
+            attempt,
+            credentials.poll_interval,
+            credentials.poll_factor,
+            credentials.poll_max_delay,
+        )
+
+    def _fetch_task_runs(self, task_ids: List[str]) -> Dict[str, TaskRun]:
+        """
+        Fetch the task runs of several tasks with a single query.
+
+        Called from the shared task poller thread, with its own connection.
+
+        :param task_ids: The task IDs to poll for.
+        :return: The task run of each task that was found, by task ID.
+        """
+        _poll_sql = POLL_TASKS_TEMPLATE.format(
+            task_ids=", ".join(f"'{task_id}'" for task_id in task_ids))
+        self.acquire_connection(TASK_POLLER_CONNECTION_NAME)
+        try:
+            _, cursor = self.connections.add_select_query(_poll_sql)
+            rows = cursor.fetchall()
+        finally:
+            self.release_connection()
+        return {row[0]: dict(zip(TASK_RUN_COLUMNS, row[1:])) for row in rows}
+
+    def _wait_for_complete_task(self, task_id: str) -> SQLQueryResult:
+        """
+        Waits for the completion of a task tracked by the shared task poller.
+
+        The connection of the calling thread is closed while waiting, and
+        re-opened once the task is finished.
+
+        :param task_id: The task ID to wait for.
+        :return: A tuple of the execution status and the final task run.
+        """
+        _connection = self.connections.get_if_exists()
+        if _connection:
+            self.connections.close(_connection)
+
+        try:
+            with span("task.wait"):
+                task_run = self._task_poller.wait(task_id)
+        finally:
+            if _connection:
+                self.connections.open(_connection)
+
+        return self._task_run_result(task_run)
+
+    @contextmanager
+    def _track_running_task(self, task_id: str, cancel_sql: Optional[str] = None):
+        """
+        Register a task as running on the current connection, so it is canceled
+        by `cancel_open_connections` when dbt is interrupted.
+
+        :param task_id: The task ID.
+        :param cancel_sql: The statement canceling the task; DROP TASK by default.
+        """
+        _connection = self.connections.get_if_exists()
+        if _connection:
+            self._running_tasks[_connection.name] = task_id
+        if cancel_sql is not None:
+            self._task_cancel_statements[task_id] = cancel_sql
+
+        try:
+            yield
+        finally:
+            if _connection and _connection.name in self._running_tasks:
+                del self._running_tasks[_connection.name]
+            self._task_cancel_statements.pop(task_id, None)
+
+    def _wait_for_task(self, task_id: str) -> SQLQueryResult:
+        """Wait for a task, with the shared task poller if it is enabled."""
+        if self.config.credentials.shared_task_poller:
+            return self._wait_for_complete_task(task_id)
+        return self._poll_for_complete_task(task_id)
+
+    def _submit_task_sql(self, sql: str) -> Tuple[str, str]:
+        """Return a new task ID, and the statement submitting `sql` as that task."""
+        _task_id = str(uuid.uuid4()).replace('-', '')
+        _timeout = self.config.credentials.async_query_timeout
+
+        _submit_sql = SUBMIT_TASK_TEMPLATE.format(
+            timeout=_timeout,
+            task_id=_task_id,
+            sql=sql,
+        )
+        return _task_id, _submit_sql
 
     def _execute_async_task(self, sql: str, auto_begin: bool = False, fetch: bool = False, limit: Optional[int] = None) -> SQLQueryResult:
         """
@@ -198,30 +400,42 @@ class StarRocksAdapter(SQLAdapter):
         :return: A tuple of the query status and results (empty if fetch=False).
         :rtype: Tuple[AdapterResponse, "agate.Table"]
         """
-        _task_id = str(uuid.uuid4()).replace('-', '')
-        _timeout = self.config.credentials.async_query_timeout
+        _task_id, _submit_sql = self._submit_task_sql(sql)
+
+        with self._track_running_task(_task_id):
+            with span("task.submit"):
+                super().execute(
+                    sql=_submit_sql,
+                    auto_begin=auto_begin,
+                    fetch=fetch,
+                    limit=limit
+                )
+            return self._wait_for_task(_task_id)
 
-        _submit_sql = SUBMIT_TASK_TEMPLATE.format(
-            timeout=_timeout,
-            task_id=_task_id,
-            sql=sql,
-        )
+    @available.parse(lambda *a, **k: (None, None))
+    def add_query(
+        self,
+        sql: str,
+        auto_begin: bool = True,
+        bindings: Optional[Any] = None,
+        abridge_sql_log: bool = False,
+    ) -> Tuple[Connection, Any]:
+        """
+        Add a query to the current transaction, e.g. the inserts of seeds.
 
-        _connection = self.connections.get_if_exists()
-        if _connection:
-            self._running_tasks[_connection.name] = _task_id
+        Like `execute`, a submittable ETL is submitted as a task and waited for
+        when the adapter is configured to be async. The bindings are applied to
+        the submitted statement, and the cursor of the submission is returned.
+        """
+        if not self.config.credentials.is_async or not self._is_submittable_etl(sql):
+            return super().add_query(sql, auto_begin, bindings, abridge_sql_log)
 
-        try:
-            super().execute(
-                sql=_submit_sql,
-                auto_begin=auto_begin,
-                fetch=fetch,
-                limit=limit
-            )
-            return self._poll_for_complete_task(_task_id)
-        finally:
-            if _connection and _connection.name in self._running_tasks:
-                del self._running_tasks[_connection.name]
+        _task_id, _submit_sql = self._submit_task_sql(sql)
+        with self._track_running_task(_task_id):
+            with span("task.submit"):
+                connection, cursor = self.connections.add_query(_submit_sql, auto_begin, bindings, abridge_sql_log)
+            self._wait_for_task(_task_id)
+        return connection, cursor
 
     @override
     def execute(
@@ -230,6 +444,7 @@ class StarRocksAdapter(SQLAdapter):
         auto_begin: bool = False,
         fetch: bool = False,
         limit: Optional[int] = None,
+        profile: bool = False,
     ) -> SQLQueryResult:
         """
         Execute a SQL statement against the database.
@@ -245,19 +460,32 @@ class StarRocksAdapter(SQLAdapter):
             transaction, automatically begin one.
         :param bool fetch: If set, fetch results.
         :param Optional[int] limit: If set, only fetch n number of rows
+        :param bool profile: If set, and `query_profile` is enabled, add the
+            query profile to the response; only set for `main` statements. A
+            submitted task is never profiled, as it runs in a session of its own.
         :return: A tuple of the query status and results (empty if fetch=False).
         :rtype: Tuple[AdapterResponse, "agate.Table"]
         """
         if not self.config.credentials.is_async or not self._is_submittable_etl(sql):
-            return super().execute(sql=sql, auto_begin=auto_begin, fetch=fetch, limit=limit)
+            return self.connections.execute(sql=sql, auto_begin=auto_begin, fetch=fetch, limit=limit, profile=profile)
         return self._execute_async_task(sql=sql, auto_begin=auto_begin, fetch=fetch, limit=limit)
 
+    @override
+    def execute_macro(self, macro_name: str, *args, **kwargs) -> AttrDict:
+        """
+        Run a macro called by the adapter itself, e.g. to list relations or
+        columns. Its results are read in full, whatever `fetch_max_rows` is.
+        """
+        with span(f"macro.{macro_name}"), self.connections.metadata_fetch():
+            return super().execute_macro(macro_name, *args, **kwargs)
+
     def cancel_open_connections(self):
         """Cancel all running tasks when dbt is interrupted."""
         logger.warning(f"Canceling {len(self._running_tasks)} running StarRocks tasks...")
         for conn_name, task_id in list(self._running_tasks.items()):
             logger.warning(f"Canceling task [{task_id}] on connection [{conn_name}]")
             self._cancel_task(task_id)
+            self._task_poller.cancel(task_id)
         return super().cancel_open_connections()
 
     @classmethod
@@ -303,7 +531,9 @@ class StarRocksAdapter(SQLAdapter):
     ) -> List[StarRocksRelation]:
         kwargs = {"schema_relation": schema_relation}
         results = self.execute_macro(LIST_RELATIONS_MACRO_NAME, kwargs=kwargs)
+        return self._relations_from_rows(results)
 
+    def _relations_from_rows(self, results: agate.Table) -> List[StarRocksRelation]:
         relations = []
         for row in results:
             if len(row) != 4:
@@ -322,6 +552,139 @@ class StarRocksAdapter(SQLAdapter):
 
         return relations
 
+    @override
+    def _relations_cache_for_schemas(
+        self,
+        relation_configs: Iterable[RelationConfig],
+        cache_schemas: Optional[Set[BaseRelation]] = None,
+    ) -> None:
+        """
+        Populate the relations cache of all the given schemas with a single
+        `table_schema in (...)` query, instead of one query per schema.
+        """
+        if not cache_schemas:
+            cache_schemas = self._get_cache_schemas(relation_configs)
+
+        schemas = sorted({relation.schema for relation in cache_schemas if relation.schema})
+        if schemas:
+            with self.connection_named(LIST_RELATIONS_IN_SCHEMAS_CONNECTION_NAME):
+                results = self.execute_macro(
+                    LIST_RELATIONS_IN_SCHEMAS_MACRO_NAME, kwargs={"schemas": schemas})
+            for relation in self._relations_from_rows(results):
+                self.cache.add(relation)
+
+        # Schemas without any relation are cached too, so they are not listed again.
+        self.cache.update_schemas(
+            {(relation.database, relation.schema) for relation in cache_schemas if relation.schema})
+
+    @available.parse_list
+    def get_columns_in_relation(self, relation: StarRocksRelation) -> List[StarRocksColumn]:
+        """
+        Return the columns of a relation.
+
+        With `column_cache: true`, the columns of relations are kept until the
+        adapter runs DDL on them. The first lookup in a cached schema of at most
+        `COLUMN_CACHE_PREFETCH_MAX_RELATIONS` relations reads the columns of all
+        its tables with one query.
+        """
+        if not self.config.credentials.column_cache or not relation.schema or not relation.identifier:
+            return super().get_columns_in_relation(relation)
+
+        key = (relation.schema, relation.identifier)
+        with self._column_cache_lock:
+            columns = self._column_cache.get(key)
+            prefetch = columns is None and relation.schema not in self._column_cache_schemas
+            if prefetch:
+                self._column_cache_schemas.add(relation.schema)
+
+        if prefetch and self._should_prefetch_columns(relation):
+            self._prefetch_columns_in_schema(relation.schema)
+            with self._column_cache_lock:
+                columns = self._column_cache.get(key)
+
+        if columns is None:
+            columns = super().get_columns_in_relation(relation)
+            if columns:
+                with self._column_cache_lock:
+                    self._column_cache[key] = columns
+        return list(columns)
+
+    def _should_prefetch_columns(self, relation: StarRocksRelation) -> bool:
+        """Whether the relations cache knows the schema, and it is small enough."""
+        if (relation.database, relation.schema) not in self.cache:
+            return False
+        return len(self.cache.get_relations(relation.database, relation.schema)) <= COLUMN_CACHE_PREFETCH_MAX_RELATIONS
+
+    def _prefetch_columns_in_schema(self, schema: str) -> None:
+        """
+        Cache the columns of all the tables of a schema.
+
+        The query runs without holding the cache lock. Tables with complex types
+        are skipped, so they are looked up with `desc` on their first use.
+        """
+        generation = self._column_cache_generation
+        try:
+            results = self.execute_macro(GET_COLUMNS_IN_SCHEMA_MACRO_NAME, kwargs={"schema": schema})
+        except Exception:
+            with self._column_cache_lock:
+                self._column_cache_schemas.discard(schema)
+            raise
+
+        columns: Dict[Tuple[str, str], List[StarRocksColumn]] = {}
+        skipped: Set[Tuple[str, str]] = set()
+        for table_name, *row in results:
+            key = (schema, table_name)
+            if row[1] in COMPLEX_DATA_TYPES:
+                skipped.add(key)
+            columns.setdefault(key, []).append(self.Column(*row))
+
+        for key in skipped:
+            del columns[key]
+        with self._column_cache_lock:
+            if generation != self._column_cache_generation:
+                # DDL ran meanwhile: the result may be stale, look it up again later.
+                self._column_cache_schemas.discard(schema)
+                return
+            for key, relation_columns in columns.items():
+                self._column_cache.setdefault(key, relation_columns)
+
+    @available
+    def invalidate_column_cache(self, relation: Optional[StarRocksRelation]) -> str:
+        """Forget the cached columns of a relation, after running DDL on it."""
+        if relation is not None and relation.schema and relation.identifier:
+            with self._column_cache_lock:
+                self._column_cache_generation += 1
+                self._column_cache.pop((relation.schema, relation.identifier), None)
+        return ""
+
+    @available
+    def cache_added(self, relation: Optional[BaseRelation]) -> str:
+        self.invalidate_column_cache(relation)
+        return super().cache_added(relation)
+
+    @available
+    def cache_dropped(self, relation: Optional[BaseRelation]) -> str:
+        self.invalidate_column_cache(relation)
+        return super().cache_dropped(relation)
+
+    @available
+    def cache_renamed(
+        self,
+        from_relation: Optional[BaseRelation],
+        to_relation: Optional[BaseRelation],
+    ) -> str:
+        self.invalidate_column_cache(from_relation)
+        self.invalidate_column_cache(to_relation)
+        return super().cache_renamed(from_relation, to_relation)
+
+    def drop_schema(self, relation: BaseRelation) -> None:
+        super().drop_schema(relation)
+        with self._column_cache_lock:
+            self._column_cache_generation += 1
+            self._column_cache_schemas.discard(relation.schema)
+            for key in [key for key in self._column_cache if key[0] == relation.schema]:
+                del self._column_cache[key]
+
     def get_catalog(self, manifest, used_schemas):
         schema_map = self._get_catalog_schemas(manifest)
         if len(schema_map) > 1:
@@ -330,6 +693,10 @@ class StarRocksAdapter(SQLAdapter):
                 f"{list(schema_map)}"
             )
 
+        batch_size = self.config.credentials.catalog_batch_size
+        if batch_size and batch_size > 0:
+            return self._get_catalog_in_batches(schema_map, used_schemas, batch_size)
+
         with executor(self.config) as tpe:
             futures: List[Future[agate.Table]] = []
             for info, schemas in schema_map.items():
@@ -351,6 +718,92 @@ class StarRocksAdapter(SQLAdapter):
             catalogs, exceptions = catch_as_completed(futures)
         return catalogs, exceptions
 
+    def _get_catalog_in_batches(
+        self,
+        schema_map,
+        used_schemas: FrozenSet[Tuple[str, str]],
+        batch_size: int,
+    ) -> Tuple[agate.Table, List[Exception]]:
+        """
+        Build the catalog of all the schemas with one query per `batch_size` schemas.
+
+        The rows of every batch are read from the cursor into a single list, and
+        the catalog table is built once from it. No client-side filtering is
+        needed, since the queries only return the requested schemas.
+        """
+        used_schema_names = {s.lower(): s for _, s in used_schemas}
+        rows: List[Tuple] = []
+        column_names: List[str] = []
+        exceptions: List[Exception] = []
+
+        with self.connection_named(CATALOG_CONNECTION_NAME):
+            for information_schema, schemas in schema_map.items():
+                schema_names = sorted(used_schema_names.get(s.lower(), s) for s in schemas)
+                for batch in batched(schema_names, batch_size):
+                    kwargs = {"information_schema": information_schema, "schemas": batch}
+                    try:
+                        sql = self.execute_macro(GET_CATALOG_SQL_MACRO_NAME, kwargs=kwargs)
+                        _, cursor = self.connections.add_select_query(sql)
+                        column_names = [col[0] for col in cursor.description]
+                        rows.extend(self.connections.iter_cursor_rows(cursor, None, DEFAULT_FETCH_CHUNK_SIZE))
+                    except dbt.exceptions.DbtRuntimeError as e:
+                        warn_or_error(CatalogGenerationError(exc=str(e)))
+                        exceptions.append(e)
+
+        return table_from_rows(rows, column_names, text_only_columns=CATALOG_TEXT_ONLY_COLUMNS), exceptions
+
+    @available
+    def stream_load_csv_rows(
+        self,
+        relation: StarRocksRelation,
+        agate_table: agate.Table,
+        batch_size: int = 100000,
+    ) -> StarRocksAdapterResponse:
+        """
+        Load the rows of a seed through the Stream Load HTTP API.
+
+        Rows are sent in batches of `batch_size`, each batch being its own load
+        job. The FE host and `http_port` from the profile are used as entrypoint.
+        See: https://docs.starrocks.io/docs/loading/StreamLoad/
+
+        :param relation: The seed relation, which must already exist.
+        :param agate_table: The seed rows.
+        :param batch_size: The maximum number of rows per load job.
+        :return: The response with the loaded and filtered row counts.
+        """
+        credentials = self.config.credentials
+        client = StreamLoadClient(
+            host=credentials.host,
+            port=credentials.http_port,
+            username=credentials.username,
+            password=credentials.password,
+        )
+        column_names = list(agate_table.column_names)
+        rows_loaded = rows_filtered = 0
+
+        for index, rows in enumerate(batched(agate_table.rows, batch_size)):
+            label = "dbt_seed_{}_{}_{}".format(relation.identifier, uuid.uuid4().hex, index)
+            result = client.load(relation.schema, relation.identifier, column_names, encode_rows(rows), label)
+            if not result.succeeded:
+                raise dbt.exceptions.DbtRuntimeError(
+                    f"Stream Load [{result.label}] into {relation} failed with status "
+                    f"[{result.status}]: {result.message} {result.error_url or ''}".strip()
+                )
+            logger.debug(
+                f"Stream Load [{result.label}] loaded {result.rows_loaded} rows, "
+                f"filtered {result.rows_filtered} rows in {result.load_time_ms} ms"
+            )
+            rows_loaded += result.rows_loaded
+            rows_filtered += result.rows_filtered
+
+        return StarRocksAdapterResponse(
+            _message="STREAM LOAD {}".format(rows_loaded),
+            code="STREAM LOAD",
+            rows_affected=rows_loaded,
+            rows_loaded=rows_loaded,
+            rows_filtered=rows_filtered,
+        )
+
     @classmethod
     def _catalog_filter_table(
         cls, table: "agate.Table", used_schemas: FrozenSet[Tuple[str, str]]
@@ -362,6 +815,175 @@ class StarRocksAdapter(SQLAdapter):
         )
         return table.where(_catalog_filter_schemas(used_schemas))
 
+    @available
+    def get_overwrite_partitions(
+        self,
+        target_relation: StarRocksRelation,
+        temp_relation: StarRocksRelation,
+        partition_by: Optional[List[str]],
+    ) -> PartitionOverwrite:
+        """
+        Find the partitions of the target that hold the rows of the temp relation.
+
+        The distinct partition column values of the temp relation are matched
+        against the ranges and lists of `SHOW PARTITIONS`. Only tables
+        partitioned by a single column are supported.
+
+        :param target_relation: The relation to overwrite.
+        :param temp_relation: The relation holding the new rows.
+        :param partition_by: The `partition_by` config of the model.
+        :return: The partitions to overwrite, [] when no existing partition is
+            affected, with the filters splitting the rows when they also belong
+            to new partitions; or why the partitions could not be determined.
+        """
+        if isinstance(partition_by, str):
+            partition_by = [partition_by]
+        match = IDENTIFIER_PATTERN.fullmatch(partition_by[0].strip()) if partition_by and len(partition_by) == 1 else None
+        if match is None:
+            return PartitionOverwrite(unresolved=f"partition_by {partition_by} is not a single column")
+        column = self.quote(match.group(1))
+
+        # read from the cursor, so the values keep their database types
+        _, cursor = self.connections.add_select_query(
+            f"select distinct {column} from {temp_relation} limit {MAX_PARTITION_VALUES + 1}")
+        values = [row[0] for row in cursor.fetchall()]
+        if len(values) > MAX_PARTITION_VALUES:
+            return PartitionOverwrite(unresolved=f"the rows hold more than {MAX_PARTITION_VALUES} partition values")
+        if len(values) == 0:
+            return PartitionOverwrite()
+
+        _, show_partitions = self.execute(f"show partitions from {target_relation}", fetch=True)
+        key_type = next(
+            (c.dtype for c in self.get_columns_in_relation(target_relation) if c.name.lower() == match.group(1).lower()),
+            "VARCHAR",
+        )
+        partitions = parse_partitions(
+            (dict(zip(show_partitions.column_names, row)) for row in show_partitions), key_type)
+        if partitions is None:
+            return PartitionOverwrite(unresolved="the partitions of the table could not be parsed")
+        matched = partitions_for_values(partitions, values)
+        if matched is None:
+            return PartitionOverwrite(unresolved="a partition value is NULL or cannot be compared with the partitions")
+
+        if not matched.names or not matched.new_values:
+            return PartitionOverwrite(partitions=matched.names)
+        logger.debug(f"Overwriting partitions {matched.names} of {target_relation}, "
+                     f"and inserting the rows of {len(matched.new_values)} new partition values")
+        return PartitionOverwrite(
+            partitions=matched.names,
+            existing_filter=f"{column} in ({', '.join(sql_literal(v) for v in matched.existing_values)})",
+            new_filter=f"{column} in ({', '.join(sql_literal(v) for v in matched.new_values)})",
+        )
+
+    @available
+    def get_materialized_view_changes(
+        self,
+        relation: StarRocksRelation,
+        comment: str,
+        refresh: Optional[str],
+        properties: Optional[Dict[str, str]],
+    ) -> Optional[MaterializedViewChanges]:
+        """
+        Compare an existing materialized view with its configuration, using
+        `SHOW CREATE MATERIALIZED VIEW`.
+
+        :param relation: The existing materialized view.
+        :param comment: The comment holding the fingerprint of the query and layout.
+        :param refresh: The configured `refresh_method`.
+        :param properties: The configured `properties`.
+        :return: The changes, or None if there are none.
+        """
+        _, result = self.execute(f"show create materialized view {relation}", fetch=True)
+        if len(result) == 0:
+            return MaterializedViewChanges(rebuild=True)
+        existing = MaterializedViewConfig.from_ddl(result[0][1])
+        if not existing.has_fingerprint:
+            # Whether its query or layout changed is unknown: it is rebuilt once to store its fingerprint.
+            logger.debug(f"Rebuilding {relation}: it has no fingerprint")
+            return MaterializedViewChanges(rebuild=True)
+        changes = get_changes(existing, comment, refresh, properties)
+        if changes is not None and changes.rebuild:
+            logger.debug(f"Rebuilding {relation}: its query or layout changed")
+        return changes
+
+    def _fetch_materialized_view_task(self, relation: StarRocksRelation) -> Optional[str]:
+        """Return the name of the refresh task of a materialized view, or None."""
+        _, cursor = self.connections.add_select_query(
+            MATERIALIZED_VIEW_TASK_TEMPLATE.format(schema=relation.schema, identifier=relation.identifier))
+        rows = cursor.fetchall()
+        return rows[0][0] if rows and rows[0][0] else None
+
+    def _fetch_latest_task_run_id(self, task_id: str) -> Optional[str]:
+        """Return the query ID of the latest run of a task, or None if it never ran."""
+        _, cursor = self.connections.add_select_query(LATEST_TASK_RUN_TEMPLATE.format(task_id=task_id))
+        row = cursor.fetchone()
+        return row[0] if row else None
+
+    @available
+    def get_materialized_view_refresh_marker(self, relation: StarRocksRelation) -> Optional[str]:
+        """
+        Return the query ID of the latest refresh of a materialized view, taken
+        before refreshing it, so `wait_for_materialized_view_refresh` does not
+        mistake this already finished run for the new one.
+
+        :param relation: The materialized view.
+        """
+        task_id = self._fetch_materialized_view_task(relation)
+        return self._fetch_latest_task_run_id(task_id) if task_id else None
+
+    def _wait_for_new_task_run(self, task_id: str, after: Optional[str]) -> None:
+        """
+        Wait until the latest run of a task is another run than `after`, or
+        until its first run exists if `after` is None, for at most
+        `async_query_timeout` seconds.
+        """
+        _connection = self.connections.get_if_exists() or self.connections.begin()
+        _deadline = time.monotonic() + self.config.credentials.async_query_timeout
+        _attempts = 1
+
+        while True:
+            self.connections.open(_connection)
+            run_id = self._fetch_latest_task_run_id(task_id)
+            if run_id is not None and run_id != after:
+                return
+
+            if time.monotonic() >= _deadline:
+                raise dbt.exceptions.DbtRuntimeError(
+                    f"No run of task [{task_id}] was started" if after is None
+                    else f"No new run of task [{task_id}] was started after run [{after}]")
+
+            poll_delay = self._compute_task_poll_delay(_attempts)
+            _attempts += 1
+            logger.info(f"Task {task_id} has no new run yet. Waiting {poll_delay} seconds...")
+
+            self.connections.close(_connection)
+            with span("task.poll_sleep"):
+                time.sleep(poll_delay)
+
+    @available
+    def wait_for_materialized_view_refresh(self, relation: StarRocksRelation, after: Optional[str] = None) -> str:
+        """
+        Wait for the latest refresh of a materialized view.
+
+        The refresh task of the materialized view is polled like the submitted
+        tasks, with the shared task poller if it is enabled.
+
+        :param relation: The materialized view.
+        :param after: The refresh marker taken before refreshing the materialized
+            view; the wait starts once a newer run than it exists. None for a
+            created or rebuilt materialized view: the wait starts once its
+            first run exists.
+        """
+        task_id = self._fetch_materialized_view_task(relation)
+        if task_id is None:
+            logger.info(f"No refresh task found for {relation}")
+            return ""
+
+        with self._track_running_task(task_id, f"CANCEL REFRESH MATERIALIZED VIEW {relation}"):
+            self._wait_for_new_task_run(task_id, after)
+            self._wait_for_task(task_id)
+        return ""
+
     @available
     def is_before_version(self, version: str) -> bool:
         conn = self.connections.get_if_exists()
@@ -379,7 +1001,7 @@ class StarRocksAdapter(SQLAdapter):
         conn = self.connections.get_if_exists()
         if conn:
             server_version = conn.handle.server_version
-            if server_version != (999, 999, 999):
+            if server_version != DEFAULT_VERSION:
                 return "{}.{}.{}".format(server_version[0], server_version[1], server_version[2])
         return 'UNKNOWN'
 
@@ -399,7 +1021,7 @@ class StarRocksAdapter(SQLAdapter):
 
     @override
     def valid_incremental_strategies(self):
-        return ["default", "insert_overwrite", "dynamic_overwrite", "microbatch"]
+        return ["default", "insert_overwrite", "dynamic_overwrite", "microbatch", "upsert", "merge", "partial_update"]
 
 
 def _catalog_filter_schemas(used_schemas: FrozenSet[Tuple[str, str]]) -> Callable[[agate.Row], bool]:
@@ -413,3 +1035,11 @@ def _catalog_filter_schemas(used_schemas: FrozenSet[Tuple[str, str]]) -> Callabl
         return (table_database, table_schema.lower()) in schemas
 
     return test
+
+
+def _classify_submittable_etl(sql: str) -> bool:
+    start = LEADING_COMMENTS_PATTERN.match(sql).end()
+    match = SUBMITTABLE_ETL_PATTERN.match(sql, start)
+    if match is None:
+        return False
+    return match.group(1) is None or CTAS_SELECT_PATTERN.search(sql, match.end()) is not None
@@ -0,0 +1,159 @@
+#! /usr/bin/python3
+# Copyright 2021-present StarRocks, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https:#www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import bisect
+import json
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+from typing import Any, ContextManager, Dict, List, Optional
+
+from dbt.adapters.events.logging import AdapterLogger
+
+logger = AdapterLogger("starrocks")
+
+INSTRUMENTATION_FILE = "starrocks_instrumentation.json"
+INSTRUMENTATION_MODES = ("json", "otel")
+
+# Upper bounds of the histogram buckets, in milliseconds; the last bucket is unbounded.
+BUCKET_BOUNDS_MS = (0.1, 0.5, 1, 5, 10, 50, 100, 500, 1000, 5000, 10000, 60000)
+
+# Returned by `span` when disabled: entering it does nothing.
+_NOOP_SPAN = nullcontext()
+
+
+class Histogram:
+    """Durations of one phase: count, total, min, max and a bucket histogram."""
+
+    def __init__(self):
+        self.count = 0
+        self.total_ms = 0.0
+        self.min_ms: Optional[float] = None
+        self.max_ms = 0.0
+        self.buckets: List[int] = [0] * (len(BUCKET_BOUNDS_MS) + 1)
+
+    def record(self, duration_ms: float) -> None:
+        self.count += 1
+        self.total_ms += duration_ms
+        self.min_ms = duration_ms if self.min_ms is None else min(self.min_ms, duration_ms)
+        self.max_ms = max(self.max_ms, duration_ms)
+        self.buckets[bisect.bisect_left(BUCKET_BOUNDS_MS, duration_ms)] += 1
+
+    def to_dict(self) -> Dict[str, Any]:
+        bounds = [f"le_{bound}" for bound in BUCKET_BOUNDS_MS] + ["inf"]
+        return {
+            "count": self.count,
+            "total_ms": round(self.total_ms, 3),
+            "mean_ms": round(self.total_ms / self.count, 3) if self.count else None,
+            "min_ms": round(self.min_ms, 3) if self.min_ms is not None else None,
+            "max_ms": round(self.max_ms, 3),
+            "buckets": dict(zip(bounds, self.buckets)),
+        }
+
+
+class Instrumentation:
+    """
+    Times the hot paths of the adapter, by phase.
+
+    Disabled by default: `span` then returns a shared no-op context manager,
+    so the instrumented code only pays for one attribute check. Once enabled
+    with `configure`, the duration of every span is added to the histogram of
+    its phase, and the histograms are written to a JSON file by `export`.
+    In `otel` mode, each span is also started on the OpenTelemetry tracer of
+    the process, if the `opentelemetry-api` package is installed.
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self.path: Optional[str] = None
+        self._tracer = None
+        self._histograms: Dict[str, Histogram] = {}
+        self._lock = threading.Lock()
+
+    def configure(self, mode: Optional[str], path: Optional[str]) -> None:
+        """
+        Enable or disable the instrumentation.
+
+        :param mode: `json`, `otel`, or None to disable it.
+        :param path: The JSON file the histograms are written to.
+        """
+        self.enabled = mode in INSTRUMENTATION_MODES
+        self.path = path
+        self._tracer = None
+        if mode == "otel":
+            try:
+                from opentelemetry import trace
+            except ImportError:
+                logger.warning("`instrumentation: otel` requires the opentelemetry-api package, "
+                               "only the JSON file is written.")
+            else:
+                self._tracer = trace.get_tracer("dbt-starrocks")
+
+    def span(self, name: str) -> ContextManager:
+        """
+        Time a phase.
+
+        :param name: The name of the phase, e.g. `connection.open`.
+        """
+        if not self.enabled:
+            return _NOOP_SPAN
+        return self._span(name)
+
+    @contextmanager
+    def _span(self, name: str):
+        otel_span = self._tracer.start_as_current_span(name) if self._tracer is not None else _NOOP_SPAN
+        start = time.perf_counter()
+        try:
+            with otel_span:
+                yield
+        finally:
+            self.record(name, (time.perf_counter() - start) * 1000)
+
+    def record(self, name: str, duration_ms: float) -> None:
+        with self._lock:
+            histogram = self._histograms.get(name)
+            if histogram is None:
+                histogram = self._histograms[name] = Histogram()
+            histogram.record(duration_ms)
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """Return the histograms of all the phases, by name."""
+        with self._lock:
+            return {name: histogram.to_dict() for name, histogram in sorted(self._histograms.items())}
+
+    def export(self) -> None:
+        """Write the histograms to the JSON file, if enabled and anything was recorded."""
+        if not self.enabled or not self.path:
+            return
+        phases = self.snapshot()
+        if not phases:
+            return
+        try:
+            with open(self.path, "w") as f:
+                json.dump({"bucket_bounds_ms": list(BUCKET_BOUNDS_MS), "phases": phases}, f, indent=2)
+        except OSError as e:
+            logger.debug("Could not write the instrumentation file '{}': {}".format(self.path, e))
+
+    def reset(self) -> None:
+        with self._lock:
+            self._histograms.clear()
+
+
+INSTRUMENTATION = Instrumentation()
+
+
+def span(name: str) -> ContextManager:
+    """Time a phase with the process-wide instrumentation, see `Instrumentation.span`."""
+    return INSTRUMENTATION.span(name)
@@ -0,0 +1,134 @@
+#! /usr/bin/python3
+# Copyright 2021-present StarRocks, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https:#www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import re
+from dataclasses import dataclass, field
+from typing import Any, Dict, Optional
+
+# The query of the materialized view starts at the first `AS SELECT`, `AS WITH` or `AS (`.
+QUERY_START_PATTERN = re.compile(r"\bAS\s+(?:SELECT|WITH|\()", re.IGNORECASE)
+CREATE_PATTERN = re.compile(r"\s*CREATE\s+MATERIALIZED\s+VIEW\s+(?:`[^`]*`|\w+)(?:\.(?:`[^`]*`|\w+))*\s*", re.IGNORECASE)
+COMMENT_PATTERN = re.compile(r"\bCOMMENT\s+([\"'])((?:\\.|(?!\1).)*)\1", re.IGNORECASE)
+REFRESH_PATTERN = re.compile(r"\bREFRESH\s+(.*?)\s*(?:\bPROPERTIES\b|$)", re.IGNORECASE | re.DOTALL)
+PROPERTIES_PATTERN = re.compile(r"\bPROPERTIES\s*\((.*)\)", re.IGNORECASE | re.DOTALL)
+PROPERTY_PATTERN = re.compile(r"\"((?:[^\"\\]|\\.)*)\"\s*=\s*\"((?:[^\"\\]|\\.)*)\"")
+# The refresh moment only applies to the creation of the materialized view.
+REFRESH_MOMENT_PATTERN = re.compile(r"^(?:IMMEDIATE|DEFERRED)\s+", re.IGNORECASE)
+# The prefix of the comment holding the fingerprint of the query and layout.
+FINGERPRINT_PREFIX = "dbt_fingerprint:"
+
+
+def strip_column_list(header: str) -> str:
+    """Drop the `CREATE MATERIALIZED VIEW` clause and its column list, which may hold column comments."""
+    match = CREATE_PATTERN.match(header)
+    if match is None:
+        return header
+    start = match.end()
+    if header[start:start + 1] != "(":
+        return header[start:]
+    depth = 0
+    for i in range(start, len(header)):
+        if header[i] == "(":
+            depth += 1
+        elif header[i] == ")":
+            depth -= 1
+            if depth == 0:
+                return header[i + 1:]
+    return header
+
+
+def normalize_refresh(refresh: str) -> str:
+    """Normalize a refresh scheme, so the configured and the stored ones compare equal."""
+    refresh = REFRESH_MOMENT_PATTERN.sub("", refresh.strip())
+    return re.sub(r"\s+", "", refresh.replace("'", '"')).upper()
+
+
+@dataclass
+class MaterializedViewConfig:
+    comment: Optional[str] = None
+    refresh: Optional[str] = None
+    properties: Dict[str, str] = field(default_factory=dict)
+
+    @classmethod
+    def from_ddl(cls, ddl: str) -> "MaterializedViewConfig":
+        """
+        Parse the output of `SHOW CREATE MATERIALIZED VIEW`.
+
+        Only the clauses before the query are read, so the query cannot be
+        mistaken for one of them.
+        """
+        match = QUERY_START_PATTERN.search(ddl)
+        header = strip_column_list(ddl[:match.start()] if match else ddl)
+
+        comment = COMMENT_PATTERN.search(header)
+        refresh = REFRESH_PATTERN.search(header)
+        properties = PROPERTIES_PATTERN.search(header)
+        return cls(
+            comment=comment.group(2) if comment else None,
+            refresh=refresh.group(1) if refresh else None,
+            properties=dict(PROPERTY_PATTERN.findall(properties.group(1))) if properties else {},
+        )
+
+    @property
+    def has_fingerprint(self) -> bool:
+        """False for materialized views not created by this adapter, or by an older version of it."""
+        return self.comment is not None and self.comment.startswith(FINGERPRINT_PREFIX)
+
+
+@dataclass
+class MaterializedViewChanges:
+    """
+    The changes to apply to an existing materialized view.
+
+    `rebuild` is set when the query or the layout of the materialized view
+    changed, which cannot be altered. Otherwise the refresh scheme and the
+    properties are altered in place.
+    """
+    rebuild: bool = False
+    refresh: Optional[str] = None
+    properties: Dict[str, str] = field(default_factory=dict)
+
+
+def get_changes(
+    existing: MaterializedViewConfig,
+    comment: str,
+    refresh: Optional[str],
+    properties: Optional[Dict[str, Any]],
+) -> Optional[MaterializedViewChanges]:
+    """
+    Compare an existing materialized view with its configuration.
+
+    Properties missing from the configuration are left as they are, since
+    they cannot be reset.
+
+    :param existing: The existing materialized view.
+    :param comment: The comment the materialized view is created with.
+    :param refresh: The configured refresh scheme.
+    :param properties: The configured properties.
+    :return: The changes, or None if there are none.
+    """
+    if existing.comment != comment:
+        return MaterializedViewChanges(rebuild=True)
+
+    changes = MaterializedViewChanges()
+    if refresh and (existing.refresh is None or normalize_refresh(existing.refresh) != normalize_refresh(refresh)):
+        changes.refresh = REFRESH_MOMENT_PATTERN.sub("", refresh.strip())
+    for key, value in (properties or {}).items():
+        if existing.properties.get(key) != str(value):
+            changes.properties[key] = str(value)
+
+    if changes.refresh is None and not changes.properties:
+        return None
+    return changes
@@ -0,0 +1,208 @@
+#! /usr/bin/python3
+# Copyright 2021-present StarRocks, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https:#www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import datetime
+import decimal
+import re
+from dataclasses import dataclass, field
+from typing import Any, Iterable, List, Optional, Sequence, Tuple
+
+# `[types: [DATE]; keys: [2024-01-01]; ..types: [DATE]; keys: [2024-02-01]; )`
+RANGE_BOUND_PATTERN = re.compile(r"types: \[([^\]]*)\]; keys: \[([^\]]*)\];")
+# `(('a'),('b'))` or `[["a"],["b"]]`
+LIST_TUPLE_PATTERN = re.compile(r"[(\[]([^()\[\]]*)[)\]]")
+LIST_VALUE_PATTERN = re.compile(r"""'((?:[^'\\]|\\.)*)'|"((?:[^"\\]|\\.)*)\"""")
+
+INTEGER_TYPES = ("TINYINT", "SMALLINT", "INT", "BIGINT", "LARGEINT")
+
+# Above this many distinct partition values, the partitions of an overwrite are not determined.
+MAX_PARTITION_VALUES = 1000
+
+
+def parse_key(key_type: str, key: str) -> Any:
+    """
+    Convert a partition key from `SHOW PARTITIONS` to a comparable value.
+
+    :param key_type: The StarRocks type of the partition column.
+    :param key: The key, as rendered by `SHOW PARTITIONS`.
+    :return: The key as a date, datetime, int or str.
+    """
+    key_type = key_type.upper()
+    # the lower bound of the first range partition is the minimum of the type
+    is_min = key.startswith("0000-01-01")
+    if key_type.startswith("DATETIME"):
+        return datetime.datetime.min if is_min else datetime.datetime.fromisoformat(key)
+    if key_type.startswith("DATE"):
+        return datetime.date.min if is_min else datetime.date.fromisoformat(key)
+    if key_type.startswith(INTEGER_TYPES):
+        return int(key)
+    return key
+
+
+def normalize_value(value: Any, like: Any) -> Any:
+    """Convert a value read from the temp relation to the type of a partition key."""
+    if isinstance(like, datetime.datetime):
+        if isinstance(value, datetime.datetime):
+            return value
+        if isinstance(value, datetime.date):
+            return datetime.datetime.combine(value, datetime.time())
+        return datetime.datetime.fromisoformat(str(value))
+    if isinstance(like, datetime.date):
+        if isinstance(value, datetime.datetime):
+            return value.date()
+        if isinstance(value, datetime.date):
+            return value
+        return datetime.date.fromisoformat(str(value))
+    if isinstance(like, int):
+        if isinstance(value, (int, decimal.Decimal, float)):
+            return int(value)
+        return int(str(value))
+    return str(value)
+
+
+@dataclass
+class Partition:
+    name: str
+    lower: Any = None
+    upper: Any = None
+    values: Tuple[Any, ...] = ()
+
+    def contains(self, value: Any) -> bool:
+        if self.values:
+            return normalize_value(value, self.values[0]) in self.values
+        value = normalize_value(value, self.lower)
+        return self.lower <= value and (self.upper is None or value < self.upper)
+
+
+def parse_range(name: str, spec: str) -> Optional[Partition]:
+    bounds = RANGE_BOUND_PATTERN.findall(spec)
+    if len(bounds) != 2:
+        return None
+    (lower_type, lower_key), (upper_type, upper_key) = bounds
+    # only single column ranges are supported
+    if "," in lower_key or "," in upper_key:
+        return None
+    upper = None if upper_key == "MAXVALUE" else parse_key(upper_type, upper_key)
+    return Partition(name, lower=parse_key(lower_type, lower_key), upper=upper)
+
+
+def parse_list(name: str, spec: str, key_type: str) -> Optional[Partition]:
+    values = []
+    for item in LIST_TUPLE_PATTERN.findall(spec):
+        item_values = [single or double for single, double in LIST_VALUE_PATTERN.findall(item)]
+        # only single column lists are supported
+        if len(item_values) != 1:
+            return None
+        values.append(parse_key(key_type, item_values[0]))
+    if not values:
+        return None
+    return Partition(name, values=tuple(values))
+
+
+def parse_partitions(rows: Iterable[dict], key_type: str = "VARCHAR") -> Optional[List[Partition]]:
+    """
+    Parse the rows of `SHOW PARTITIONS`.
+
+    :param rows: The rows, by column name.
+    :param key_type: The type of the partition column, used to parse list values.
+    :return: The partitions, or None if one of them could not be parsed.
+    """
+    partitions = []
+    for row in rows:
+        name = row.get("PartitionName")
+        range_spec = row.get("Range") or ""
+        list_spec = row.get("List") or ""
+        try:
+            if range_spec.strip():
+                partition = parse_range(name, range_spec)
+            elif list_spec.strip():
+                partition = parse_list(name, list_spec, key_type)
+            else:
+                partition = None
+        except ValueError:
+            partition = None
+        if partition is None:
+            return None
+        partitions.append(partition)
+    return partitions
+
+
+@dataclass
+class PartitionMatch:
+    """The partition column values of new rows, split by whether their partition exists."""
+    names: List[str]
+    existing_values: List[Any]
+    new_values: List[Any]
+
+
+def partitions_for_values(partitions: Sequence[Partition], values: Iterable[Any]) -> Optional[PartitionMatch]:
+    """
+    Find the partitions holding the given partition column values.
+
+    Values without a partition yet need no overwrite, since they are written
+    to new partitions.
+
+    :param partitions: The partitions of the table.
+    :param values: The distinct partition column values.
+    :return: The names of the partitions holding some of the values, in table
+        order, with the values split by whether they have a partition, or None
+        if a value is NULL or cannot be compared with the partitions.
+    """
+    names = set()
+    existing_values, new_values = [], []
+    for value in values:
+        if value is None:
+            return None
+        try:
+            partition = next((p for p in partitions if p.contains(value)), None)
+        except (TypeError, ValueError):
+            return None
+        if partition is None:
+            new_values.append(value)
+        else:
+            names.add(partition.name)
+            existing_values.append(value)
+    return PartitionMatch([p.name for p in partitions if p.name in names], existing_values, new_values)
+
+
+def sql_literal(value: Any) -> str:
+    """Render a partition column value read from the database as a SQL literal."""
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, (int, float, decimal.Decimal)):
+        return str(value)
+    if isinstance(value, datetime.datetime):
+        return "'{}'".format(value.isoformat(sep=" "))
+    if isinstance(value, datetime.date):
+        return "'{}'".format(value.isoformat())
+    if isinstance(value, (bytes, bytearray)):
+        value = value.decode()
+    return "'{}'".format(str(value).replace("\\", "\\\\").replace("'", "\\'"))
+
+
+@dataclass
+class PartitionOverwrite:
+    """
+    The partitions an `insert_overwrite` is limited to.
+
+    When the new rows mix new and existing partitions, the rows of existing
+    partitions (`existing_filter`) overwrite them, and the other rows
+    (`new_filter`) are inserted. `unresolved` tells why the partitions could
+    not be determined.
+    """
+    partitions: List[str] = field(default_factory=list)
+    existing_filter: Optional[str] = None
+    new_filter: Optional[str] = None
+    unresolved: Optional[str] = None
@@ -0,0 +1,95 @@
+#! /usr/bin/python3
+# Copyright 2021-present StarRocks, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https:#www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import re
+from typing import Dict, Optional, Union
+
+# The previous statement of the session, and its runtime profile (requires `enable_profile`).
+QUERY_PROFILE_SQL = "select last_query_id(), get_query_profile(last_query_id())"
+
+# `- QueryCumulativeCpuTime: 1s234ms`, but not the `__MAX_OF_` / `__MIN_OF_` variants.
+COUNTER_PATTERN = r"^\s*- {name}: (.+)$"
+TIME_UNIT_PATTERN = re.compile(r"(\d+(?:\.\d+)?)(h|ms|us|ns|m|s)")
+BYTES_PATTERN = re.compile(r"(\d+(?:\.\d+)?)\s*(B|KB|MB|GB|TB|PB)\b")
+# `1.234M (1234567)`, or a plain `123`
+COUNT_PATTERN = re.compile(r"(?:.*\((\d+)\)|(\d+))\s*$")
+
+TIME_UNITS_MS = {"h": 3600000, "m": 60000, "s": 1000, "ms": 1, "us": 0.001, "ns": 0.000001}
+BYTE_UNITS = {"B": 1, "KB": 1024, "MB": 1024 ** 2, "GB": 1024 ** 3, "TB": 1024 ** 4, "PB": 1024 ** 5}
+
+# Query level counters of the `Execution` section.
+CPU_TIME_COUNTER = "QueryCumulativeCpuTime"
+PEAK_MEMORY_COUNTER = "QueryPeakMemoryUsagePerNode"
+# Scan operator counters, summed over the operators.
+SCAN_ROWS_COUNTER = "RawRowsRead"
+SCAN_BYTES_COUNTER = "BytesRead"
+
+
+def parse_time_ms(value: str) -> Optional[float]:
+    """Parse a profile duration, e.g. `1m2s345ms` or `12.345us`, in milliseconds."""
+    parts = TIME_UNIT_PATTERN.findall(value)
+    if not parts:
+        return None
+    return sum(float(amount) * TIME_UNITS_MS[unit] for amount, unit in parts)
+
+
+def parse_bytes(value: str) -> Optional[int]:
+    """Parse a profile size, e.g. `1.234 GB`, in bytes."""
+    match = BYTES_PATTERN.search(value)
+    if match is None:
+        return None
+    return int(float(match.group(1)) * BYTE_UNITS[match.group(2)])
+
+
+def parse_count(value: str) -> Optional[int]:
+    """Parse a profile count, e.g. `1.234M (1234567)`."""
+    match = COUNT_PATTERN.match(value.strip())
+    if match is None:
+        return None
+    return int(match.group(1) or match.group(2))
+
+
+def _counter_values(profile: str, name: str):
+    return re.findall(COUNTER_PATTERN.format(name=name), profile, re.MULTILINE)
+
+
+def _first(profile: str, name: str, parse) -> Optional[Union[int, float]]:
+    for value in _counter_values(profile, name):
+        parsed = parse(value)
+        if parsed is not None:
+            return parsed
+    return None
+
+
+def _sum(profile: str, name: str, parse) -> Optional[int]:
+    values = [parse(value) for value in _counter_values(profile, name)]
+    values = [value for value in values if value is not None]
+    return sum(values) if values else None
+
+
+def parse_query_profile(profile: Optional[str]) -> Dict[str, Optional[Union[int, float]]]:
+    """
+    Extract the CPU time, peak memory and scanned rows and bytes of a query profile.
+
+    :param profile: The output of `get_query_profile`.
+    :return: The statistics, by `StarRocksAdapterResponse` field; None when missing.
+    """
+    profile = profile or ""
+    return {
+        "cpu_time_ms": _first(profile, CPU_TIME_COUNTER, parse_time_ms),
+        "peak_memory_bytes": _first(profile, PEAK_MEMORY_COUNTER, parse_bytes),
+        "scan_rows": _sum(profile, SCAN_ROWS_COUNTER, parse_count),
+        "scan_bytes": _sum(profile, SCAN_BYTES_COUNTER, parse_bytes),
+    }
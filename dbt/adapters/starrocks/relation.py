@@ -14,7 +14,7 @@
 # limitations under the License.
 
 from dataclasses import dataclass, field
-from typing import Optional, Type
+from typing import Any, List, Optional, Type
 from dbt.adapters.base.relation import BaseRelation, Policy
 from dbt.exceptions import DbtRuntimeError
 from dbt_common.dataclass_schema import StrEnum
@@ -51,7 +51,8 @@ class StarRocksRelationType(StrEnum):
     Unknown = "unknown"
 
 
-type_map = {}
+# Types whose full definition (e.g. `array<int>`) is only reported by `desc`.
+COMPLEX_DATA_TYPES = ("array", "struct", "map")
 
 
 @dataclass(frozen=True, eq=False, repr=False)
@@ -96,16 +97,29 @@ class StarRocksRelation(BaseRelation):
             )
         return super().render()
 
-    def init_type_map(self, desc_table):
-        for row in desc_table:
-            # name -> type
-            type_map[row[0]] = row[1]
-
-    def get_type_by_desc(self, row):
-        new_row = list(row)
-        # type
-        new_row[1] = type_map[row[0]]
-        return new_row
+    @staticmethod
+    def has_complex_types(columns_table) -> bool:
+        return any(row[1] in COMPLEX_DATA_TYPES for row in columns_table)
+
+    @staticmethod
+    def resolve_complex_types(columns_table, desc_table) -> List[List[Any]]:
+        """
+        Replace the `array`, `struct` and `map` types reported by
+        `information_schema.columns` with their full definition from `desc`.
+
+        :param columns_table: The rows of `information_schema.columns`, starting with the column name and type.
+        :param desc_table: The rows of `desc`, or None when there is no complex type.
+        :return: The column rows, with complex types resolved.
+        """
+        rows = [list(row) for row in columns_table]
+        complex_columns = {row[0] for row in rows if row[1] in COMPLEX_DATA_TYPES}
+        if not complex_columns or desc_table is None:
+            return rows
+
+        desc_types = {row[0]: row[1] for row in desc_table if row[0] in complex_columns}
+        for row in rows:
+            row[1] = desc_types.get(row[0], row[1])
+        return rows
 
     @classproperty
     def get_relation_type(cls) -> Type[StarRocksRelationType]:
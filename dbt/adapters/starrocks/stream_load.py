@@ -0,0 +1,249 @@
+#! /usr/bin/python3
+# Copyright 2021-present StarRocks, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https:#www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import base64
+import datetime
+import decimal
+import http.client
+import json
+import select
+import uuid
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence
+from urllib.parse import urlsplit
+
+import dbt_common.exceptions
+from dbt.adapters.events.logging import AdapterLogger
+
+logger = AdapterLogger("starrocks")
+
+# Stream Load reads `\N` as NULL. The separators are control characters so that
+# commas, quotes and newlines inside seed values never need escaping. CSV has no
+# escaping at all, so values containing them are rejected.
+NULL_MARKER = "\\N"
+COLUMN_SEPARATOR = "\x01"
+ROW_DELIMITER = "\x02"
+
+# Statuses documented as a successful load.
+# See: https://docs.starrocks.io/docs/loading/StreamLoad/
+SUCCESS_STATUSES = ("Success", "Publish Timeout")
+
+MAX_REDIRECTS = 3
+# Seconds to wait for `100 Continue` before sending the body anyway, as for
+# servers ignoring `Expect` (RFC 9110, section 10.1.1).
+CONTINUE_TIMEOUT = 3
+
+
+@dataclass
+class StreamLoadResult:
+    label: str
+    status: str
+    rows_total: int = 0
+    rows_loaded: int = 0
+    rows_filtered: int = 0
+    load_time_ms: int = 0
+    message: str = ""
+    error_url: Optional[str] = None
+
+    @classmethod
+    def from_response(cls, label: str, payload: Dict[str, Any]) -> "StreamLoadResult":
+        return cls(
+            label=payload.get("Label", label),
+            status=payload.get("Status", "unknown"),
+            rows_total=int(payload.get("NumberTotalRows", 0)),
+            rows_loaded=int(payload.get("NumberLoadedRows", 0)),
+            rows_filtered=int(payload.get("NumberFilteredRows", 0)),
+            load_time_ms=int(payload.get("LoadTimeMs", 0)),
+            message=payload.get("Message", ""),
+            error_url=payload.get("ErrorURL") or None,
+        )
+
+    @property
+    def succeeded(self) -> bool:
+        return self.status in SUCCESS_STATUSES
+
+
+def format_value(value: Any) -> str:
+    """
+    Render a single agate value the way Stream Load parses CSV columns.
+
+    :param value: The value from the agate row.
+    :return: The CSV field.
+    """
+    if value is None:
+        return NULL_MARKER
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, decimal.Decimal):
+        return format(value, "f")
+    if isinstance(value, datetime.datetime):
+        # DATETIME has no time zone: aware values are loaded in UTC.
+        if value.tzinfo is not None:
+            value = value.astimezone(datetime.timezone.utc).replace(tzinfo=None)
+        return value.isoformat(sep=" ")
+    if isinstance(value, datetime.date):
+        return value.isoformat()
+    if isinstance(value, datetime.timedelta):
+        return str(value.total_seconds())
+    value = str(value)
+    if COLUMN_SEPARATOR in value or ROW_DELIMITER in value:
+        raise dbt_common.exceptions.DbtRuntimeError(
+            f"Cannot Stream Load the value {value!r}: it contains the \\x01 or \\x02 separator. "
+            "Use `load_method: insert` for this seed."
+        )
+    return value
+
+
+def encode_rows(rows: Iterable[Sequence[Any]]) -> bytes:
+    """
+    Serialize rows into a Stream Load CSV payload.
+
+    :param rows: The rows to serialize.
+    :return: The request body.
+    """
+    return ROW_DELIMITER.join(
+        COLUMN_SEPARATOR.join(format_value(value) for value in row)
+        for row in rows
+    ).encode("utf-8")
+
+
+def batched(rows: Iterable[Sequence[Any]], batch_size: int) -> Iterator[List[Sequence[Any]]]:
+    batch: List[Sequence[Any]] = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) >= batch_size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+class StreamLoadClient:
+    """
+    Minimal client for the StarRocks Stream Load HTTP API.
+
+    The FE answers with a redirect to the BE that coordinates the load, so the
+    request is re-sent to the `Location` it points at, keeping the credentials.
+    """
+
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        username: Optional[str],
+        password: Optional[str],
+        timeout: int = 600,
+    ):
+        self.host = host
+        self.port = port
+        self.timeout = timeout
+        token = "{}:{}".format(username or "", password or "").encode("utf-8")
+        self._authorization = "Basic " + base64.b64encode(token).decode("ascii")
+
+    def _put(self, host: str, port: int, path: str, headers: Dict[str, str], body: bytes):
+        """
+        Send a PUT with `Expect: 100-continue`, so that the body is only sent
+        once the server asks for it: the FE answers with its redirect to the BE
+        straight away, and the body is uploaded once, to the BE.
+        """
+        connection = http.client.HTTPConnection(host, port, timeout=self.timeout)
+        try:
+            connection.putrequest("PUT", path, skip_accept_encoding=True)
+            for name, value in headers.items():
+                connection.putheader(name, value)
+            connection.putheader("Content-Length", str(len(body)))
+            connection.putheader("Expect", "100-continue")
+            connection.endheaders()
+
+            if select.select([connection.sock], [], [], CONTINUE_TIMEOUT)[0]:
+                with connection.sock.makefile("rb") as reader:
+                    line = reader.readline(65537)
+                    try:
+                        status = int(line.split(None, 2)[1])
+                    except (IndexError, ValueError):
+                        raise http.client.BadStatusLine(line)
+                    response_headers = http.client.parse_headers(reader)
+                    if status != 100:
+                        # answered without the body, e.g. the redirect of the FE
+                        length = int(response_headers.get("Content-Length") or 0)
+                        return status, response_headers.get("Location"), reader.read(length)
+
+            connection.send(body)
+            response = connection.getresponse()
+            return response.status, response.getheader("Location"), response.read()
+        finally:
+            connection.close()
+
+    def load(
+        self,
+        database: str,
+        table: str,
+        columns: List[str],
+        body: bytes,
+        label: Optional[str] = None,
+    ) -> StreamLoadResult:
+        """
+        Send one Stream Load request.
+
+        :param database: The target database.
+        :param table: The target table.
+        :param columns: The target column names, in payload order.
+        :param body: The serialized rows, see `encode_rows`.
+        :param label: The load label, generated when omitted.
+        :return: The parsed Stream Load result.
+        """
+        label = label or "dbt_{}".format(uuid.uuid4().hex)
+        headers = {
+            "Authorization": self._authorization,
+            "label": label,
+            "format": "CSV",
+            "column_separator": "\\x01",
+            "row_delimiter": "\\x02",
+            "columns": ",".join("`{}`".format(c) for c in columns),
+            "Content-Type": "text/plain; charset=UTF-8",
+        }
+        host, port, path = self.host, self.port, "/api/{}/{}/_stream_load".format(database, table)
+
+        for _ in range(MAX_REDIRECTS + 1):
+            try:
+                status, location, payload = self._put(host, port, path, headers, body)
+            except (OSError, http.client.HTTPException) as e:
+                raise dbt_common.exceptions.DbtRuntimeError(
+                    f"Stream Load [{label}] to {host}:{port} failed: {e}"
+                ) from e
+
+            if status in (301, 302, 307, 308) and location:
+                target = urlsplit(location)
+                host, port = target.hostname, target.port or 80
+                path = target.path + ("?" + target.query if target.query else "")
+                logger.debug(f"Stream Load [{label}] redirected to {host}:{port}")
+                continue
+
+            if status != 200:
+                raise dbt_common.exceptions.DbtRuntimeError(
+                    f"Stream Load [{label}] failed with HTTP status {status}: "
+                    f"{payload.decode('utf-8', 'replace')}"
+                )
+
+            try:
+                return StreamLoadResult.from_response(label, json.loads(payload))
+            except ValueError as e:
+                raise dbt_common.exceptions.DbtRuntimeError(
+                    f"Stream Load [{label}] returned an invalid response: {payload[:512]!r}"
+                ) from e
+
+        raise dbt_common.exceptions.DbtRuntimeError(
+            f"Stream Load [{label}] exceeded {MAX_REDIRECTS} redirects"
+        )
@@ -0,0 +1,190 @@
+#! /usr/bin/python3
+# Copyright 2021-present StarRocks, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https:#www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import threading
+import time
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional
+
+import dbt_common.exceptions
+from dbt.adapters.events.logging import AdapterLogger
+
+logger = AdapterLogger("starrocks")
+
+TaskRun = Dict[str, Any]
+
+# Columns of `information_schema.task_runs` read by the pollers, in select order.
+TASK_RUN_COLUMNS = ("STATE", "ERROR_MESSAGE", "PROGRESS")
+
+FINISHED_STATES = ("SUCCESS", "MERGED", "unknown")
+
+# Tasks due within this many seconds are polled early, with the current tick.
+COALESCE_WINDOW = 0.5
+
+
+@dataclass
+class _Waiter:
+    task_id: str
+    future: Future = field(default_factory=Future)
+    attempts: int = 1
+    next_poll: float = 0.0
+
+
+class TaskPoller:
+    """
+    Polls `information_schema.task_runs` for every in-flight submitted task from
+    a single background thread.
+
+    Each tick fetches the state of all the tasks that are due in one query,
+    and resolves the future of the finished ones. Every task keeps its own
+    exponential backoff, so a tick only includes the tasks whose delay elapsed
+    (or is about to).
+    The thread stops when no task is left and is restarted on demand.
+    """
+
+    def __init__(
+        self,
+        fetch_task_runs: Callable[[List[str]], Dict[str, TaskRun]],
+        compute_delay: Callable[[int], float],
+    ):
+        """
+        :param fetch_task_runs: Returns the task run of each given task ID that was found.
+        :param compute_delay: Returns the delay before the next poll of a task, given its attempt number.
+        """
+        self._fetch_task_runs = fetch_task_runs
+        self._compute_delay = compute_delay
+        self._waiters: Dict[str, _Waiter] = {}
+        self._condition = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+
+    def submit(self, task_id: str) -> Future:
+        """
+        Start tracking a submitted task.
+
+        :param task_id: The task ID to poll for.
+        :return: A future resolved with the final task run, or None if the task is not found.
+        """
+        with self._condition:
+            waiter = _Waiter(task_id=task_id, next_poll=time.monotonic())
+            self._waiters[task_id] = waiter
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="starrocks-task-poller", daemon=True)
+                self._thread.start()
+            self._condition.notify()
+            return waiter.future
+
+    def wait(self, task_id: str) -> Optional[TaskRun]:
+        """
+        Block until the task is finished.
+
+        :param task_id: The task ID to poll for.
+        :return: The final task run, or None if the task is not found.
+        """
+        return self.submit(task_id).result()
+
+    def cancel(self, task_id: str) -> None:
+        """
+        Stop tracking a task and wake up its waiter with an error.
+
+        :param task_id: The task ID to stop polling for.
+        """
+        with self._condition:
+            waiter = self._waiters.pop(task_id, None)
+        if waiter is not None and not waiter.future.done():
+            waiter.future.set_exception(
+                dbt_common.exceptions.DbtRuntimeError(f"Task [{task_id}] was cancelled"))
+
+    def _next_due(self) -> List[_Waiter]:
+        """Wait until at least one task is due, return them all, or [] when idle."""
+        with self._condition:
+            while True:
+                if not self._waiters:
+                    self._thread = None
+                    return []
+                now = time.monotonic()
+                due = [w for w in self._waiters.values() if w.next_poll <= now + COALESCE_WINDOW]
+                if due:
+                    return due
+                next_poll = min(w.next_poll for w in self._waiters.values())
+                self._condition.wait(timeout=next_poll - now)
+
+    def _resolve(self, waiter: _Waiter, task_run: Optional[TaskRun] = None, error: Optional[Exception] = None):
+        with self._condition:
+            self._waiters.pop(waiter.task_id, None)
+        if waiter.future.done():
+            return
+        if error is not None:
+            waiter.future.set_exception(error)
+        else:
+            waiter.future.set_result(task_run)
+
+    def _fail_all(self, error: Exception) -> None:
+        """Fail every pending task, and let the next submit start a new thread."""
+        with self._condition:
+            waiters = list(self._waiters.values())
+            self._waiters.clear()
+            if self._thread is threading.current_thread():
+                self._thread = None
+        for waiter in waiters:
+            if not waiter.future.done():
+                waiter.future.set_exception(error)
+
+    def _run(self) -> None:
+        try:
+            while True:
+                due = self._next_due()
+                if not due:
+                    return
+                self._tick(due)
+        except Exception as e:
+            logger.error(f"Error: The task poller stopped. Reason: {e}")
+            self._fail_all(e)
+
+    def _tick(self, due: List[_Waiter]) -> None:
+        try:
+            task_runs = self._fetch_task_runs([w.task_id for w in due])
+            tick = time.monotonic()
+        except Exception as e:
+            logger.error(f"Error: Could not poll tasks {[w.task_id for w in due]}. Reason: {e}")
+            for waiter in due:
+                self._resolve(waiter, error=e)
+            return
+
+        for waiter in due:
+            task_id = waiter.task_id
+            task_run = task_runs.get(task_id)
+            if task_run is None:
+                logger.info(f"Task {task_id} not found. Aborting...")
+                self._resolve(waiter)
+                continue
+
+            status = task_run.get("STATE", "unknown")
+            if status == "FAILED":
+                self._resolve(waiter, error=dbt_common.exceptions.DbtRuntimeError(
+                    f"Task [{task_id}] failed with status "
+                    f"[{status}] and error message: {task_run.get('ERROR_MESSAGE', '')}"
+                ))
+            elif status in FINISHED_STATES:
+                logger.info(f"Task [{task_id}] finished with status [{status}]")
+                self._resolve(waiter, task_run)
+            else:
+                poll_delay = self._compute_delay(waiter.attempts)
+                with self._condition:
+                    waiter.attempts += 1
+                    waiter.next_poll = tick + poll_delay
+                progress = task_run.get("PROGRESS", "unknown")
+                logger.info(f"Task {task_id} progress [{progress}]. Waiting {poll_delay} seconds...")
@@ -32,29 +32,59 @@
   {% endcall %}
 
   {% set table = load_result('get_columns_in_relation').table %}
-  
-  {% if table.rows %}
+
+  {% if not table.rows %}
+    {{ return([]) }}
+  {% endif %}
+
+  {# only desc reports the full definition of array, struct and map types #}
+  {% set desc_table = none %}
+  {% if relation.has_complex_types(table) %}
     {% call statement('desc_columns_in_relation', fetch_result=True) %}
       desc `{{ relation.schema }}`.`{{ relation.identifier }}`
     {% endcall %}
     {% set desc_table = load_result('desc_columns_in_relation').table %}
-    {{ return(starrocks__sql_convert_columns_in_relation(relation, table, desc_table)) }}
-  {% else %}
-    {{ return([]) }}
   {% endif %}
+  {{ return(starrocks__sql_convert_columns_in_relation(relation, table, desc_table)) }}
 {% endmacro %}
 
 {% macro starrocks__sql_convert_columns_in_relation(relation, table, desc_table) -%}
-  {% do relation.init_type_map(desc_table) %}
   {% set columns = [] %}
-  {% for row in table %}
-    -- rows[1] means type from information_schema
-    {% if row[1] in ['array', 'struct', 'map'] %}
-        {% set fixed_row = relation.get_type_by_desc(row) %}
-        {% do columns.append(api.Column(*fixed_row)) %}
-    {%- else -%}
-        {% do columns.append(api.Column(*row)) %}
-    {% endif %}
+  {% for row in relation.resolve_complex_types(table, desc_table) %}
+    {% do columns.append(api.Column(*row)) %}
   {% endfor %}
   {{ return(columns) }}
 {% endmacro %}
+
+{% macro starrocks__get_columns_in_schema(schema) -%}
+  {% call statement('get_columns_in_schema', fetch_result=True) %}
+    select
+        table_name,
+        column_name,
+        data_type,
+        character_maximum_length,
+        numeric_precision,
+        numeric_scale
+
+    from INFORMATION_SCHEMA.columns
+    where table_schema = '{{ schema }}'
+    order by table_name, ordinal_position
+  {% endcall %}
+
+  {{ return(load_result('get_columns_in_schema').table) }}
+{% endmacro %}
+
+{% macro starrocks__create_columns(relation, columns) -%}
+  {{ default__create_columns(relation, columns) }}
+  {% do adapter.invalidate_column_cache(relation) %}
+{% endmacro %}
+
+{% macro starrocks__alter_column_type(relation, column_name, new_column_type) -%}
+  {{ default__alter_column_type(relation, column_name, new_column_type) }}
+  {% do adapter.invalidate_column_cache(relation) %}
+{% endmacro %}
+
+{% macro starrocks__alter_relation_add_remove_columns(relation, add_columns, remove_columns) -%}
+  {{ default__alter_relation_add_remove_columns(relation, add_columns, remove_columns) }}
+  {% do adapter.invalidate_column_cache(relation) %}
+{% endmacro %}
@@ -16,6 +16,19 @@
 
 {% macro starrocks__list_relations_without_caching(schema_relation) -%}
   {% call statement('list_relations_without_caching', fetch_result=True) %}
+    {{ starrocks__list_relations_sql([schema_relation.schema]) }}
+  {% endcall %}
+  {{ return(load_result('list_relations_without_caching').table) }}
+{%- endmacro %}
+
+{% macro starrocks__list_relations_in_schemas(schemas) -%}
+  {% call statement('list_relations_in_schemas', fetch_result=True) %}
+    {{ starrocks__list_relations_sql(schemas) }}
+  {% endcall %}
+  {{ return(load_result('list_relations_in_schemas').table) }}
+{%- endmacro %}
+
+{% macro starrocks__list_relations_sql(schemas) -%}
     select
       null as "database",
       tbl.table_name as name,
@@ -29,13 +42,28 @@
     left join default_catalog.information_schema.materialized_views mv
     on tbl.TABLE_SCHEMA = mv.TABLE_SCHEMA
     and tbl.TABLE_NAME = mv.TABLE_NAME
-    where tbl.table_schema = '{{ schema_relation.schema }}'
-  {% endcall %}
-  {{ return(load_result('list_relations_without_caching').table) }}
+    {%- if schemas | length == 1 %}
+    where tbl.table_schema = '{{ schemas[0] }}'
+    {%- else %}
+    where tbl.table_schema in ({%- for schema in schemas -%}'{{ schema }}'{%- if not loop.last %}, {% endif -%}{%- endfor -%})
+    {%- endif %}
 {%- endmacro %}
 
 {% macro starrocks__get_catalog(information_schema, schemas) -%}
   {%- call statement('catalog', fetch_result=True) -%}
+    {{ starrocks__get_catalog_sql(information_schema, schemas) }}
+  {%- endcall -%}
+
+  {{ return(load_result('catalog').table) }}
+
+{%- endmacro %}
+
+{% macro starrocks__get_catalog_sql(information_schema, schemas) -%}
+    {#- the schema filter is applied in both CTEs, so only the catalog of these schemas is scanned -#}
+    {%- set schema_filter -%}
+      table_schema in ({%- for schema in schemas -%}'{{ schema }}'{%- if not loop.last %}, {% endif -%}{%- endfor -%})
+      and table_schema not in ('information_schema', '__statistics__')
+    {%- endset -%}
     with tables as (
       select
           null as "table_database",
@@ -47,6 +75,7 @@
           end as table_type,
           null as table_owner
       from {{ information_schema }}.tables
+      where {{ schema_filter }}
     ),
     columns as (
       select
@@ -59,6 +88,7 @@
           data_type as "column_type",
           null as "column_comment"
       from {{ information_schema }}.columns
+      where {{ schema_filter }}
     )
     select
         columns.table_database,
@@ -73,17 +103,7 @@
         columns.column_comment
     from tables
     join columns on tables.table_schema = columns.table_schema and tables.table_name = columns.table_name
-    where tables.table_schema not in ('information_schema', '__statistics__')
-    and (
-    {%- for schema in schemas -%}
-      tables.table_schema = '{{ schema }}'{%- if not loop.last %} or {% endif -%}
-    {%- endfor -%}
-    )
     order by column_index
-  {%- endcall -%}
-
-  {{ return(load_result('catalog').table) }}
-
 {%- endmacro %}
 
 {% macro starrocks__check_schema_exists(database, schema) -%}
@@ -97,3 +117,23 @@
     {%- endcall %}
     {{ return(load_result('list_schemas').table) }}
 {%- endmacro %}
+
+{% macro starrocks__get_table_model(relation) -%}
+    {#- PRIMARY_KEYS, UNIQUE_KEYS, DUP_KEYS or AGG_KEYS, none when the table does not exist -#}
+    {% call statement('get_table_model', fetch_result=True) %}
+      select table_model from information_schema.tables_config
+      where table_schema = '{{ relation.schema }}' and table_name = '{{ relation.identifier }}'
+    {% endcall %}
+    {% set table = load_result('get_table_model').table %}
+    {{ return(table.rows[0][0] if table.rows else none) }}
+{%- endmacro %}
+
+{% macro starrocks__get_relation_comment(relation) -%}
+    {#- the comment of the table or view, none when it does not exist -#}
+    {% call statement('get_relation_comment', fetch_result=True) %}
+      select table_comment from information_schema.tables
+      where table_schema = '{{ relation.schema }}' and table_name = '{{ relation.identifier }}'
+    {% endcall %}
+    {% set table = load_result('get_relation_comment').table %}
+    {{ return(table.rows[0][0] if table.rows else none) }}
+{%- endmacro %}
@@ -54,4 +54,6 @@
   {%- call statement('exchange_relation') %}
       alter table {{ first_relation }} swap with `{{ second_relation.table }}`;
   {%- endcall %}
+  {% do adapter.invalidate_column_cache(first_relation) %}
+  {% do adapter.invalidate_column_cache(second_relation) %}
 {%- endmacro %}
@@ -33,6 +33,18 @@
   {%- if materialized == 'incremental' and unique_key is not none -%}
     {%- set table_type = 'PRIMARY' -%}
     {%- set keys = unique_key if unique_key is sequence and unique_key is not mapping and unique_key is not string else [unique_key] -%}
+  {%- elif materialized == 'snapshot' and config.get('snapshot_merge_method') == 'upsert' -%}
+    {%- set table_type = 'PRIMARY' -%}
+    {%- set keys = ['dbt_scd_id'] -%}
+    {#-- the bucketing columns of a primary key table must be key columns --#}
+    {%- if distributed_by is none -%}
+      {%- set distributed_by = ['dbt_scd_id'] -%}
+    {%- elif distributed_by | reject('equalto', 'dbt_scd_id') | list | length > 0 -%}
+      {%- set msg -%}
+        [distributed_by] must be ['dbt_scd_id'] with snapshot_merge_method 'upsert', got {{ distributed_by }}
+      {%- endset -%}
+      {{ exceptions.raise_compiler_error(msg) }}
+    {%- endif -%}
   {%- endif -%}
 
   {# 1. SET ENGINE #}
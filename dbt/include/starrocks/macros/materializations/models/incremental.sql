@@ -15,7 +15,7 @@
  */
 
 {%- macro get_incremental_insert_overwrite_sql(arg_dict) -%}
-    {%- do return(get_insert_overwrite_into_sql(arg_dict["target_relation"], arg_dict["temp_relation"], arg_dict["dest_columns"])) -%}
+    {%- do return(get_insert_overwrite_into_sql(arg_dict["target_relation"], arg_dict["temp_relation"], arg_dict["dest_columns"], config.get('partition_scoped_overwrite'))) -%}
 {%- endmacro -%}
 
 {%- macro get_incremental_dynamic_overwrite_sql(arg_dict) -%}
@@ -27,23 +27,158 @@
     {%- if microbatch_use_dynamic_overwrite -%}
         {%- do return(get_incremental_dynamic_overwrite_sql(arg_dict)) -%}
     {%- else -%}
-        {%- do return(get_incremental_insert_overwrite_sql(arg_dict)) -%}
+        {#-- batches always only overwrite their own partitions: partition_scoped_overwrite: false is rejected by
+             starrocks__validate_microbatch_config --#}
+        {%- do return(get_insert_overwrite_into_sql(arg_dict["target_relation"], arg_dict["temp_relation"], arg_dict["dest_columns"], true)) -%}
     {%- endif -%}
 {%- endmacro -%}
 
-{%- macro _get_strategy_sql(target_relation, temp_relation, dest_cols_csv, is_dynamic_overwrite) -%}
+{%- macro get_incremental_upsert_sql(arg_dict) -%}
+    {%- do return(get_upsert_into_sql(arg_dict["target_relation"], arg_dict["temp_relation"], arg_dict["dest_columns"], arg_dict.get("sql"))) -%}
+{%- endmacro -%}
+
+{#-- An insert of a subset of the columns of a primary key table only updates these columns of
+     the existing rows from 3.3.0 onwards. Before, the other columns are reset to their default. --#}
+{%- macro starrocks__partial_update_min_version() -%}
+    {%- do return("3.3.0") -%}
+{%- endmacro -%}
+
+{%- macro starrocks__supports_partial_update() -%}
+    {%- do return(not adapter.is_before_version(starrocks__partial_update_min_version())) -%}
+{%- endmacro -%}
+
+{%- macro get_incremental_partial_update_sql(arg_dict) -%}
+    {%- if not starrocks__supports_partial_update() -%}
+        {%- set msg -%}
+            [partial_update] is only available from version {{ starrocks__partial_update_min_version() }} onwards, current version is {{ adapter.current_version() }}
+        {%- endset -%}
+        {{ exceptions.raise_compiler_error(msg) }}
+    {%- endif -%}
+    {%- do return(get_upsert_into_sql(arg_dict["target_relation"], arg_dict["temp_relation"], arg_dict["dest_columns"], arg_dict.get("sql"), config.get('partial_update_mode'))) -%}
+{%- endmacro -%}
+
+{%- macro starrocks__get_incremental_merge_sql(arg_dict) -%}
+    {%- do return(get_incremental_upsert_sql(arg_dict)) -%}
+{%- endmacro -%}
+
+{#-- Rows of a primary key table are replaced on key conflicts, so a plain insert is an upsert.
+     With a partial update mode, only the given columns of the existing rows are replaced. --#}
+{%- macro get_upsert_into_sql(target_relation, temp_relation, dest_columns, sql=none, partial_update_mode=none) -%}
+    {%- set dest_cols_csv = get_quoted_csv(dest_columns | map(attribute="name")) %}
+
+    insert {% if partial_update_mode is not none %}/*+SET_VAR(partial_update_mode = '{{ partial_update_mode }}')*/ {% endif %}into {{ target_relation }} ({{ dest_cols_csv }})
+    {%- if temp_relation is not none %}
+    (
+        select {{ dest_cols_csv }}
+        from {{ temp_relation }}
+    )
+    {%- else %}
+    (
+        select {{ dest_cols_csv }}
+        from (
+            {{ sql }}
+        ) dbt_upsert_source
+    )
+    {%- endif -%}
+{%- endmacro -%}
+
+{#-- `partial_update_columns` as a list, also when set to a single column name --#}
+{%- macro starrocks__get_partial_update_column_names() -%}
+    {%- set partial_update_columns = config.get('partial_update_columns') -%}
+    {%- set names = partial_update_columns if partial_update_columns is sequence and partial_update_columns is not mapping and partial_update_columns is not string else [partial_update_columns] -%}
+    {%- set names = names | reject('none') | map('string') | map('trim') | reject('equalto', '') | list -%}
+    {%- if not names -%}
+        {%- do exceptions.raise_compiler_error("The 'partial_update' incremental strategy requires the 'partial_update_columns' configuration to be set to a non-empty list of column names, got: " ~ partial_update_columns) -%}
+    {%- endif -%}
+    {%- do return(names) -%}
+{%- endmacro -%}
+
+{%- macro starrocks__get_partial_update_columns(dest_columns) -%}
+    {%- set unique_key = config.get('unique_key') -%}
+    {%- set keys = unique_key if unique_key is sequence and unique_key is not mapping and unique_key is not string else [unique_key] -%}
+    {%- set update_names = [] -%}
+    {%- for name in keys + starrocks__get_partial_update_column_names() -%}
+        {%- do update_names.append(name | lower) -%}
+    {%- endfor -%}
+
+    {%- set columns = [] -%}
+    {%- set found_names = [] -%}
+    {%- for column in dest_columns if column.name | lower in update_names -%}
+        {%- do columns.append(column) -%}
+        {%- do found_names.append(column.name | lower) -%}
+    {%- endfor -%}
+
+    {%- set missing_names = update_names | reject('in', found_names) | list -%}
+    {%- if missing_names -%}
+        {%- do exceptions.raise_compiler_error("Columns " ~ missing_names ~ " of 'partial_update_columns' or 'unique_key' are missing from " ~ this) -%}
+    {%- endif -%}
+    {%- do return(columns) -%}
+{%- endmacro -%}
+
+{%- macro starrocks__validate_upsert_target(relation, is_external) -%}
+    {%- if is_external -%}
+        {%- do exceptions.raise_compiler_error("The '" ~ config.get('incremental_strategy') ~ "' incremental strategy is only supported on StarRocks primary key tables, not on external catalogs.") -%}
+    {%- endif -%}
+    {%- set table_model = starrocks__get_table_model(relation) -%}
+    {#-- partial updates are only supported by primary key tables --#}
+    {%- set table_models = ['PRIMARY_KEYS'] if config.get('incremental_strategy') == 'partial_update' else ['PRIMARY_KEYS', 'UNIQUE_KEYS'] -%}
+    {%- if table_model not in table_models -%}
+        {%- set msg -%}
+            The '{{ config.get('incremental_strategy') }}' incremental strategy requires {{ relation }} to be a primary key table, found {{ table_model }}.
+            Run with --full-refresh to recreate it with the `unique_key` as primary key.
+        {%- endset -%}
+        {%- do exceptions.raise_compiler_error(msg) -%}
+    {%- endif -%}
+{%- endmacro -%}
+
+{%- macro _get_strategy_sql(target_relation, temp_relation, dest_cols_csv, is_dynamic_overwrite, partitions=none, filter=none) -%}
     {%- set overwrite_type = "TRUE" if is_dynamic_overwrite else "FALSE" %}
 
-    insert /*+SET_VAR(dynamic_overwrite = {{ overwrite_type }})*/ overwrite {{ target_relation }} ({{ dest_cols_csv }})
+    {%- if partitions is not none and partitions | length == 0 %}
+    {#-- the rows only belong to new partitions (or there are none): there is nothing to overwrite --#}
+    insert into {{ target_relation }} ({{ dest_cols_csv }})
+    {%- else %}
+    insert /*+SET_VAR(dynamic_overwrite = {{ overwrite_type }})*/ overwrite {{ target_relation }}
+    {%- if partitions %} partition ({% for partition in partitions %}{{ adapter.quote(partition) }}{{ ", " if not loop.last }}{% endfor %}){% endif %} ({{ dest_cols_csv }})
+    {%- endif %}
     (
         select {{ dest_cols_csv }}
         from {{ temp_relation }}
+        {%- if filter is not none %}
+        where {{ filter }}
+        {%- endif %}
     )
 {%- endmacro -%}
 
-{%- macro get_insert_overwrite_into_sql(target_relation, temp_relation, dest_columns) -%}
+{%- macro get_insert_overwrite_into_sql(target_relation, temp_relation, dest_columns, partition_scoped=false) -%}
     {%- set dest_cols_csv = get_quoted_csv(dest_columns | map(attribute="name")) -%}
-    {%- do return(_get_strategy_sql(target_relation, temp_relation, dest_cols_csv, false)) -%}
+    {%- if not partition_scoped -%}
+        {#-- overwrites the whole table --#}
+        {%- do return(_get_strategy_sql(target_relation, temp_relation, dest_cols_csv, false)) -%}
+    {%- endif -%}
+
+    {%- set overwrite = adapter.get_overwrite_partitions(target_relation, temp_relation, config.get('partition_by')) -%}
+    {#-- the overwrite is never widened to the whole table, which would erase the other partitions --#}
+    {%- if overwrite.unresolved is not none -%}
+        {%- set msg -%}
+            {% if model.batch %}Batch {{ model.batch.id }} of {% endif %}{{ target_relation }} cannot be limited to the partitions of its rows: {{ overwrite.unresolved }}.
+            Partition-scoped overwrites require a table partitioned by a single column, and at most 1000 distinct non-NULL values of it per run.
+            {% if model.batch -%}
+            Set `microbatch_use_dynamic_overwrite: true` (StarRocks >= 3.4), or change `partition_by` or `batch_size`.
+            {%- else -%}
+            Use the `dynamic_overwrite` strategy (StarRocks >= 3.4), or set `partition_scoped_overwrite: false` to overwrite the whole table.
+            {%- endif %}
+        {%- endset -%}
+        {%- do exceptions.raise_compiler_error(msg) -%}
+    {%- endif -%}
+
+    {%- if overwrite.new_filter is not none -%}
+        {#-- rows of new partitions are inserted, then the other rows overwrite their existing partitions --#}
+        {%- call statement('insert_new_partitions') -%}
+            {{ _get_strategy_sql(target_relation, temp_relation, dest_cols_csv, false, [], overwrite.new_filter) }}
+        {%- endcall -%}
+    {%- endif -%}
+    {%- do return(_get_strategy_sql(target_relation, temp_relation, dest_cols_csv, false, overwrite.partitions, overwrite.existing_filter)) -%}
 {%- endmacro -%}
 
 {%- macro get_dynamic_overwrite_into_sql(target_relation, temp_relation, dest_columns) -%}
@@ -126,25 +261,40 @@
 
         {%- do starrocks__exchange_relation(target_relation, backup_relation) -%}
     {% else %}
-        {#-- Create the temp relation, either as a view or as a temp table --#}
-        {%- call statement('create_tmp_relation') -%}
-            {{ starrocks__create_table_as(True, tmp_relation, compiled_code, is_external) }}
-        {%- endcall -%}
+        {%- set is_upsert = incremental_strategy in ['upsert', 'merge', 'partial_update'] -%}
+        {%- if is_upsert -%}
+            {%- do starrocks__validate_upsert_target(existing_relation, is_external) -%}
+        {%- endif -%}
 
-        {%- do adapter.expand_target_column_types(
-            from_relation=tmp_relation,
-            to_relation=target_relation
-        ) -%}
-        {#-- Process schema changes. Returns dict of changes if successful. Use source columns for upserting/merging --#}
-        {%- set dest_columns = process_schema_changes(on_schema_change, tmp_relation, existing_relation) -%}
-        {%- if not dest_columns %}
+        {#-- Upserts write the model directly into the target, unless schema changes must be detected --#}
+        {%- if is_upsert and on_schema_change == 'ignore' -%}
+            {%- set source_relation = none -%}
             {%- set dest_columns = adapter.get_columns_in_relation(existing_relation) -%}
+        {%- else -%}
+            {#-- Create the temp relation, either as a view or as a temp table --#}
+            {%- call statement('create_tmp_relation') -%}
+                {{ starrocks__create_table_as(True, tmp_relation, compiled_code, is_external) }}
+            {%- endcall -%}
+            {%- set source_relation = tmp_relation -%}
+
+            {%- do adapter.expand_target_column_types(
+                from_relation=tmp_relation,
+                to_relation=target_relation
+            ) -%}
+            {#-- Process schema changes. Returns dict of changes if successful. Use source columns for upserting/merging --#}
+            {%- set dest_columns = process_schema_changes(on_schema_change, tmp_relation, existing_relation) -%}
+            {%- if not dest_columns %}
+                {%- set dest_columns = adapter.get_columns_in_relation(existing_relation) -%}
+            {%- endif -%}
+        {%- endif -%}
+        {%- if incremental_strategy == 'partial_update' -%}
+            {%- set dest_columns = starrocks__get_partial_update_columns(dest_columns) -%}
         {%- endif -%}
 
         {#-- Get the incremental_strategy, the macro to use for the strategy, and build the sql --#}
         {%- set incremental_predicates = config.get('predicates', none) or config.get('incremental_predicates', none) -%}
         {%- set strategy_sql_macro_func = adapter.get_incremental_strategy_macro(context, incremental_strategy) -%}
-        {%- set strategy_arg_dict = ({'target_relation': target_relation, 'temp_relation': tmp_relation, 'unique_key': keys, 'dest_columns': dest_columns, 'incremental_predicates': incremental_predicates }) -%}
+        {%- set strategy_arg_dict = ({'target_relation': target_relation, 'temp_relation': source_relation, 'unique_key': keys, 'dest_columns': dest_columns, 'incremental_predicates': incremental_predicates, 'sql': compiled_code }) -%}
 
         {%- call statement('main') -%}
             {{ strategy_sql_macro_func(strategy_arg_dict) }}
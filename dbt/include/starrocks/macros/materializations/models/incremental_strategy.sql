@@ -5,18 +5,39 @@
             {%- do exceptions.raise_compiler_error("The 'microbatch' incremental strategy requires the '" ~ key ~ "' configuration to be set.") -%}
         {%- endif -%}
     {%- endfor -%}
+    {#-- without dynamic overwrite, a batch overwriting the whole table would erase the rows of the other batches --#}
+    {%- if config.get('partition_scoped_overwrite') == false and not config.get('microbatch_use_dynamic_overwrite') -%}
+        {%- do exceptions.raise_compiler_error("The 'microbatch' incremental strategy does not support 'partition_scoped_overwrite: false': each batch would overwrite the whole table. Remove it, or set 'microbatch_use_dynamic_overwrite: true' (StarRocks >= 3.4).") -%}
+    {%- endif -%}
 {%- endmacro -%}
 
 {%- macro starrocks__validate_get_incremental_strategy(config) -%}
     {%- set strategy = config.get('incremental_strategy') or 'default' -%}
     {%- set invalid_strategy_msg -%}
         Invalid incremental strategy provided: {{ strategy }}
-        Expected one of: 'default', 'insert_overwrite', 'dynamic_overwrite', 'microbatch'
+        Expected one of: 'default', 'insert_overwrite', 'dynamic_overwrite', 'microbatch', 'upsert', 'merge', 'partial_update'
     {%- endset -%}
-    {%- if strategy not in ['default', 'insert_overwrite', 'dynamic_overwrite', 'microbatch'] -%}
+    {%- if strategy not in ['default', 'insert_overwrite', 'dynamic_overwrite', 'microbatch', 'upsert', 'merge', 'partial_update'] -%}
         {%- do exceptions.raise_compiler_error(invalid_strategy_msg) -%}
     {%- endif -%}
 
+    {%- if strategy in ['upsert', 'merge', 'partial_update'] -%}
+        {%- if not config.get('unique_key') -%}
+            {%- do exceptions.raise_compiler_error("The '" ~ strategy ~ "' incremental strategy requires the 'unique_key' configuration to be set.") -%}
+        {%- endif -%}
+        {%- if config.get('incremental_predicates') or config.get('predicates') -%}
+            {%- do exceptions.raise_compiler_error("The '" ~ strategy ~ "' incremental strategy does not support 'incremental_predicates'.") -%}
+        {%- endif -%}
+    {%- endif -%}
+
+    {%- if strategy == 'partial_update' -%}
+        {%- do starrocks__get_partial_update_column_names() -%}
+        {%- set partial_update_mode = config.get('partial_update_mode') -%}
+        {%- if partial_update_mode is not none and partial_update_mode not in ['auto', 'row', 'column'] -%}
+            {%- do exceptions.raise_compiler_error("Invalid partial_update_mode provided: " ~ partial_update_mode ~ ". Expected one of: 'auto', 'row', 'column'") -%}
+        {%- endif -%}
+    {%- endif -%}
+
     {%- if strategy == 'microbatch' -%}
         {%- do starrocks__validate_microbatch_config(config) -%}
     {%- endif -%}
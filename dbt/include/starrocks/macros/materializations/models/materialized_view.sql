@@ -16,6 +16,7 @@
     {%- set refresh_method = config.get('refresh_method', 'manual') -%}
 
     create materialized view {{ relation }}
+    comment '{{ starrocks__materialized_view_fingerprint(sql) }}'
 
     {%- if partition_by is not none -%}
         PARTITION BY (
@@ -62,7 +63,20 @@
     {% endcall %}
 {% endmacro %}
 
+{# The comment identifying a materialized view built from this query and layout, which cannot be altered. #}
+{% macro starrocks__materialized_view_fingerprint(sql) -%}
+    {%- set layout = [config.get('partition_by'), config.get('distributed_by'), config.get('buckets')] -%}
+    {{ return('dbt_fingerprint:' ~ local_md5(sql ~ layout | string)) }}
+{%- endmacro %}
+
 {% macro starrocks__get_materialized_view_configuration_changes(existing_relation, new_config) %}
+    {%- set changes = adapter.get_materialized_view_changes(
+        existing_relation,
+        starrocks__materialized_view_fingerprint(sql),
+        new_config.get('refresh_method', 'manual'),
+        new_config.get('properties')
+    ) -%}
+    {{ return(changes) }}
 {% endmacro %}
 
 {% macro starrocks__get_alter_materialized_view_as_sql(
@@ -74,6 +88,98 @@
     intermediate_relation
 ) %}
 
-    {{ starrocks__get_replace_materialized_view_as_sql(relation, sql, existing_relation, backup_relation, intermediate_relation) }}
+    {%- if configuration_changes.rebuild -%}
+        {{ starrocks__get_replace_materialized_view_as_sql(relation, sql, existing_relation, backup_relation, intermediate_relation) }}
+    {%- else -%}
+        {%- set statements = [] -%}
+        {%- if configuration_changes.refresh is not none -%}
+            {%- do statements.append("alter materialized view " ~ relation ~ " refresh " ~ configuration_changes.refresh) -%}
+        {%- endif -%}
+        {%- for key, value in configuration_changes.properties.items() -%}
+            {%- do statements.append("alter materialized view " ~ relation ~ ' set ("' ~ key ~ '" = "' ~ value ~ '")') -%}
+        {%- endfor -%}
+        {#-- the altered materialized view is refreshed as an unchanged one would be --#}
+        {%- set refresh_sql = starrocks__refresh_materialized_view(relation) | trim -%}
+        {%- if refresh_sql -%}
+            {%- do statements.append(refresh_sql) -%}
+        {%- endif -%}
+        {#-- the last statement is the main statement of the model --#}
+        {%- for statement_sql in statements[:-1] -%}
+            {%- do run_query(statement_sql) -%}
+        {%- endfor -%}
+        {{ statements[-1] }}
+    {%- endif -%}
+
+{% endmacro %}
+
+{#-- Asynchronous materialized views are refreshed by StarRocks, so they are only refreshed
+     by dbt when a refresh is requested: to wait for it, or to refresh a window of partitions. --#}
+{% macro starrocks__should_refresh_materialized_view() %}
+    {%- set refresh_method = config.get('refresh_method', 'manual') | lower -%}
+    {%- set refresh_requested = config.get('refresh_mode', 'async') != 'async'
+        or config.get('refresh_partition_start') is not none
+        or config.get('refresh_force') -%}
+    {{ return('async' not in refresh_method or refresh_requested) }}
+{% endmacro %}
+
+{% macro starrocks__refresh_materialized_view(relation) %}
+    {%- set partition_start = config.get('refresh_partition_start') -%}
+    {%- set partition_end = config.get('refresh_partition_end') -%}
+    {%- if (partition_start is none) != (partition_end is none) -%}
+        {{ exceptions.raise_compiler_error("'refresh_partition_start' and 'refresh_partition_end' must be set together") }}
+    {%- endif -%}
+    {%- if not starrocks__should_refresh_materialized_view() -%}
+        {{ return('') }}
+    {%- endif -%}
+    refresh materialized view {{ relation }}
+    {%- if partition_start is not none %} partition start ('{{ partition_start }}') end ('{{ partition_end }}'){% endif %}
+    {%- if config.get('refresh_force') %} force{% endif %}
+    {#-- with is_async, a sync refresh runs as a task and is polled like a submitted task --#}
+    {%- if config.get('refresh_mode') == 'sync' and not target.get('is_async') %} with sync mode{% endif %}
+{% endmacro %}
+
+{#
+  The default materialization, which also waits for the refresh of the
+  materialized view when `refresh_mode` is 'sync' or 'poll', so that the
+  downstream models read fresh data.
+#}
+{% materialization materialized_view, adapter='starrocks' %}
+    {% set existing_relation = load_cached_relation(this) %}
+    {% set target_relation = this.incorporate(type=this.MaterializedView) %}
+    {% set intermediate_relation = make_intermediate_relation(target_relation) %}
+    {% set backup_relation_type = target_relation.MaterializedView if existing_relation is none else existing_relation.type %}
+    {% set backup_relation = make_backup_relation(target_relation, backup_relation_type) %}
+    {% set refresh_mode = config.get('refresh_mode', 'async') %}
+
+    {%- if refresh_mode not in ['async', 'sync', 'poll'] -%}
+      {%- set msg -%}
+        Unknown refresh_mode: '{{ refresh_mode }}'. Valid options: 'async', 'sync', 'poll'
+      {%- endset %}
+      {{ exceptions.raise_compiler_error(msg) }}
+    {%- endif -%}
+
+    {#-- the latest refresh run, not to be mistaken for the one started by this model --#}
+    {% set refresh_marker = none %}
+    {% if existing_relation is not none and existing_relation.is_materialized_view and refresh_mode != 'async' %}
+        {% set refresh_marker = adapter.get_materialized_view_refresh_marker(existing_relation) %}
+    {% endif %}
+
+    {{ materialized_view_setup(backup_relation, intermediate_relation, pre_hooks) }}
+
+        {% set build_sql = materialized_view_get_build_sql(existing_relation, target_relation, backup_relation, intermediate_relation) %}
+
+        {% if build_sql == '' %}
+            {{ materialized_view_execute_no_op(target_relation) }}
+        {% else %}
+            {{ materialized_view_execute_build_sql(build_sql, existing_relation, target_relation, post_hooks) }}
+            {#-- a created materialized view is refreshed asynchronously, even in sync mode (as is any refresh with is_async) --#}
+            {% if refresh_mode != 'async' %}
+                {% do adapter.wait_for_materialized_view_refresh(target_relation, after=refresh_marker) %}
+            {% endif %}
+        {% endif %}
+
+    {{ materialized_view_teardown(backup_relation, intermediate_relation, post_hooks) }}
+
+    {{ return({'relations': [target_relation]}) }}
 
-{% endmacro %}
\ No newline at end of file
+{% endmaterialization %}
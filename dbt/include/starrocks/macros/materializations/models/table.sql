@@ -19,6 +19,7 @@
   {%- set engine = config.get('engine', 'OLAP') -%}
   {%- set indexs = config.get('indexs') -%}
   {%- set properties = config.get('properties') -%}
+  {%- do adapter.invalidate_column_cache(relation) -%}
 
   {{ sql_header if sql_header is not none }}
 
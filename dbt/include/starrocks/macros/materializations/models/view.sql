@@ -17,16 +17,34 @@
 {% macro starrocks__create_view_as(relation, sql) -%}
   {%- set sql_header = config.get('sql_header', none) -%}
   {%- set on_view_exists = config.get('on_view_exists', none) -%}
+  {%- set view_comment = '' -%}
+  {%- if config.get('view_change_detection') == 'fingerprint' -%}
+    {%- set view_comment = " comment '" ~ starrocks__view_fingerprint(sql) ~ "'" -%}
+  {%- endif -%}
+  {%- do adapter.invalidate_column_cache(relation) -%}
 
   {{ sql_header if sql_header is not none }}
 
   {%- if on_view_exists == 'replace' -%}
-    create or replace view {{ relation }} as {{ sql }};
+    create or replace view {{ relation }}{{ view_comment }} as {{ sql }};
   {%- else -%}
-    create view {{ relation }} as {{ sql }};
+    create view {{ relation }}{{ view_comment }} as {{ sql }};
   {%- endif -%}
 {%- endmacro %}
 
+{# Return the fingerprint stored in the comment of a view built from this SQL.
+   It covers the SQL and the config of the view DDL, so changing either rebuilds the view. #}
+{% macro starrocks__view_fingerprint(sql) -%}
+  {%- set ddl_inputs = {
+    'sql_header': config.get('sql_header', none),
+    'sql': sql,
+    'properties': config.get('properties', none),
+    'security': config.get('security', none),
+    'comment': model.get('description') if config.persist_relation_docs() else none,
+  } -%}
+  {{ return('dbt_fingerprint:' ~ local_md5(tojson(ddl_inputs, sort_keys=True))) }}
+{%- endmacro %}
+
 {# Return the engine-stored definition for a view, or none if it is absent. #}
 {% macro starrocks__stored_view_definition_internal(relation) -%}
   {%- set query -%}
@@ -76,6 +94,14 @@
   {%- set sql = model['compiled_code'] -%}
   {%- set on_view_exists = config.get('on_view_exists', none) -%}
   {%- set grant_config = config.get('grants') -%}
+  {%- set view_change_detection = config.get('view_change_detection', 'definition') -%}
+
+  {%- if view_change_detection not in ['definition', 'fingerprint'] -%}
+    {%- set msg -%}
+      Unknown view_change_detection: '{{ view_change_detection }}'. Valid options: 'definition', 'fingerprint'
+    {%- endset %}
+    {{ exceptions.raise_compiler_error(msg) }}
+  {%- endif -%}
 
   {{ run_hooks(pre_hooks) }}
 
@@ -103,25 +129,36 @@
     {%- endcall -%}
 
   {%- else -%}
-    {#
-      Skip-when-unchanged, on every StarRocks version. Build the candidate under
-      a temporary name and let the server canonicalize it, then compare its
-      stored definition against the existing view.
-    #}
-    {%- set intermediate_relation = make_intermediate_relation(target_relation) -%}
-    {{ drop_relation_if_exists(load_cached_relation(intermediate_relation)) }}
+    {%- if view_change_detection == 'fingerprint' and starrocks__is_internal_catalog() -%}
+      {#
+        Compare the fingerprint of the compiled SQL with the one stored in the
+        comment of the existing view: one metadata query and no DDL.
+      #}
+      {%- set unchanged = starrocks__get_relation_comment(existing_relation) == starrocks__view_fingerprint(sql) -%}
 
-    {%- call statement('main') -%}
-      {{ starrocks__create_view_as(intermediate_relation, sql) }}
-    {%- endcall -%}
+    {%- else -%}
+      {#
+        Skip-when-unchanged, on every StarRocks version. Build the candidate under
+        a temporary name and let the server canonicalize it, then compare its
+        stored definition against the existing view.
+      #}
+      {%- set intermediate_relation = make_intermediate_relation(target_relation) -%}
+      {{ drop_relation_if_exists(load_cached_relation(intermediate_relation)) }}
+
+      {%- call statement('main') -%}
+        {{ starrocks__create_view_as(intermediate_relation, sql) }}
+      {%- endcall -%}
+
+      {%- set existing_def = starrocks__stored_view_definition(existing_relation) -%}
+      {%- set candidate_def = starrocks__stored_view_definition(intermediate_relation) -%}
 
-    {%- set existing_def = starrocks__stored_view_definition(existing_relation) -%}
-    {%- set candidate_def = starrocks__stored_view_definition(intermediate_relation) -%}
+      {# The candidate was only needed for comparison #}
+      {{ drop_relation_if_exists(intermediate_relation) }}
 
-    {# The candidate was only needed for comparison #}
-    {{ drop_relation_if_exists(intermediate_relation) }}
+      {%- set unchanged = existing_def is not none and existing_def == candidate_def -%}
+    {%- endif -%}
 
-    {%- if existing_def is not none and existing_def == candidate_def -%}
+    {%- if unchanged -%}
       {# Unchanged: leave the existing view in place. #}
       {{ store_raw_result(name="main", message="skip " ~ target_relation, code="skip", rows_affected="-1") }}
 
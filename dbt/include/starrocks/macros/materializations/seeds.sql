@@ -40,7 +40,97 @@
   {% call statement('_') -%}
     {{ sql }}
   {%- endcall %}
+  {% do adapter.invalidate_column_cache(this) %}
 
   {{ return(sql) }}
 
 {%- endmacro %}
+
+{% macro starrocks__load_csv_rows(model, agate_table) -%}
+  {%- set load_method = config.get('load_method', 'insert') -%}
+
+  {%- if load_method == 'insert' -%}
+    {{ return(default__load_csv_rows(model, agate_table)) }}
+  {%- elif load_method != 'stream_load' -%}
+    {%- set msg -%}
+      Unknown load_method: '{{ load_method }}'. Valid options: 'insert', 'stream_load'
+    {%- endset %}
+    {{ exceptions.raise_compiler_error(msg) }}
+  {%- endif -%}
+
+  {%- set batch_size = config.get('stream_load_batch_size', 100000) -%}
+  {%- set response = adapter.stream_load_csv_rows(this, agate_table, batch_size) -%}
+  {%- do store_result('load_csv_rows', response=response) -%}
+
+  {{ return("-- stream load " ~ response.rows_loaded ~ " rows into " ~ this.render()) }}
+{%- endmacro %}
+
+{#
+  Same flow as the default seed materialization. When the rows were sent
+  through Stream Load, its response (with the loaded and filtered row counts)
+  replaces the generic one as the result of the node.
+#}
+{% materialization seed, adapter='starrocks' %}
+
+  {%- set identifier = model['alias'] -%}
+  {%- set full_refresh_mode = (should_full_refresh()) -%}
+
+  {%- set old_relation = adapter.get_relation(database=database, schema=schema, identifier=identifier) -%}
+
+  {%- set exists_as_table = (old_relation is not none and old_relation.is_table) -%}
+  {%- set exists_as_view = (old_relation is not none and old_relation.is_view) -%}
+
+  {%- set grant_config = config.get('grants') -%}
+  {%- set agate_table = load_agate_table() -%}
+
+  {%- do store_result('agate_table', response='OK', agate_table=agate_table) -%}
+
+  {{ run_hooks(pre_hooks, inside_transaction=False) }}
+
+  {{ run_hooks(pre_hooks, inside_transaction=True) }}
+
+  {% set create_table_sql = "" %}
+  {% if exists_as_view %}
+    {{ exceptions.raise_compiler_error("Cannot seed to '{}', it is a view".format(old_relation.render())) }}
+  {% elif exists_as_table %}
+    {% set create_table_sql = reset_csv_table(model, full_refresh_mode, old_relation, agate_table) %}
+  {% else %}
+    {% set create_table_sql = create_csv_table(model, agate_table) %}
+  {% endif %}
+
+  {% set code = 'CREATE' if full_refresh_mode else 'INSERT' %}
+  {% set rows_affected = (agate_table.rows | length) %}
+  {% set sql = "" %}
+  {% if rows_affected > 0 %}
+    {% set sql = load_csv_rows(model, agate_table) %}
+  {% endif %}
+
+  {% call noop_statement('main', code ~ ' ' ~ rows_affected, code, rows_affected) %}
+    {{ get_csv_sql(create_table_sql, sql) }};
+  {% endcall %}
+
+  {%- set stream_load_result = load_result('load_csv_rows') -%}
+  {%- if stream_load_result is not none -%}
+    {%- do store_result('main', response=stream_load_result.response) -%}
+  {%- endif -%}
+
+  {% set target_relation = this.incorporate(type='table') %}
+
+  {% set should_revoke = should_revoke(old_relation, full_refresh_mode) %}
+  {% do apply_grants(target_relation, grant_config, should_revoke=should_revoke) %}
+
+  {% do persist_docs(target_relation, model) %}
+
+  {% if full_refresh_mode or not exists_as_table %}
+    {% do create_indexes(target_relation) %}
+  {% endif %}
+
+  {{ run_hooks(post_hooks, inside_transaction=True) }}
+
+  {{ adapter.commit() }}
+
+  {{ run_hooks(post_hooks, inside_transaction=False) }}
+
+  {{ return({'relations': [target_relation]}) }}
+
+{% endmaterialization %}
@@ -26,6 +26,21 @@
 
   {%- set strategy_name = config.get('strategy') -%}
   {%- set unique_key = config.get('unique_key') %}
+  {%- set merge_method = config.get('snapshot_merge_method', 'update') -%}
+
+  {%- if merge_method not in ['update', 'upsert'] -%}
+    {%- set msg -%}
+      Unknown snapshot_merge_method: '{{ merge_method }}'. Valid options: 'update', 'upsert'
+    {%- endset %}
+    {{ exceptions.raise_compiler_error(msg) }}
+  {%- elif merge_method == 'upsert' and not starrocks__supports_partial_update() -%}
+    {#-- closes are partial updates, which reset the other columns of the closed rows before --#}
+    {%- set msg -%}
+      [snapshot_merge_method] 'upsert' is only available from version {{ starrocks__partial_update_min_version() }} onwards, current version is {{ adapter.current_version() }}
+    {%- endset %}
+    {{ exceptions.raise_compiler_error(msg) }}
+  {%- endif -%}
+  {%- do starrocks__validate_snapshot_hash_function(config.get('snapshot_hash_function', 'md5')) -%}
 
   {% if not adapter.check_schema_exists(model.database, model.schema) %}
     {% do create_schema(model.database, model.schema) %}
@@ -51,6 +66,9 @@
   {% if not target_relation_exists %}
 
       {% set build_sql = build_snapshot_table(strategy, model['compiled_sql']) %}
+      {% if merge_method == 'upsert' %}
+          {% set build_sql = starrocks__snapshot_upsert_build_sql(build_sql) %}
+      {% endif %}
       {% set final_sql = create_table_as(False, target_relation, build_sql) %}
 
       {% call statement('main') %}
@@ -88,12 +106,38 @@
         {% do quoted_source_columns.append(adapter.quote(column.name)) %}
       {% endfor %}
 
-      {% set final_sql_update = starrocks__snapshot_merge_sql_update(
-            target = target_relation,
-            source = staging_table,
-            insert_cols = quoted_source_columns
-         )
-      %}
+      {% if merge_method == 'upsert' and starrocks__get_table_model(target_relation) != 'PRIMARY_KEYS' %}
+          {% do exceptions.warn("Snapshot " ~ target_relation ~ " is not a primary key table: it is merged with an update. Rebuild it to use snapshot_merge_method 'upsert'.") %}
+          {% set merge_method = 'update' %}
+      {% endif %}
+
+      {%- set keys = config.get('keys') or [] -%}
+      {%- set keys = [keys] if keys is string else keys -%}
+      {% if merge_method == 'upsert' %}
+          {#-- closes and inserts are both upserts on dbt_scd_id: the target is never scanned --#}
+          {% set final_sql_update = starrocks__snapshot_upsert_sql_close(
+                target = target_relation,
+                source = staging_table
+             )
+          %}
+      {% elif target.get('is_async') and keys and 'dbt_valid_to' not in keys
+              and starrocks__supports_partial_update()
+              and starrocks__get_table_model(target_relation) == 'PRIMARY_KEYS' %}
+          {#-- submitted as a task, unlike an UPDATE; a partial update only keeps the other columns from 3.3.0 --#}
+          {% set final_sql_update = starrocks__snapshot_merge_sql_close(
+                target = target_relation,
+                source = staging_table,
+                keys = keys
+             )
+          %}
+      {% else %}
+          {% set final_sql_update = starrocks__snapshot_merge_sql_update(
+                target = target_relation,
+                source = staging_table,
+                insert_cols = quoted_source_columns
+             )
+          %}
+      {% endif %}
 
       {% set final_sql_insert = starrocks__snapshot_merge_sql_insert(
             target = target_relation,
@@ -22,6 +22,17 @@
     and {{ target }}.dbt_valid_to is null
 {% endmacro %}
 
+{#-- With is_async: UPDATE cannot be submitted as a task, the same close is a partial update of a primary key table --#}
+{% macro starrocks__snapshot_merge_sql_close(target, source, keys) -%}
+    insert into {{ target }} ({{ keys | join(', ') }}, dbt_valid_to)
+    select {% for key in keys %}DBT_INTERNAL_TARGET.{{ key }}, {% endfor %}DBT_INTERNAL_SOURCE.dbt_valid_to
+    from {{ target }} as DBT_INTERNAL_TARGET
+    join (select dbt_scd_id, dbt_change_type, dbt_valid_to from {{ source }}) as DBT_INTERNAL_SOURCE
+    on DBT_INTERNAL_SOURCE.dbt_scd_id = DBT_INTERNAL_TARGET.dbt_scd_id
+    where DBT_INTERNAL_SOURCE.dbt_change_type = 'update'
+    and DBT_INTERNAL_TARGET.dbt_valid_to is null
+{% endmacro %}
+
 {% macro starrocks__snapshot_merge_sql_insert(target, source, insert_cols) -%}
     {%- set insert_cols_csv = insert_cols | join(', ') -%}
 
@@ -32,3 +43,20 @@
     from {{ source }} as DBT_INTERNAL_SOURCE
     where DBT_INTERNAL_SOURCE.dbt_change_type = 'insert'
 {% endmacro %}
+
+{#-- With snapshot_merge_method='upsert', the target is a primary key table on dbt_scd_id --#}
+{% macro starrocks__snapshot_upsert_sql_close(target, source) -%}
+    {#-- a partial update: only dbt_valid_to is written, the other columns of the closed rows are kept --#}
+    insert into {{ target }} (dbt_scd_id, dbt_valid_to)
+    select DBT_INTERNAL_SOURCE.dbt_scd_id, DBT_INTERNAL_SOURCE.dbt_valid_to
+    from {{ source }} as DBT_INTERNAL_SOURCE
+    where DBT_INTERNAL_SOURCE.dbt_change_type = 'update'
+{% endmacro %}
+
+{% macro starrocks__snapshot_upsert_build_sql(sql) -%}
+    {#-- the primary key must be the first column of the table --#}
+    {%- set columns = get_columns_in_query(sql) | reject('equalto', 'dbt_scd_id') | list -%}
+    select dbt_scd_id
+    {%- for column in columns -%}, {{ adapter.quote(column) }}{%- endfor %}
+    from ({{ sql }}) as snapshot_query
+{% endmacro %}
@@ -15,8 +15,32 @@
  */
 
 {% macro starrocks__snapshot_hash_arguments(args) -%}
+    {%- set hash_function = config.get('snapshot_hash_function', 'md5') -%}
+    {%- if hash_function == 'md5' -%}
     md5(concat_ws('|', {%- for arg in args -%}
         coalesce(cast({{ arg }} as char), '')
         {% if not loop.last %}, {% endif %}
     {%- endfor -%}))
+    {%- else -%}
+    {#-- the native hashes take each argument separately, and return an integer --#}
+    {{ hash_function }}({%- for arg in args -%}
+        coalesce(cast({{ arg }} as varchar), '')
+        {% if not loop.last %}, {% endif %}
+    {%- endfor -%})
+    {%- endif -%}
+{%- endmacro %}
+
+{% macro starrocks__validate_snapshot_hash_function(hash_function) -%}
+    {%- set min_versions = {'md5': none, 'xx_hash3_64': '3.2.2', 'xx_hash3_128': '3.4.0'} -%}
+    {%- if hash_function not in min_versions -%}
+        {%- set msg -%}
+            Unknown snapshot_hash_function: '{{ hash_function }}'. Valid options: 'md5', 'xx_hash3_64', 'xx_hash3_128'
+        {%- endset %}
+        {{ exceptions.raise_compiler_error(msg) }}
+    {%- elif min_versions[hash_function] is not none and adapter.is_before_version(min_versions[hash_function]) -%}
+        {%- set msg -%}
+            [snapshot_hash_function] '{{ hash_function }}' is only available from version {{ min_versions[hash_function] }} onwards, current version is {{ adapter.current_version() }}
+        {%- endset %}
+        {{ exceptions.raise_compiler_error(msg) }}
+    {%- endif -%}
 {%- endmacro %}
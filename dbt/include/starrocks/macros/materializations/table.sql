@@ -53,7 +53,31 @@
   {{ run_hooks(pre_hooks) }}
   
   {%- if existing_relation is not none -%}
-    {%- if should_full_refresh() or on_table_exists == 'replace' -%}
+    {%- if on_table_exists == 'swap' and existing_relation.is_table -%}
+      {%- if is_external -%}
+        {%- set msg -%}
+          on_table_exists 'swap' is not supported for external tables
+        {%- endset %}
+        {{ exceptions.raise_compiler_error(msg) }}
+      {%- endif -%}
+      {#-- Build the new table aside, then swap it with the existing one: the table is never missing --#}
+      {%- set backup_relation = existing_relation.incorporate(path={"identifier": existing_relation.identifier ~ "__dbt_backup"}) -%}
+      {{ log("Building " ~ backup_relation ~ " and swapping it with " ~ target_relation, info=True) }}
+      {%- do adapter.drop_relation(backup_relation) -%}
+      {% call statement('main') -%}
+        {{ starrocks__create_table_as(false, backup_relation, sql, is_external) }}
+      {%- endcall %}
+      {%- do starrocks__exchange_relation(target_relation, backup_relation) -%}
+
+      {{ run_hooks(post_hooks) }}
+
+      {#-- The old table is dropped last, once the new one is ready: dropping a table only moves
+           it to the recycle bin, and its data is deleted in the background --#}
+      {%- do adapter.drop_relation(backup_relation) -%}
+
+      {{ return({'relations': [target_relation]}) }}
+
+    {%- elif should_full_refresh() or on_table_exists in ['replace', 'swap'] -%}
       {{ log("Dropping and recreating table", info=True) }}
       {{ adapter.drop_relation(existing_relation) }}
       {%- set existing_relation = none -%}
@@ -71,7 +95,7 @@
     {%- else -%}
       {%- set msg -%}
         Unknown on_table_exists strategy: '{{ on_table_exists }}'.
-        Valid options: 'replace', 'append', 'ignore'
+        Valid options: 'replace', 'swap', 'append', 'ignore'
       {%- endset %}
       {{ exceptions.raise_compiler_error(msg) }}
     {%- endif -%}
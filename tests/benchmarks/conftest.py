@@ -0,0 +1,110 @@
+"""
+Benchmarks of the adapter overhead, against the fake FE of `fake_frontend`.
+
+Run them with `python -m pytest tests/benchmarks`. Each benchmark reports the
+median of its rounds, and fails when it is more than
+`STARROCKS_BENCHMARK_TOLERANCE` (default 2) times slower than its baseline in
+`baselines.json`. Run with `STARROCKS_BENCHMARK_SAVE=1` to record the
+current medians as the new baselines.
+"""
+
+import json
+import os
+import statistics
+import time
+from typing import Callable, Dict
+
+import pytest
+from dbt_common.context import set_invocation_context
+
+from fake_frontend import FakeFrontend
+
+BASELINES_FILE = os.path.join(os.path.dirname(__file__), "baselines.json")
+SAVE_BASELINES = os.environ.get("STARROCKS_BENCHMARK_SAVE") == "1"
+TOLERANCE = float(os.environ.get("STARROCKS_BENCHMARK_TOLERANCE", "2"))
+
+RESULTS: Dict[str, float] = {}
+
+
+def _load_baselines() -> Dict[str, float]:
+    if not os.path.exists(BASELINES_FILE):
+        return {}
+    with open(BASELINES_FILE) as f:
+        return json.load(f)
+
+
+BASELINES = _load_baselines()
+
+
+@pytest.fixture(scope="session")
+def fake_frontend():
+    with FakeFrontend() as frontend:
+        yield frontend
+
+
+@pytest.fixture(scope="session", autouse=True)
+def invocation_context():
+    # Set by the dbt CLI, and needed by the thread pool of `get_catalog`.
+    set_invocation_context(os.environ)
+
+
+@pytest.fixture(scope="class")
+def dbt_profile_target(fake_frontend):
+    return {
+        "type": "starrocks",
+        "host": "127.0.0.1",
+        "port": fake_frontend.port,
+        "username": "root",
+        "password": "",
+        "is_async": True,
+        "poll_interval": 0,
+    }
+
+
+@pytest.fixture
+def benchmark(request) -> Callable:
+    """
+    Time a function: one warm-up call, then the median of `rounds` calls.
+
+    The median is compared to the baseline of the benchmark, named after the
+    test, and the result of the last call is returned.
+    """
+    name = request.node.name
+
+    def run(fn: Callable, rounds: int = 5):
+        result = fn()
+        durations = []
+        for _ in range(rounds):
+            start = time.perf_counter()
+            result = fn()
+            durations.append(time.perf_counter() - start)
+
+        median = statistics.median(durations)
+        RESULTS[name] = median
+        baseline = BASELINES.get(name)
+        if not SAVE_BASELINES and baseline is not None:
+            assert median <= baseline * TOLERANCE, (
+                f"{name} took {median * 1000:.1f} ms, "
+                f"more than {TOLERANCE} times its baseline of {baseline * 1000:.1f} ms"
+            )
+        return result
+
+    return run
+
+
+def pytest_terminal_summary(terminalreporter):
+    if not RESULTS:
+        return
+    terminalreporter.section("benchmarks (median)")
+    for name, median in sorted(RESULTS.items()):
+        baseline = BASELINES.get(name)
+        ratio = f"{median / baseline:.2f}x baseline" if baseline else "no baseline"
+        terminalreporter.write_line(f"{name:<70} {median * 1000:>10.2f} ms  {ratio}")
+
+
+def pytest_sessionfinish(session):
+    if SAVE_BASELINES and RESULTS:
+        baselines = {**BASELINES, **{name: round(median, 6) for name, median in RESULTS.items()}}
+        with open(BASELINES_FILE, "w") as f:
+            json.dump(dict(sorted(baselines.items())), f, indent=2)
+            f.write("\n")
@@ -0,0 +1,291 @@
+"""
+A local stand-in for the StarRocks FE, speaking the MySQL protocol.
+
+It serves a scripted catalog, so the adapter can be benchmarked without a
+cluster: `information_schema.tables`, `information_schema.columns`, `desc`,
+`current_version()` and `information_schema.task_runs` are answered from
+generated schemas, and every other statement succeeds without effect.
+
+Schemas are named `bench_<n>` and hold `n` tables of `COLUMNS_PER_TABLE`
+columns each, e.g. `bench_1000`. A task submitted for a statement mentioning
+`polls_<n>`, e.g. `insert into polls_100 ...`, is reported as RUNNING for `n`
+polls, then as SUCCESS.
+"""
+
+import multiprocessing
+import re
+import socketserver
+import struct
+import threading
+from typing import Dict, List, Optional, Sequence, Tuple
+
+SERVER_VERSION = "8.0.33"
+STARROCKS_VERSION = "3.4.0-bench"
+COLUMNS_PER_TABLE = 5
+COLUMN_TYPES = ("bigint", "varchar", "datetime", "decimal", "boolean")
+
+# Capability flags: long password, found rows, long flag, connect with db,
+# protocol 41, transactions, secure connection, multi results, plugin auth.
+CAPABILITIES = 0x1 | 0x2 | 0x4 | 0x8 | 0x200 | 0x2000 | 0x8000 | 0x20000 | 0x80000
+STATUS_AUTOCOMMIT = 0x0002
+CHARSET_UTF8 = 33
+CHARSET_BINARY = 63
+TYPE_LONGLONG = 0x08
+TYPE_VAR_STRING = 0xFD
+
+COM_QUIT = 0x01
+COM_QUERY = 0x03
+
+SCHEMA_PATTERN = re.compile(r"table_schema\s*(?:=\s*'(\w+)'|in\s*\(([^)]*)\))", re.IGNORECASE)
+TABLE_NAME_PATTERN = re.compile(r"table_name\s*=\s*'(\w+)'", re.IGNORECASE)
+TASK_NAME_PATTERN = re.compile(r"task_name\s*(?:=\s*'(\w+)'|in\s*\(([^)]*)\))", re.IGNORECASE)
+SUBMIT_PATTERN = re.compile(r"submit\s+/\*.*?\*/\s*task\s+(\w+)", re.IGNORECASE | re.DOTALL)
+POLLS_PATTERN = re.compile(r"polls_(\d+)")
+VARIABLE_PATTERN = re.compile(r"select @@[\w.]+", re.IGNORECASE)
+DESC_PATTERN = re.compile(r"^\s*desc\s+`?(\w+)`?\.`?(\w+)`?", re.IGNORECASE)
+
+Rows = List[Tuple]
+ResultSet = Tuple[Sequence[str], Rows]
+
+
+def _lenenc_int(value: int) -> bytes:
+    if value < 251:
+        return struct.pack("<B", value)
+    if value < 2 ** 16:
+        return b"\xfc" + struct.pack("<H", value)
+    if value < 2 ** 24:
+        return b"\xfd" + struct.pack("<I", value)[:3]
+    return b"\xfe" + struct.pack("<Q", value)
+
+
+def _lenenc_str(value: bytes) -> bytes:
+    return _lenenc_int(len(value)) + value
+
+
+def _ok(affected_rows: int = 0) -> bytes:
+    return b"\x00" + _lenenc_int(affected_rows) + _lenenc_int(0) + struct.pack("<HH", STATUS_AUTOCOMMIT, 0)
+
+
+def _eof() -> bytes:
+    return b"\xfe" + struct.pack("<HH", 0, STATUS_AUTOCOMMIT)
+
+
+def _column_definition(name: str, is_int: bool) -> bytes:
+    return b"".join([
+        _lenenc_str(b"def"), _lenenc_str(b""), _lenenc_str(b""), _lenenc_str(b""),
+        _lenenc_str(name.encode()), _lenenc_str(name.encode()),
+        b"\x0c",
+        struct.pack("<HIBHB", CHARSET_BINARY if is_int else CHARSET_UTF8, 1024,
+                    TYPE_LONGLONG if is_int else TYPE_VAR_STRING, 0, 0),
+        b"\x00\x00",
+    ])
+
+
+def _result_set(columns: Sequence[str], rows: Rows) -> List[bytes]:
+    """The payloads of a text protocol result set."""
+    is_int = [any(isinstance(row[i], int) and not isinstance(row[i], bool) for row in rows[:1])
+              for i in range(len(columns))]
+    payloads = [_lenenc_int(len(columns))]
+    payloads.extend(_column_definition(name, is_int[i]) for i, name in enumerate(columns))
+    payloads.append(_eof())
+    for row in rows:
+        payloads.append(b"".join(
+            b"\xfb" if value is None else _lenenc_str(str(value).encode()) for value in row))
+    payloads.append(_eof())
+    return payloads
+
+
+class Catalog:
+    """The generated schemas, and the submitted tasks."""
+
+    def __init__(self):
+        self.tasks: Dict[str, int] = {}
+        self.lock = threading.Lock()
+
+    @staticmethod
+    def table_count(schema: str) -> int:
+        match = re.fullmatch(r"bench_(\d+)", schema)
+        return int(match.group(1)) if match else 0
+
+    def tables(self, schema: str) -> List[str]:
+        return [f"table_{i}" for i in range(self.table_count(schema))]
+
+    def has_table(self, schema: str, table: str) -> bool:
+        match = re.fullmatch(r"table_(\d+)", table)
+        return match is not None and int(match.group(1)) < self.table_count(schema)
+
+    @staticmethod
+    def columns() -> List[Tuple[str, str]]:
+        return [(f"column_{i}", COLUMN_TYPES[i % len(COLUMN_TYPES)]) for i in range(COLUMNS_PER_TABLE)]
+
+    def submit(self, task_id: str, polls: int) -> None:
+        with self.lock:
+            self.tasks[task_id] = polls
+
+    def poll(self, task_id: str) -> Optional[str]:
+        with self.lock:
+            remaining = self.tasks.get(task_id)
+            if remaining is None:
+                return None
+            self.tasks[task_id] = remaining - 1
+            return "RUNNING" if remaining > 0 else "SUCCESS"
+
+
+def _quoted_names(single: Optional[str], many: Optional[str]) -> List[str]:
+    if single:
+        return [single]
+    return re.findall(r"'(\w+)'", many or "")
+
+
+def answer(catalog: Catalog, sql: str) -> Optional[ResultSet]:
+    """The result set of a statement, or None for a statement without one."""
+    lowered = sql.lower()
+
+    if "current_version()" in lowered:
+        return ["current_version()"], [(STARROCKS_VERSION,)]
+
+    match = VARIABLE_PATTERN.match(sql)
+    if match:
+        return [match.group(0)[len("select "):]], [("",)]
+
+    match = DESC_PATTERN.search(sql.split("*/")[-1])
+    if match:
+        return ["Field", "Type", "Null", "Key", "Default", "Extra"], [
+            (name, data_type, "YES", "false", None, "") for name, data_type in catalog.columns()]
+
+    match = SUBMIT_PATTERN.search(sql)
+    if match:
+        polls = POLLS_PATTERN.search(sql)
+        catalog.submit(match.group(1), int(polls.group(1)) if polls else 0)
+        return ["TaskName", "Status"], [(match.group(1), "SUBMITTED")]
+
+    if "information_schema.task_runs" in lowered:
+        task_ids = _quoted_names(*TASK_NAME_PATTERN.search(sql).groups())
+        states = [(task_id, catalog.poll(task_id)) for task_id in task_ids]
+        states = [(task_id, state) for task_id, state in states if state is not None]
+        if "select task_name" in lowered:
+            return ["task_name", "state", "error_message", "progress"], [
+                (task_id, state, None, "50%") for task_id, state in states]
+        return ["state", "error_message", "progress"], [(state, None, "50%") for _, state in states]
+
+    match = SCHEMA_PATTERN.search(sql)
+    if match is None:
+        return None
+    schemas = _quoted_names(*match.groups())
+    columns = catalog.columns()
+
+    if "with tables as" in lowered:
+        return ["table_database", "table_schema", "table_name", "table_type", "table_comment",
+                "table_owner", "column_name", "column_index", "column_type", "column_comment"], [
+            (None, schema, table, "table", None, None, name, index, data_type, None)
+            for schema in schemas for table in catalog.tables(schema)
+            for index, (name, data_type) in enumerate(columns, start=1)]
+
+    if "information_schema.tables" in lowered:
+        return ["database", "name", "schema", "table_type"], [
+            (None, table, schema, "table") for schema in schemas for table in catalog.tables(schema)]
+
+    if "information_schema.columns" in lowered:
+        table = TABLE_NAME_PATTERN.search(sql)
+        if table is not None:
+            return ["column_name", "data_type", "character_maximum_length", "numeric_precision",
+                    "numeric_scale"], [
+                (name, data_type, None, None, None)
+                for schema in schemas if catalog.has_table(schema, table.group(1))
+                for name, data_type in columns]
+        return ["table_name", "column_name", "data_type", "character_maximum_length", "numeric_precision",
+                "numeric_scale"], [
+            (table, name, data_type, None, None, None)
+            for schema in schemas for table in catalog.tables(schema) for name, data_type in columns]
+
+    return None
+
+
+class FrontendHandler(socketserver.BaseRequestHandler):
+    server: "FrontendServer"
+
+    def setup(self):
+        self.sequence = 0
+        self.reader = self.request.makefile("rb")
+
+    def finish(self):
+        self.reader.close()
+
+    def send(self, payloads: List[bytes]) -> None:
+        packets = []
+        for payload in payloads:
+            packets.append(struct.pack("<I", len(payload))[:3] + bytes([self.sequence]) + payload)
+            self.sequence = (self.sequence + 1) % 256
+        self.request.sendall(b"".join(packets))
+
+    def receive(self) -> Optional[bytes]:
+        header = self.reader.read(4)
+        if len(header) < 4:
+            return None
+        length = int.from_bytes(header[:3], "little")
+        self.sequence = (header[3] + 1) % 256
+        return self.reader.read(length)
+
+    def handle(self):
+        salt = b"0123456789abcdefghij"
+        self.send([b"".join([
+            b"\x0a", SERVER_VERSION.encode(), b"\x00",
+            struct.pack("<I", threading.get_ident() & 0xFFFFFFFF),
+            salt[:8], b"\x00",
+            struct.pack("<HBHH", CAPABILITIES & 0xFFFF, CHARSET_UTF8, STATUS_AUTOCOMMIT, CAPABILITIES >> 16),
+            bytes([len(salt) + 1]), b"\x00" * 10,
+            salt[8:], b"\x00",
+            b"mysql_native_password\x00",
+        ])])
+        # Any user and password are accepted.
+        if self.receive() is None:
+            return
+        self.send([_ok()])
+
+        while True:
+            packet = self.receive()
+            if not packet or packet[0] == COM_QUIT:
+                return
+            if packet[0] != COM_QUERY:
+                self.send([_ok()])
+                continue
+            result = answer(self.server.catalog, packet[1:].decode())
+            self.send([_ok()] if result is None else _result_set(*result))
+
+
+class FrontendServer(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self, catalog: Catalog):
+        super().__init__(("127.0.0.1", 0), FrontendHandler)
+        self.catalog = catalog
+
+
+def _serve(ports: "multiprocessing.Queue") -> None:
+    server = FrontendServer(Catalog())
+    ports.put(server.server_address[1])
+    server.serve_forever()
+
+
+class FakeFrontend:
+    """
+    Run the fake FE in a child process, so serving queries does not compete
+    with the benchmarked adapter for the GIL.
+    """
+
+    def __init__(self):
+        self.port: Optional[int] = None
+        self._process: Optional[multiprocessing.Process] = None
+
+    def __enter__(self) -> "FakeFrontend":
+        ports: multiprocessing.Queue = multiprocessing.Queue()
+        self._process = multiprocessing.Process(target=_serve, args=(ports,), daemon=True)
+        self._process.start()
+        self.port = ports.get(timeout=30)
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        if self._process is not None:
+            self._process.terminate()
+            self._process.join()
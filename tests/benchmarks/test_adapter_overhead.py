@@ -0,0 +1,100 @@
+from types import SimpleNamespace
+
+import agate
+import pytest
+
+# Number of relations of the benchmarked schema, or rows of the benchmarked seed.
+SCALES = [10, 1000, 10000]
+# Number of polls before a submitted task is finished.
+POLLS = [10, 100, 1000]
+# Number of relations whose columns are looked up.
+COLUMN_LOOKUPS = 10
+
+
+def _rounds(scale: int) -> int:
+    return 3 if scale >= 10000 else 5
+
+
+def _relation_config(schema: str, identifier: str):
+    return SimpleNamespace(database=None, schema=schema, identifier=identifier, name=identifier,
+                           quoting_dict={}, config={}, resource_type="model")
+
+
+class TestMetadataBenchmarks:
+    @pytest.mark.parametrize("scale", SCALES)
+    def test_list_relations_without_caching(self, adapter, benchmark, scale):
+        schema_relation = adapter.Relation.create(schema=f"bench_{scale}")
+
+        with adapter.connection_named("benchmark"):
+            relations = benchmark(lambda: adapter.list_relations_without_caching(schema_relation), _rounds(scale))
+
+        assert len(relations) == scale
+
+    @pytest.mark.parametrize("column_cache", [False, True], ids=["uncached", "cached"])
+    @pytest.mark.parametrize("scale", SCALES)
+    def test_get_columns_in_relation(self, adapter, benchmark, monkeypatch, scale, column_cache):
+        monkeypatch.setattr(adapter.config.credentials, "column_cache", column_cache)
+        schema = f"bench_{scale}"
+        # the relations cache is populated at the start of an invocation
+        adapter.cache.clear()
+        adapter.cache.update_schemas([(None, schema)])
+        for i in range(scale):
+            adapter.cache.add(adapter.Relation.create(schema=schema, identifier=f"table_{i}", type="table"))
+        relations = [adapter.Relation.create(schema=schema, identifier=f"table_{i}")
+                     for i in range(min(scale, COLUMN_LOOKUPS))]
+
+        def get_columns():
+            # every round starts from an empty cache, as a new invocation would
+            adapter._column_cache.clear()
+            adapter._column_cache_schemas.clear()
+            return [adapter.get_columns_in_relation(relation) for relation in relations]
+
+        with adapter.connection_named("benchmark"):
+            columns = benchmark(get_columns, _rounds(scale))
+
+        assert all(len(relation_columns) == 5 for relation_columns in columns)
+
+    @pytest.mark.parametrize("catalog_batch_size", [0, 100], ids=["per_schema", "batched"])
+    @pytest.mark.parametrize("scale", SCALES)
+    def test_get_catalog(self, adapter, benchmark, monkeypatch, scale, catalog_batch_size):
+        monkeypatch.setattr(adapter.config.credentials, "catalog_batch_size", catalog_batch_size)
+        monkeypatch.setattr(adapter.config.args, "single_threaded", False, raising=False)
+        schema = f"bench_{scale}"
+        relation_configs = [_relation_config(schema, f"table_{i}") for i in range(scale)]
+
+        catalog, exceptions = benchmark(
+            lambda: adapter.get_catalog(relation_configs, frozenset({(None, schema)})), _rounds(scale))
+
+        assert exceptions == []
+        assert len(catalog) == scale * 5
+
+
+class TestTaskBenchmarks:
+    @pytest.mark.parametrize("shared_task_poller", [False, True], ids=["per_task", "shared"])
+    @pytest.mark.parametrize("polls", POLLS)
+    def test_async_poll_loop(self, adapter, benchmark, monkeypatch, polls, shared_task_poller):
+        monkeypatch.setattr(adapter.config.credentials, "shared_task_poller", shared_task_poller)
+
+        with adapter.connection_named("benchmark"):
+            response, _ = benchmark(
+                lambda: adapter.execute(f"insert into polls_{polls} select 1"), _rounds(polls * 10))
+
+        assert response.code == "SUCCESS"
+
+
+class TestSeedBenchmarks:
+    @pytest.mark.parametrize("scale", SCALES)
+    def test_load_csv_rows(self, adapter, benchmark, scale):
+        agate_table = agate.Table(
+            [(i, f"name_{i}", "2024-01-01 00:00:00") for i in range(scale)], ["id", "name", "created_at"])
+        context = {
+            "this": adapter.Relation.create(schema="bench_0", identifier="my_seed"),
+            "config": SimpleNamespace(get=lambda key, default=None: default),
+        }
+        kwargs = {"model": {"name": "my_seed", "config": {}}, "agate_table": agate_table}
+
+        with adapter.connection_named("benchmark"):
+            sql = benchmark(lambda: adapter.execute_macro("load_csv_rows", kwargs=kwargs, context_override=context),
+                            _rounds(scale))
+
+        assert sql.strip().startswith("insert into `bench_0`.`my_seed`")
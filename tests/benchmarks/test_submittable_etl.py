@@ -0,0 +1,35 @@
+import pytest
+
+from dbt.adapters.starrocks import impl
+from dbt.adapters.starrocks.impl import StarRocksAdapter
+
+# About 4 MB of SQL: a large `IN` list, as generated by some incremental models.
+IN_LIST = ", ".join(str(i) for i in range(500000))
+STATEMENTS = {
+    "insert": f"/* {{\"app\": \"dbt\"}} */\ninsert into t select * from s where id in ({IN_LIST})",
+    "ctas": f"create table t distributed by hash(id) as select * from s where id in ({IN_LIST})",
+    "select": f"select * from s where id in ({IN_LIST})",
+}
+ROUNDS = 10
+
+
+class TestSubmittableEtlBenchmarks:
+    @pytest.mark.parametrize("statement", list(STATEMENTS))
+    def test_classify_large_statement(self, benchmark, statement):
+        sql = STATEMENTS[statement]
+        # new strings, so their hash is not memoized either
+        copies = iter([sql[:-1] + sql[-1] for _ in range(ROUNDS + 1)])
+
+        def classify():
+            impl._submittable_etl_cache.clear()
+            return StarRocksAdapter._is_submittable_etl(next(copies))
+
+        assert benchmark(classify, ROUNDS) == (statement != "select")
+
+    def test_classify_cached_statements(self, benchmark):
+        sql = STATEMENTS["insert"]
+
+        def classify():
+            return all(StarRocksAdapter._is_submittable_etl(sql) for _ in range(1000))
+
+        assert benchmark(classify, ROUNDS)
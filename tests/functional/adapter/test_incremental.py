@@ -192,3 +192,233 @@ class TestDynamicOverwriteStrategyIncrementalModel(TestBaseIncrementalStrategyMo
         assert len(results) == 1
 
         check_relations_equal(project.adapter, ["dynamic_partition_2", "incremental"])
+
+
+class TestPartitionScopedInsertOverwriteStrategyIncrementalModel(TestBaseIncrementalStrategyModel):
+
+    @staticmethod
+    def _get_strategy():
+        return {"+incremental_strategy": "insert_overwrite", "+partition_scoped_overwrite": True}
+
+    def _specific_assertions(self, project):
+        check_relations_equal(project.adapter, ["partition_1_added", "incremental"])
+
+        # partition 2 does not exist yet: the rows are inserted, partition 1 is kept
+        assert len(run_dbt(["run", "--vars", "seed_name: partition_2_base"])) == 1
+        check_relations_equal(project.adapter, ["dynamic_partition_2", "incremental"])
+
+        # only partition 1 is overwritten, partition 2 is kept
+        assert len(run_dbt(["run", "--vars", "seed_name: partition_1_added"])) == 1
+        check_relations_equal(project.adapter, ["dynamic_partition_2", "incremental"])
+
+
+mixed_partitions_added_csv = """
+id,partition_key
+6,1
+7,1
+16,3
+17,3
+""".lstrip()
+
+mixed_partitions_expected_csv = """
+id,partition_key
+6,1
+7,1
+11,2
+12,2
+13,2
+14,2
+15,2
+16,3
+17,3
+""".lstrip()
+
+null_partition_csv = """
+id,partition_key
+18,
+""".lstrip()
+
+partition_scoped_model_sql = """
+{{ config(materialized='incremental', incremental_strategy='insert_overwrite', partition_scoped_overwrite=true,
+          partition_type='Expr', partition_by=['partition_key']) }}
+select * from {{ ref(var('seed_name', 'partition_1_base')) }}
+"""
+
+
+class TestPartitionScopedInsertOverwriteMixedPartitions:
+    """
+    Rows of existing and new partitions are split: the former overwrite their
+    partitions, the latter are inserted, and the other partitions are kept.
+    """
+
+    @pytest.fixture(scope="class")
+    def seeds(self):
+        return {
+            "partition_1_base.csv": partition_1_base_csv,
+            "partition_2_base.csv": partition_2_base_csv,
+            "mixed_partitions_added.csv": mixed_partitions_added_csv,
+            "mixed_partitions_expected.csv": mixed_partitions_expected_csv,
+            "null_partition.csv": null_partition_csv,
+        }
+
+    @pytest.fixture(scope="class")
+    def models(self):
+        return {"partition_scoped.sql": partition_scoped_model_sql}
+
+    def test_mixed_partitions(self, project):
+        run_dbt(["seed"])
+        assert len(run_dbt(["run"])) == 1
+        assert len(run_dbt(["run", "--vars", "seed_name: partition_2_base"])) == 1
+
+        assert len(run_dbt(["run", "--vars", "seed_name: mixed_partitions_added"])) == 1
+        check_relations_equal(project.adapter, ["mixed_partitions_expected", "partition_scoped"])
+
+        # a NULL partition value is rejected, rather than overwriting the whole table
+        results = run_dbt(["run", "--vars", "seed_name: null_partition"], expect_pass=False)
+        assert "cannot be limited to the partitions of its rows" in results[0].message
+        check_relations_equal(project.adapter, ["mixed_partitions_expected", "partition_scoped"])
+
+
+class TestUpsertStrategyIncrementalModel(TestBaseIncrementalStrategyModel):
+
+    @staticmethod
+    def _get_strategy():
+        return {"+incremental_strategy": "upsert", "+unique_key": ["id", "partition_key"]}
+
+    def _specific_assertions(self, project):
+        check_relations_equal(project.adapter, ["full_partition_1", "incremental"])
+
+        # Rows with existing keys are replaced, not appended
+        assert len(run_dbt(["run", "--vars", "seed_name: full_partition_1"])) == 1
+        check_relations_equal(project.adapter, ["full_partition_1", "incremental"])
+
+
+class TestUpsertStrategyWithoutUniqueKeyIncrementalModel(TestBaseIncrementalStrategyModel):
+
+    @staticmethod
+    def _get_strategy():
+        return {"+incremental_strategy": "upsert"}
+
+    def _specific_assertions(self, project):
+        pass
+
+    def test_incremental(self, project):
+        run_dbt(["seed"])
+        results = run_dbt(["run", "--vars", "seed_name: partition_1_base"], expect_pass=False)
+        assert "requires the 'unique_key' configuration" in results[0].message
+
+
+partial_update_base_csv = """
+id,partition_key,status,amount
+1,1,new,10
+2,1,new,20
+""".lstrip()
+
+partial_update_added_csv = """
+id,partition_key,status
+1,1,shipped
+3,1,new
+""".lstrip()
+
+partial_update_expected_csv = """
+id,partition_key,status,amount
+1,1,shipped,10
+2,1,new,20
+3,1,new,
+""".lstrip()
+
+partial_update_model_sql = """
+{{ config(materialized='incremental', incremental_strategy='partial_update', unique_key=['id', 'partition_key'],
+          partial_update_columns=var('partial_update_columns', ['status']), partial_update_mode='row') }}
+{% if is_incremental() %}
+select id, partition_key, status from {{ ref('partial_update_added') }}
+{% else %}
+select * from {{ ref('partial_update_base') }}
+{% endif %}
+"""
+
+
+class TestPartialUpdateStrategyIncrementalModel:
+
+    @pytest.fixture(scope="class")
+    def seeds(self):
+        return {
+            "partial_update_base.csv": partial_update_base_csv,
+            "partial_update_added.csv": partial_update_added_csv,
+            "partial_update_expected.csv": partial_update_expected_csv,
+        }
+
+    @pytest.fixture(scope="class")
+    def models(self):
+        return {"partial_update.sql": partial_update_model_sql}
+
+    def test_partial_update(self, project):
+        run_dbt(["seed"])
+        assert len(run_dbt(["run"])) == 1
+        assert len(run_dbt(["run"])) == 1
+        check_relations_equal(project.adapter, ["partial_update_expected", "partial_update"])
+
+    def test_partial_update_of_a_single_column_name(self, project):
+        run_dbt(["seed"])
+        columns_var = ["--vars", "partial_update_columns: status"]
+        assert len(run_dbt(["run"] + columns_var)) == 1
+        assert len(run_dbt(["run"] + columns_var)) == 1
+        check_relations_equal(project.adapter, ["partial_update_expected", "partial_update"])
+
+    def test_partial_update_without_columns(self, project):
+        run_dbt(["seed"])
+        run_dbt(["run"])
+        results = run_dbt(["run", "--vars", "partial_update_columns: []"], expect_pass=False)
+        assert "requires the 'partial_update_columns' configuration to be set to a non-empty list" in results[0].message
+
+
+microbatch_events_csv = """
+id,event_time
+1,2024-01-01 10:00:00
+2,2024-01-02 10:00:00
+3,2024-01-03 10:00:00
+""".lstrip()
+
+microbatch_expression_partition_model_sql = """
+{{ config(materialized='incremental', incremental_strategy='microbatch', event_time='event_time',
+          begin='2024-01-01', batch_size='day', partition_type='Expr',
+          partition_by=["date_trunc('day', event_time)"], distributed_by=['id']) }}
+select id, event_time from {{ ref('microbatch_events') }}
+"""
+
+
+class TestMicrobatchUnresolvablePartitions:
+    """A batch whose partitions cannot be determined is rejected rather than overwriting the whole table."""
+
+    @pytest.fixture(scope="class")
+    def seeds(self):
+        return {"microbatch_events.csv": microbatch_events_csv}
+
+    @pytest.fixture(scope="class")
+    def models(self):
+        return {"microbatch_events_model.sql": microbatch_expression_partition_model_sql}
+
+    def test_batch_is_rejected(self, project):
+        run_dbt(["seed"])
+        results = run_dbt(["run", "--event-time-start", "2024-01-01", "--event-time-end", "2024-01-03"],
+                          expect_pass=False)
+        assert "cannot be limited to the partitions of its rows" in results[0].message
+
+
+class TestMicrobatchWithoutPartitionScopedOverwrite:
+    """`partition_scoped_overwrite: false` would make every batch overwrite the whole table."""
+
+    @pytest.fixture(scope="class")
+    def seeds(self):
+        return {"microbatch_events.csv": microbatch_events_csv}
+
+    @pytest.fixture(scope="class")
+    def models(self):
+        return {"microbatch_events_model.sql": microbatch_expression_partition_model_sql.replace(
+            "batch_size='day',", "batch_size='day', partition_scoped_overwrite=false,")}
+
+    def test_config_is_rejected(self, project):
+        run_dbt(["seed"])
+        results = run_dbt(["run", "--event-time-start", "2024-01-01", "--event-time-end", "2024-01-03"],
+                          expect_pass=False)
+        assert "does not support 'partition_scoped_overwrite: false'" in results[0].message
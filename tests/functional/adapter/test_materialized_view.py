@@ -0,0 +1,166 @@
+import pytest
+
+from dbt.tests.util import get_model_file, run_dbt, run_dbt_and_capture, set_model_file
+from dbt.adapters.contracts.relation import RelationType
+
+MY_SEED = """
+id,value
+1,100
+2,200
+3,300
+""".strip()
+
+MY_MV_SQL = """
+{{ config(materialized='materialized_view', distributed_by=['id'], refresh_method='manual',
+          properties={'replication_num': '1'}) }}
+select id, value from {{ ref('my_seed') }}
+""".lstrip()
+
+MY_MV_SQL_ALTERED = """
+{{ config(materialized='materialized_view', distributed_by=['id'], refresh_method='async every (interval 1 day)',
+          properties={'replication_num': '1', 'mv_rewrite_staleness_second': '60'}) }}
+select id, value from {{ ref('my_seed') }}
+""".lstrip()
+
+MY_MV_SQL_CHANGED = """
+{{ config(materialized='materialized_view', distributed_by=['id'], refresh_method='manual',
+          properties={'replication_num': '1'}) }}
+select id, value from {{ ref('my_seed') }} where id >= 2
+""".lstrip()
+
+
+class TestMaterializedViewChanges:
+    """
+    Changes to the refresh scheme and the properties of a materialized view are
+    applied with ALTER MATERIALIZED VIEW; only a query change rebuilds it.
+    """
+
+    @pytest.fixture(scope="class")
+    def seeds(self):
+        return {"my_seed.csv": MY_SEED}
+
+    @pytest.fixture(scope="class")
+    def models(self):
+        return {"my_mv.sql": MY_MV_SQL}
+
+    @pytest.fixture(scope="class")
+    def my_mv(self, project):
+        return project.adapter.Relation.create(
+            identifier="my_mv",
+            schema=project.test_schema,
+            database=project.database,
+            type=RelationType.MaterializedView,
+        )
+
+    @pytest.fixture(autouse=True)
+    def setup(self, project, my_mv):
+        run_dbt(["seed"])
+        run_dbt(["run", "--full-refresh"])
+        initial_model = get_model_file(project, my_mv)
+        yield
+        set_model_file(project, my_mv, initial_model)
+        project.run_sql(f"drop database if exists {project.test_schema} force")
+
+    def test_unchanged_materialized_view_is_refreshed(self, project, my_mv):
+        _, logs = run_dbt_and_capture(["--debug", "run", "--select", "my_mv"])
+        assert f"refresh materialized view {my_mv}" in logs
+        assert "drop materialized view" not in logs
+
+    def test_unchanged_async_materialized_view_is_skipped(self, project, my_mv):
+        set_model_file(project, my_mv, MY_MV_SQL_ALTERED)
+        run_dbt(["run", "--select", "my_mv"])
+
+        _, logs = run_dbt_and_capture(["--debug", "run", "--select", "my_mv"])
+        assert f"skip {my_mv}" in logs
+        assert "refresh materialized view" not in logs
+
+    def test_materialized_view_without_fingerprint_is_rebuilt_once(self, project, my_mv):
+        # as created by an older version of the adapter
+        project.run_sql(f"drop materialized view {my_mv}")
+        project.run_sql(f"create materialized view {my_mv} distributed by hash(id) refresh manual "
+                        f"properties ('replication_num' = '1') "
+                        f"as select id, value from {project.test_schema}.my_seed")
+
+        _, logs = run_dbt_and_capture(["--debug", "run", "--select", "my_mv"])
+        assert "drop materialized view" in logs
+
+        # its fingerprint is stored by the rebuild
+        _, logs = run_dbt_and_capture(["--debug", "run", "--select", "my_mv"])
+        assert "drop materialized view" not in logs
+
+    def test_config_change_alters_materialized_view(self, project, my_mv):
+        set_model_file(project, my_mv, MY_MV_SQL_ALTERED)
+
+        _, logs = run_dbt_and_capture(["--debug", "run", "--select", "my_mv"])
+        assert f"alter materialized view {my_mv} refresh async every (interval 1 day)" in logs
+        assert f'alter materialized view {my_mv} set ("mv_rewrite_staleness_second" = "60")' in logs
+        assert "drop materialized view" not in logs
+        # asynchronous materialized views are refreshed by StarRocks
+        assert "refresh materialized view" not in logs
+
+        # the altered configuration is read back: nothing left to alter
+        _, logs = run_dbt_and_capture(["--debug", "run", "--select", "my_mv"])
+        assert "alter materialized view" not in logs
+
+    def test_query_change_rebuilds_materialized_view(self, project, my_mv):
+        set_model_file(project, my_mv, MY_MV_SQL_CHANGED)
+
+        _, logs = run_dbt_and_capture(["--debug", "run", "--select", "my_mv"])
+        assert "drop materialized view" in logs
+        project.run_sql(f"refresh materialized view {my_mv} with sync mode")
+        result = project.run_sql(f"select count(*) from {my_mv}", fetch="one")
+        assert result[0] == 2
+
+
+MY_EVENTS_SEED = """
+id,dt
+1,2024-01-01
+2,2024-01-02
+3,2024-01-03
+""".strip()
+
+MY_PARTITIONED_MV_SQL = """
+{{ config(materialized='materialized_view', distributed_by=['id'], partition_by=['dt'], refresh_method='manual',
+          refresh_mode=var('mv_refresh_mode', 'async'),
+          refresh_partition_start=var('mv_start', none), refresh_partition_end=var('mv_end', none)) }}
+select id, dt from {{ ref('my_events') }}
+""".lstrip()
+
+
+class TestMaterializedViewRefreshModes:
+    """
+    `refresh_mode` 'sync' and 'poll' wait for the refresh of the materialized
+    view, which can be limited to a window of partitions.
+    """
+
+    @pytest.fixture(scope="class")
+    def seeds(self):
+        return {"my_events.csv": MY_EVENTS_SEED}
+
+    @pytest.fixture(scope="class")
+    def models(self):
+        return {"my_partitioned_mv.sql": MY_PARTITIONED_MV_SQL}
+
+    @pytest.fixture(autouse=True)
+    def setup(self, project):
+        run_dbt(["seed"])
+        yield
+        project.run_sql(f"drop database if exists {project.test_schema} force")
+
+    def _count(self, project):
+        return project.run_sql(
+            f"select count(*) from {project.test_schema}.my_partitioned_mv", fetch="one")[0]
+
+    def test_poll_waits_for_the_refresh_of_a_new_materialized_view(self, project):
+        run_dbt(["run", "--full-refresh", "--vars", "mv_refresh_mode: poll"])
+        assert self._count(project) == 3
+
+    def test_sync_refresh_of_a_partition_window(self, project):
+        run_dbt(["run", "--full-refresh", "--vars", "mv_refresh_mode: poll"])
+
+        _, logs = run_dbt_and_capture([
+            "--debug", "run", "--vars",
+            "{mv_refresh_mode: sync, mv_start: '2024-01-01', mv_end: '2024-01-02'}",
+        ])
+        assert "partition start ('2024-01-01') end ('2024-01-02') with sync mode" in logs
+        assert self._count(project) == 3
@@ -0,0 +1,51 @@
+import pytest
+
+from dbt.tests.util import relation_from_name, run_dbt
+
+stream_load_seed_csv = """
+id,name,amount,created_at
+1,"comma, inside",1.5,2025-01-01 10:00:00
+2,"quote "" inside",2.25,2025-01-02 11:00:00
+3,,3.0,
+""".lstrip()
+
+
+class TestSeedStreamLoad:
+
+    @pytest.fixture(scope="class")
+    def seeds(self):
+        return {"stream_load_seed.csv": stream_load_seed_csv}
+
+    @pytest.fixture(scope="class")
+    def project_config_update(self):
+        return {
+            "seeds": {
+                "+load_method": "stream_load",
+                "+stream_load_batch_size": 2,
+            },
+        }
+
+    def test_seed_with_stream_load(self, project):
+        results = run_dbt(["seed"])
+        assert len(results) == 1
+
+        # the Stream Load counters are reported in the adapter response
+        response = results.results[0].adapter_response
+        assert response["code"] == "STREAM LOAD"
+        assert response["rows_loaded"] == 3
+        assert response["rows_filtered"] == 0
+
+        relation = relation_from_name(project.adapter, "stream_load_seed")
+        result = project.run_sql(f"select count(*) as num_rows from {relation}", fetch="one")
+        assert result[0] == 3
+
+        result = project.run_sql(f"select name from {relation} where id = 1", fetch="one")
+        assert result[0] == "comma, inside"
+
+        result = project.run_sql(f"select count(*) from {relation} where name is null", fetch="one")
+        assert result[0] == 1
+
+        # reseeding truncates and loads again
+        results = run_dbt(["seed"])
+        result = project.run_sql(f"select count(*) as num_rows from {relation}", fetch="one")
+        assert result[0] == 3
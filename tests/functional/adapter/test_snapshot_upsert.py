@@ -0,0 +1,103 @@
+import pytest
+
+from dbt.tests.util import run_dbt, run_dbt_and_capture
+
+SEED_CSV = """
+id,name,updated_at
+1,alice,2024-01-01 00:00:00
+2,bob,2024-01-01 00:00:00
+""".lstrip()
+
+SNAPSHOT_SQL = """
+{% snapshot my_snapshot %}
+{{ config(target_schema=schema, unique_key='id', strategy='timestamp', updated_at='updated_at',
+          snapshot_merge_method='upsert') }}
+select * from {{ ref('my_seed') }}
+{% endsnapshot %}
+"""
+
+
+class TestSnapshotUpsert:
+    """
+    With `snapshot_merge_method='upsert'`, the snapshot is a primary key table
+    on `dbt_scd_id`: changed rows are closed with a partial update of
+    `dbt_valid_to`, and new versions are inserted, without an UPDATE join.
+    """
+
+    @pytest.fixture(scope="class")
+    def seeds(self):
+        return {"my_seed.csv": SEED_CSV}
+
+    @pytest.fixture(scope="class")
+    def snapshots(self):
+        return {"my_snapshot.sql": SNAPSHOT_SQL}
+
+    def test_snapshot_upsert(self, project):
+        run_dbt(["seed"])
+        run_dbt(["snapshot"])
+
+        table_model = project.run_sql(
+            f"select table_model from information_schema.tables_config"
+            f" where table_schema = '{project.test_schema}' and table_name = 'my_snapshot'",
+            fetch="one",
+        )[0]
+        assert table_model == "PRIMARY_KEYS"
+
+        project.run_sql(
+            f"insert into {project.test_schema}.my_seed values (1, 'alicia', '2024-01-02 00:00:00')")
+        project.run_sql(
+            f"delete from {project.test_schema}.my_seed where name = 'alice'")
+
+        _, logs = run_dbt_and_capture(["--debug", "snapshot"])
+        assert "(dbt_scd_id, dbt_valid_to)" in logs
+
+        rows = project.run_sql(
+            f"select id, name, dbt_valid_to is null from {project.test_schema}.my_snapshot order by id, name",
+            fetch="all",
+        )
+        assert [tuple(row) for row in rows] == [(1, "alice", False), (1, "alicia", True), (2, "bob", True)]
+
+        # the close is a partial update: the other columns of the closed row are kept
+        closed = project.run_sql(
+            f"select name, cast(updated_at as string), cast(dbt_valid_from as string), dbt_scd_id is not null"
+            f" from {project.test_schema}.my_snapshot where dbt_valid_to is not null",
+            fetch="all",
+        )
+        assert [tuple(row) for row in closed] == [("alice", "2024-01-01 00:00:00", "2024-01-01 00:00:00", True)]
+
+
+class TestSnapshotUpsertWithNativeHash(TestSnapshotUpsert):
+    """With `snapshot_hash_function='xx_hash3_128'`, `dbt_scd_id` is a LARGEINT key."""
+
+    @pytest.fixture(scope="class")
+    def snapshots(self):
+        return {"my_snapshot.sql": SNAPSHOT_SQL.replace(
+            "snapshot_merge_method='upsert'", "snapshot_merge_method='upsert', snapshot_hash_function='xx_hash3_128'")}
+
+    def test_snapshot_upsert(self, project):
+        super().test_snapshot_upsert(project)
+
+        data_type = project.run_sql(
+            f"select data_type from information_schema.columns where table_schema = '{project.test_schema}'"
+            f" and table_name = 'my_snapshot' and column_name = 'dbt_scd_id'",
+            fetch="one",
+        )[0]
+        assert data_type.lower() == "largeint"
+
+
+class TestSnapshotUpsertDistribution:
+    """A snapshot merged with upserts must be distributed by its primary key, `dbt_scd_id`."""
+
+    @pytest.fixture(scope="class")
+    def seeds(self):
+        return {"my_seed.csv": SEED_CSV}
+
+    @pytest.fixture(scope="class")
+    def snapshots(self):
+        return {"my_snapshot.sql": SNAPSHOT_SQL.replace(
+            "snapshot_merge_method='upsert'", "snapshot_merge_method='upsert', distributed_by=['id']")}
+
+    def test_other_distribution_is_rejected(self, project):
+        run_dbt(["seed"])
+        _, logs = run_dbt_and_capture(["snapshot"], expect_pass=False)
+        assert "[distributed_by] must be ['dbt_scd_id']" in logs
@@ -83,3 +83,25 @@ class TestSubmitTaskModel:
         check_relations_equal(project.adapter, ["seed_a", "model_a"])
 
         self._doc_tests()
+
+
+class TestSubmitTaskSharedPoller(TestSubmitTaskModel):
+
+    @pytest.fixture(scope="class")
+    def dbt_profile_target(self):
+        return {
+            'type': 'starrocks',
+            'username': 'root',
+            'password': '',
+            'port': 9030,
+            'host': 'localhost',
+            'is_async': True,
+            'async_query_timeout': 10,
+            'shared_task_poller': True,
+        }
+
+    @pytest.fixture(scope="class")
+    def project_config_update(self):
+        return {
+            "name": "test_submit_task_shared_poller",
+        }
@@ -0,0 +1,101 @@
+import pytest
+
+from dbt.tests.util import run_dbt, run_dbt_and_capture
+
+SEED_CSV = """
+id,updated_at,name
+1,2024-01-01 00:00:00,alice
+2,2024-01-01 00:00:00,bob
+3,2024-01-01 00:00:00,carol
+""".lstrip()
+
+SNAPSHOT_SQL = """
+{% snapshot my_snapshot %}
+{{ config(target_schema=schema, unique_key='id', strategy='timestamp', updated_at='updated_at',
+          table_type='PRIMARY', keys=['id', 'updated_at'], distributed_by=['id']) }}
+select id, updated_at, name from {{ ref('my_seed') }}
+{% endsnapshot %}
+"""
+
+MY_MV_SQL = """
+{{ config(materialized='materialized_view', distributed_by=['id'], refresh_method='manual', refresh_mode='sync') }}
+select id, name from {{ ref('my_seed') }}
+""".lstrip()
+
+
+@pytest.fixture(scope="class")
+def dbt_profile_target():
+    return {
+        'type': 'starrocks',
+        'username': 'root',
+        'password': '',
+        'port': 9030,
+        'host': 'localhost',
+        'is_async': True,
+        'async_query_timeout': 60,
+        'poll_interval': 1,
+        'poll_factor': 1.0,
+    }
+
+
+class TestSubmitTaskStatements:
+    """
+    With `is_async`, seed inserts, snapshot closes and synchronous refreshes of
+    materialized views run server-side, and are polled like submitted tasks.
+    """
+
+    @pytest.fixture(scope="class")
+    def seeds(self):
+        return {"my_seed.csv": SEED_CSV}
+
+    @pytest.fixture(scope="class")
+    def snapshots(self):
+        return {"my_snapshot.sql": SNAPSHOT_SQL}
+
+    @pytest.fixture(scope="class")
+    def models(self):
+        return {"my_mv.sql": MY_MV_SQL}
+
+    @pytest.fixture(autouse=True)
+    def setup(self, project):
+        _, logs = run_dbt_and_capture(["--debug", "seed"])
+        assert "submit /*+set_var(query_timeout=60)*/ task" in logs
+        yield
+        project.run_sql(f"drop database if exists {project.test_schema} force")
+
+    def test_seed_is_loaded(self, project):
+        result = project.run_sql(f"select count(*) from {project.test_schema}.my_seed", fetch="one")
+        assert result[0] == 3
+
+    def test_snapshot_close_is_submitted(self, project):
+        run_dbt(["snapshot"])
+        project.run_sql(
+            f"insert into {project.test_schema}.my_seed values (1, '2024-01-02 00:00:00', 'alicia')")
+        project.run_sql(f"delete from {project.test_schema}.my_seed where name = 'alice'")
+
+        _, logs = run_dbt_and_capture(["--debug", "snapshot"])
+        assert "(id, updated_at, dbt_valid_to)" in logs
+
+        rows = project.run_sql(
+            f"select id, name, dbt_valid_to is null from {project.test_schema}.my_snapshot order by id, name",
+            fetch="all",
+        )
+        assert [tuple(row) for row in rows] == [
+            (1, "alice", False), (1, "alicia", True), (2, "bob", True), (3, "carol", True)]
+
+        # the close is a partial update: the other columns of the closed row are kept
+        closed = project.run_sql(
+            f"select name, cast(dbt_valid_from as string), dbt_scd_id is not null"
+            f" from {project.test_schema}.my_snapshot where dbt_valid_to is not null",
+            fetch="all",
+        )
+        assert [tuple(row) for row in closed] == [("alice", "2024-01-01 00:00:00", True)]
+
+    def test_sync_refresh_is_polled(self, project):
+        run_dbt(["run"])
+
+        _, logs = run_dbt_and_capture(["--debug", "run"])
+        assert "refresh materialized view" in logs
+        assert "with sync mode" not in logs
+        result = project.run_sql(f"select count(*) from {project.test_schema}.my_mv", fetch="one")
+        assert result[0] == 3
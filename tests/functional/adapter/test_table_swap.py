@@ -0,0 +1,67 @@
+import pytest
+
+from dbt.tests.util import get_model_file, run_dbt, run_dbt_and_capture, set_model_file
+from dbt.adapters.contracts.relation import RelationType
+
+MY_TABLE_SQL = """
+{{ config(materialized='table', distributed_by=['id'], on_table_exists='swap') }}
+select 1 as id, 'a' as value
+""".lstrip()
+
+MY_TABLE_SQL_CHANGED = """
+{{ config(materialized='table', distributed_by=['id'], on_table_exists='swap') }}
+select 1 as id, 'b' as value
+union all
+select 2 as id, 'c' as value
+""".lstrip()
+
+
+class TestTableSwap:
+    """
+    With `on_table_exists='swap'`, the new table is built under a backup name
+    and swapped with the existing one, which is then dropped.
+    """
+
+    @pytest.fixture(scope="class")
+    def models(self):
+        return {"my_table.sql": MY_TABLE_SQL}
+
+    @pytest.fixture(scope="class")
+    def my_table(self, project):
+        return project.adapter.Relation.create(
+            identifier="my_table",
+            schema=project.test_schema,
+            database=project.database,
+            type=RelationType.Table,
+        )
+
+    @pytest.fixture(autouse=True)
+    def setup(self, project, my_table):
+        run_dbt(["run"])
+        initial_model = get_model_file(project, my_table)
+        yield
+        set_model_file(project, my_table, initial_model)
+        project.run_sql(f"drop database if exists {project.test_schema} force")
+
+    def test_existing_table_is_swapped(self, project, my_table):
+        set_model_file(project, my_table, MY_TABLE_SQL_CHANGED)
+
+        _, logs = run_dbt_and_capture(["--debug", "run"])
+        assert "swap with `my_table__dbt_backup`" in logs
+        assert f"drop table if exists {my_table}" not in logs
+
+        rows = project.run_sql(f"select id, value from {my_table} order by id", fetch="all")
+        assert [tuple(row) for row in rows] == [(1, "b"), (2, "c")]
+
+        tables = project.run_sql(
+            f"select table_name from information_schema.tables where table_schema = '{project.test_schema}'",
+            fetch="all",
+        )
+        assert [row[0] for row in tables] == ["my_table"]
+
+    def test_old_table_is_dropped_after_post_hooks(self, project, my_table):
+        set_model_file(project, my_table, MY_TABLE_SQL_CHANGED.replace(
+            "on_table_exists='swap'", "on_table_exists='swap', post_hook=\"select 'my_post_hook'\""))
+
+        _, logs = run_dbt_and_capture(["--debug", "run"])
+        assert logs.index("my_post_hook") < logs.rindex("my_table__dbt_backup")
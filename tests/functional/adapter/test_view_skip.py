@@ -199,6 +199,71 @@ class TestViewSkipWhenUnchanged:
         )
 
 
+class TestViewSkipWithFingerprint:
+    """
+    With `view_change_detection='fingerprint'`, the hash of the compiled SQL is
+    stored in the view comment, and an unchanged view is skipped after reading
+    it back, without building an intermediate view.
+    """
+
+    @pytest.fixture(scope="class")
+    def seeds(self):
+        return {"my_seed.csv": MY_SEED}
+
+    @pytest.fixture(scope="class")
+    def models(self):
+        return {"my_view.sql": MY_VIEW_SQL}
+
+    @pytest.fixture(scope="class")
+    def project_config_update(self):
+        return {"models": {"+view_change_detection": "fingerprint"}}
+
+    @pytest.fixture(scope="class")
+    def my_view(self, project):
+        return project.adapter.Relation.create(
+            identifier="my_view",
+            schema=project.test_schema,
+            database=project.database,
+            type=RelationType.View,
+        )
+
+    @pytest.fixture(autouse=True)
+    def setup(self, project, my_view):
+        run_dbt(["seed"])
+        run_dbt(["run", "--full-refresh"])
+        initial_model = get_model_file(project, my_view)
+        yield
+        set_model_file(project, my_view, initial_model)
+        project.run_sql(f"drop database if exists {project.test_schema} force")
+
+    def test_unchanged_view_is_skipped_without_intermediate_view(self, project, my_view):
+        _, logs = run_dbt_and_capture(["--debug", "run", "--select", "my_view"])
+
+        assert f"skip {my_view}" in logs
+        assert "__dbt_tmp" not in logs, "no intermediate view should be built"
+        assert "information_schema.views" not in logs
+
+    def test_sql_change_rebuilds_view(self, project, my_view):
+        set_model_file(project, my_view, MY_VIEW_SQL_CHANGED)
+
+        _, logs = run_dbt_and_capture(["--debug", "run", "--select", "my_view"])
+        assert f"skip {my_view}" not in logs
+
+        # the new fingerprint is stored: the next run skips the view again
+        _, logs = run_dbt_and_capture(["--debug", "run", "--select", "my_view"])
+        assert f"skip {my_view}" in logs
+
+    def test_config_change_rebuilds_view(self, project, my_view):
+        set_model_file(project, my_view, MY_VIEW_SQL.replace(
+            "materialized='view'", "materialized='view', security='INVOKER', properties={'owner': 'finance'}"))
+
+        _, logs = run_dbt_and_capture(["--debug", "run", "--select", "my_view"])
+        assert f"skip {my_view}" not in logs
+
+        _, logs = run_dbt_and_capture(["--debug", "run", "--select", "my_view"])
+        assert f"skip {my_view}" in logs
+
+
 class TestViewReplacesWrongTypeRelation:
     """
     When a model switches from `materialized='table'` to `materialized='view'`,
@@ -0,0 +1,74 @@
+from contextlib import nullcontext
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import agate
+import dbt_common.exceptions
+
+from dbt.adapters.starrocks.connections import StarRocksConnectionManager
+from dbt.adapters.starrocks.impl import GET_CATALOG_SQL_MACRO_NAME, StarRocksAdapter
+
+CATALOG_COLUMNS = [
+    "table_database", "table_schema", "table_name", "table_type", "table_comment",
+    "table_owner", "column_name", "column_index", "column_type", "column_comment",
+]
+
+
+class FakeCursor:
+    def __init__(self, rows):
+        self.description = [(name,) for name in CATALOG_COLUMNS]
+        self.rows = list(rows)
+
+    def fetchmany(self, size):
+        rows, self.rows = self.rows[:size], self.rows[size:]
+        return rows
+
+
+def _row(schema, table, column, index):
+    return (None, schema, table, "table", None, None, column, index, "bigint", None)
+
+
+def _adapter(batch_size, cursors):
+    adapter = object.__new__(StarRocksAdapter)
+    adapter.config = SimpleNamespace(credentials=SimpleNamespace(catalog_batch_size=batch_size))
+    adapter.connection_named = MagicMock(return_value=nullcontext())
+    adapter.execute_macro = MagicMock(return_value="select ...")
+    adapter.connections = MagicMock()
+    adapter.connections.add_select_query.side_effect = [(None, cursor) for cursor in cursors]
+    adapter.connections.iter_cursor_rows = StarRocksConnectionManager.iter_cursor_rows
+    return adapter
+
+
+class TestBatchedCatalog:
+    def test_schemas_are_fetched_in_batches(self):
+        adapter = _adapter(2, [
+            FakeCursor([_row("2024", "orders", "id", 1), _row("marts", "daily", "id", 1)]),
+            FakeCursor([_row("sales", "orders", "id", 1)]),
+        ])
+        schema_map = {"information_schema": {"2024", "MARTS", "sales"}}
+        used_schemas = frozenset({(None, "2024"), (None, "marts"), (None, "sales")})
+
+        table, exceptions = adapter._get_catalog_in_batches(schema_map, used_schemas, 2)
+
+        assert exceptions == []
+        assert [call.kwargs["kwargs"]["schemas"] for call in adapter.execute_macro.call_args_list] == [
+            ["2024", "marts"], ["sales"],
+        ]
+        adapter.execute_macro.assert_called_with(GET_CATALOG_SQL_MACRO_NAME, kwargs={
+            "information_schema": "information_schema", "schemas": ["sales"]})
+        assert len(table) == 3
+        # schema names stay text, even when they look like numbers
+        assert isinstance(table.columns["table_schema"].data_type, agate.Text)
+        assert table[0]["table_schema"] == "2024"
+
+    def test_failed_batch_is_reported(self):
+        adapter = _adapter(1, [FakeCursor([_row("a", "t", "id", 1)])])
+        adapter.connections.add_select_query.side_effect = [
+            dbt_common.exceptions.DbtDatabaseError("boom"), (None, FakeCursor([_row("b", "t", "id", 1)])),
+        ]
+
+        table, exceptions = adapter._get_catalog_in_batches(
+            {"information_schema": {"a", "b"}}, frozenset({(None, "a"), (None, "b")}), 1)
+
+        assert len(exceptions) == 1
+        assert [row["table_schema"] for row in table] == ["b"]
@@ -0,0 +1,138 @@
+import threading
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import agate
+import pytest
+from dbt.adapters.cache import RelationsCache
+
+from dbt.adapters.starrocks.column import StarRocksColumn
+from dbt.adapters.starrocks import impl
+from dbt.adapters.starrocks.impl import GET_COLUMNS_IN_SCHEMA_MACRO_NAME, StarRocksAdapter
+from dbt.adapters.starrocks.relation import StarRocksRelation
+
+SCHEMA_COLUMNS = agate.Table(
+    [
+        ("orders", "id", "bigint", None, 19, 0),
+        ("orders", "amount", "decimal", None, 10, 2),
+        ("events", "id", "bigint", None, 19, 0),
+        ("events", "tags", "array", None, None, None),
+    ],
+    ["table_name", "column_name", "data_type", "character_maximum_length", "numeric_precision", "numeric_scale"],
+)
+
+
+@pytest.fixture
+def adapter():
+    adapter = object.__new__(StarRocksAdapter)
+    adapter.config = SimpleNamespace(credentials=SimpleNamespace(column_cache=True))
+    adapter.cache = RelationsCache()
+    adapter.cache.update_schemas([(None, "sales")])
+    for identifier in ("orders", "events"):
+        adapter.cache.add(_relation(identifier))
+    adapter._column_cache = {}
+    adapter._column_cache_schemas = set()
+    adapter._column_cache_lock = threading.RLock()
+    adapter._column_cache_generation = 0
+    adapter.execute_macro = MagicMock(return_value=SCHEMA_COLUMNS)
+    return adapter
+
+
+def _relation(identifier, schema="sales"):
+    return StarRocksRelation.create(database=None, schema=schema, identifier=identifier, type="table")
+
+
+@pytest.fixture
+def relation_lookup():
+    with patch("dbt.adapters.sql.SQLAdapter.get_columns_in_relation",
+               return_value=[StarRocksColumn("tags", "array<int>")]) as lookup:
+        yield lookup
+
+
+class TestColumnCache:
+    def test_schema_is_prefetched_once(self, adapter, relation_lookup):
+        orders = adapter.get_columns_in_relation(_relation("orders"))
+        adapter.get_columns_in_relation(_relation("orders"))
+
+        assert [(c.name, c.dtype) for c in orders] == [("id", "bigint"), ("amount", "decimal")]
+        adapter.execute_macro.assert_called_once_with(GET_COLUMNS_IN_SCHEMA_MACRO_NAME, kwargs={"schema": "sales"})
+        relation_lookup.assert_not_called()
+
+    def test_complex_types_are_looked_up_per_relation(self, adapter, relation_lookup):
+        events = adapter.get_columns_in_relation(_relation("events"))
+        adapter.get_columns_in_relation(_relation("events"))
+
+        assert [c.dtype for c in events] == ["array<int>"]
+        relation_lookup.assert_called_once()
+
+    @pytest.mark.parametrize("invalidate", [
+        lambda adapter, relation: adapter.invalidate_column_cache(relation),
+        lambda adapter, relation: adapter.cache_dropped(relation),
+        lambda adapter, relation: adapter.cache_added(relation),
+        lambda adapter, relation: adapter.cache_renamed(relation, _relation("orders__dbt_backup")),
+    ])
+    def test_ddl_invalidates_relation(self, adapter, relation_lookup, invalidate):
+        orders = _relation("orders")
+        adapter.get_columns_in_relation(orders)
+        invalidate(adapter, orders)
+        adapter.get_columns_in_relation(orders)
+
+        relation_lookup.assert_called_once_with(orders)
+        adapter.execute_macro.assert_called_once()
+
+    def test_missing_relation_is_not_cached(self, adapter, relation_lookup):
+        relation_lookup.return_value = []
+        assert adapter.get_columns_in_relation(_relation("missing")) == []
+        adapter.get_columns_in_relation(_relation("missing"))
+        assert relation_lookup.call_count == 2
+
+    def test_disabled_by_default(self, adapter, relation_lookup):
+        adapter.config.credentials.column_cache = False
+        adapter.get_columns_in_relation(_relation("orders"))
+        adapter.execute_macro.assert_not_called()
+        relation_lookup.assert_called_once()
+
+    def test_prefetch_runs_without_the_lock(self, adapter, relation_lookup):
+        def get_columns_in_schema(*args, **kwargs):
+            # another thread can still read the cache
+            acquired = []
+
+            def read_cache():
+                acquired.append(adapter._column_cache_lock.acquire(timeout=1))
+                if acquired[0]:
+                    adapter._column_cache_lock.release()
+
+            thread = threading.Thread(target=read_cache)
+            thread.start()
+            thread.join()
+            assert acquired == [True]
+            return SCHEMA_COLUMNS
+
+        adapter.execute_macro.side_effect = get_columns_in_schema
+        assert [c.name for c in adapter.get_columns_in_relation(_relation("orders"))] == ["id", "amount"]
+
+    def test_large_schemas_are_not_prefetched(self, adapter, relation_lookup, monkeypatch):
+        monkeypatch.setattr(impl, "COLUMN_CACHE_PREFETCH_MAX_RELATIONS", 1)
+        adapter.get_columns_in_relation(_relation("orders"))
+        adapter.get_columns_in_relation(_relation("orders"))
+
+        adapter.execute_macro.assert_not_called()
+        relation_lookup.assert_called_once()
+
+    def test_uncached_schemas_are_not_prefetched(self, adapter, relation_lookup):
+        adapter.get_columns_in_relation(_relation("orders", schema="finance"))
+        adapter.execute_macro.assert_not_called()
+        relation_lookup.assert_called_once()
+
+    def test_prefetch_racing_with_ddl_is_dropped(self, adapter, relation_lookup):
+        orders = _relation("orders")
+
+        def get_columns_in_schema(*args, **kwargs):
+            adapter.invalidate_column_cache(orders)
+            return SCHEMA_COLUMNS
+
+        adapter.execute_macro.side_effect = get_columns_in_schema
+        adapter.get_columns_in_relation(orders)
+
+        relation_lookup.assert_called_once_with(orders)
+        assert "sales" not in adapter._column_cache_schemas
@@ -0,0 +1,122 @@
+from unittest.mock import MagicMock, patch
+
+import pytest
+from dbt.adapters.contracts.connection import Connection
+
+from dbt.adapters.starrocks.connections import (
+    StarRocksConnectionManager,
+    StarRocksConnectionPool,
+    StarRocksCredentials,
+)
+
+
+def _handle(connected=True):
+    handle = MagicMock()
+    handle.is_connected.return_value = connected
+    return handle
+
+
+class TestStarRocksConnectionPool:
+    def test_borrow_from_empty_pool(self):
+        assert StarRocksConnectionPool(2, 300).borrow() is None
+
+    def test_borrow_returns_most_recent_handle(self):
+        pool = StarRocksConnectionPool(2, 300)
+        first, second = _handle(), _handle()
+        assert pool.give_back(first)
+        assert pool.give_back(second)
+        assert pool.borrow() is second
+        assert pool.borrow() is first
+
+    def test_give_back_refused_when_full(self):
+        pool = StarRocksConnectionPool(1, 300)
+        assert pool.give_back(_handle())
+        assert not pool.give_back(_handle())
+
+    def test_unhealthy_handle_is_discarded(self):
+        pool = StarRocksConnectionPool(2, 300)
+        healthy, broken = _handle(), _handle(connected=False)
+        pool.give_back(healthy)
+        pool.give_back(broken)
+        assert pool.borrow() is healthy
+        broken.close.assert_called_once()
+
+    def test_idle_handle_is_evicted(self):
+        pool = StarRocksConnectionPool(2, 10)
+        handle = _handle()
+        with patch("dbt.adapters.starrocks.connections.time.monotonic", side_effect=[0, 11]):
+            pool.give_back(handle)
+            assert pool.borrow() is None
+        handle.close.assert_called_once()
+
+    def test_clear_closes_all_handles(self):
+        pool = StarRocksConnectionPool(2, 300)
+        handles = [_handle(), _handle()]
+        for handle in handles:
+            pool.give_back(handle)
+        pool.clear()
+        assert pool.borrow() is None
+        for handle in handles:
+            handle.close.assert_called_once()
+
+
+@pytest.fixture
+def credentials():
+    StarRocksConnectionManager._pools.clear()
+    yield StarRocksCredentials(
+        host="localhost", port=9030, schema="db", username="root", password="",
+        version="3.5.0", pool_size=2,
+    )
+    StarRocksConnectionManager._pools.clear()
+
+
+def _connection(credentials):
+    return Connection(type="starrocks", name="model", credentials=credentials)
+
+
+class TestPooledOpen:
+    def test_handle_is_reused_after_close(self, credentials):
+        with patch("mysql.connector.connect", side_effect=lambda **kw: _handle()) as connect:
+            connection = StarRocksConnectionManager.open(_connection(credentials))
+            handle = connection.handle
+            StarRocksConnectionManager.close(connection)
+            handle.close.assert_not_called()
+
+            connection = StarRocksConnectionManager.open(_connection(credentials))
+            assert connection.handle is handle
+            assert connect.call_count == 1
+
+    def test_pool_disabled_by_default(self, credentials):
+        credentials.pool_size = 0
+        with patch("mysql.connector.connect", side_effect=lambda **kw: _handle()) as connect:
+            connection = StarRocksConnectionManager.open(_connection(credentials))
+            handle = connection.handle
+            StarRocksConnectionManager.close(connection)
+            handle.close.assert_called_once()
+
+            StarRocksConnectionManager.open(_connection(credentials))
+            assert connect.call_count == 2
+
+    def test_session_is_reset_before_pooling(self, credentials):
+        credentials.query_profile = True
+        with patch("mysql.connector.connect", side_effect=lambda **kw: _handle()):
+            connection = StarRocksConnectionManager.open(_connection(credentials))
+            handle = connection.handle
+            handle.cursor.return_value.execute.reset_mock()
+            StarRocksConnectionManager.close(connection)
+
+        handle.reset_session.assert_called_once()
+        assert handle.database == "default_catalog.db"
+        handle.cursor.return_value.execute.assert_called_once_with("set enable_profile = true")
+        handle.close.assert_not_called()
+
+    def test_handle_is_closed_when_the_session_cannot_be_reset(self, credentials):
+        with patch("mysql.connector.connect", side_effect=lambda **kw: _handle()) as connect:
+            connection = StarRocksConnectionManager.open(_connection(credentials))
+            handle = connection.handle
+            handle.reset_session.side_effect = Exception("not supported")
+            StarRocksConnectionManager.close(connection)
+            handle.close.assert_called_once()
+
+            StarRocksConnectionManager.open(_connection(credentials))
+            assert connect.call_count == 2
@@ -0,0 +1,58 @@
+import json
+
+import pytest
+
+from dbt.adapters.starrocks.instrumentation import Instrumentation
+
+
+class TestInstrumentation:
+    def test_disabled_span_is_a_shared_noop(self):
+        instrumentation = Instrumentation()
+
+        assert instrumentation.span("execute") is instrumentation.span("connection.open")
+        with instrumentation.span("execute"):
+            pass
+        assert instrumentation.snapshot() == {}
+
+    def test_spans_are_aggregated_by_phase(self):
+        instrumentation = Instrumentation()
+        instrumentation.configure("json", None)
+
+        with instrumentation.span("execute"):
+            pass
+        for duration_ms in (0.05, 3, 20000, 70000):
+            instrumentation.record("task.poll_sleep", duration_ms)
+
+        phases = instrumentation.snapshot()
+        assert phases["execute"]["count"] == 1
+        poll_sleep = phases["task.poll_sleep"]
+        assert poll_sleep["count"] == 4
+        assert poll_sleep["min_ms"] == 0.05
+        assert poll_sleep["max_ms"] == 70000
+        assert poll_sleep["buckets"]["le_0.1"] == 1
+        assert poll_sleep["buckets"]["le_5"] == 1
+        assert poll_sleep["buckets"]["le_60000"] == 1
+        assert poll_sleep["buckets"]["inf"] == 1
+
+    def test_span_is_recorded_when_raising(self):
+        instrumentation = Instrumentation()
+        instrumentation.configure("json", None)
+
+        with pytest.raises(RuntimeError):
+            with instrumentation.span("connection.open"):
+                raise RuntimeError("unreachable")
+
+        assert instrumentation.snapshot()["connection.open"]["count"] == 1
+
+    def test_export(self, tmp_path):
+        path = tmp_path / "starrocks_instrumentation.json"
+        instrumentation = Instrumentation()
+        instrumentation.configure("json", str(path))
+
+        instrumentation.export()
+        assert not path.exists()
+
+        instrumentation.record("macro.list_schemas", 12.5)
+        instrumentation.export()
+        exported = json.loads(path.read_text())
+        assert exported["phases"]["macro.list_schemas"]["total_ms"] == 12.5
@@ -0,0 +1,71 @@
+from unittest.mock import MagicMock
+
+import pytest
+
+from dbt.adapters.starrocks.impl import StarRocksAdapter
+from dbt.adapters.starrocks.materialized_views import MaterializedViewConfig, get_changes
+
+FINGERPRINT = "dbt_fingerprint:0123456789abcdef"
+
+DDL = f"""CREATE MATERIALIZED VIEW `my_mv` (`id` COMMENT "the id", `value`)
+COMMENT "{FINGERPRINT}"
+DISTRIBUTED BY HASH(`id`) BUCKETS 10
+REFRESH ASYNC START("2022-09-01 10:00:00") EVERY(INTERVAL 1 DAY)
+PROPERTIES (
+"replication_num" = "1",
+"partition_ttl" = "2 MONTH",
+"storage_medium" = "HDD"
+)
+AS SELECT `id`, `value` FROM `db`.`t` WHERE `comment` = "REFRESH MANUAL PROPERTIES (\\"a\\" = \\"b\\")";"""
+
+
+class TestMaterializedViewChanges:
+    def test_parse_show_create(self):
+        existing = MaterializedViewConfig.from_ddl(DDL)
+        assert existing.comment == FINGERPRINT
+        assert existing.refresh == 'ASYNC START("2022-09-01 10:00:00") EVERY(INTERVAL 1 DAY)'
+        assert existing.properties == {"replication_num": "1", "partition_ttl": "2 MONTH", "storage_medium": "HDD"}
+
+    def test_unchanged(self):
+        existing = MaterializedViewConfig.from_ddl(DDL)
+        refresh = "async start('2022-09-01 10:00:00') every (interval 1 day)"
+        assert get_changes(existing, FINGERPRINT, refresh, {"replication_num": 1}) is None
+
+    def test_query_change_rebuilds(self):
+        existing = MaterializedViewConfig.from_ddl(DDL)
+        changes = get_changes(existing, "dbt_fingerprint:fedcba9876543210", "async", None)
+        assert changes.rebuild
+
+    @pytest.mark.parametrize("comment, expected", [(None, False), ("daily revenue", False), (FINGERPRINT, True)])
+    def test_has_fingerprint(self, comment, expected):
+        assert MaterializedViewConfig(comment=comment).has_fingerprint == expected
+
+    @pytest.mark.parametrize("refresh, properties, expected_refresh, expected_properties", [
+        ("deferred manual", None, "manual", {}),
+        ("async every (interval 1 day)", {"partition_ttl": "2 MONTH"}, "async every (interval 1 day)", {}),
+        (None, {"partition_ttl": "3 MONTH", "mv_rewrite_staleness_second": 60},
+         None, {"partition_ttl": "3 MONTH", "mv_rewrite_staleness_second": "60"}),
+    ])
+    def test_changes_are_altered(self, refresh, properties, expected_refresh, expected_properties):
+        existing = MaterializedViewConfig.from_ddl(DDL)
+        changes = get_changes(existing, FINGERPRINT, refresh, properties)
+        assert not changes.rebuild
+        assert changes.refresh == expected_refresh
+        assert changes.properties == expected_properties
+
+
+def _adapter(ddl):
+    adapter = object.__new__(StarRocksAdapter)
+    adapter.execute = MagicMock(return_value=(None, [("my_mv", ddl)]))
+    return adapter
+
+
+class TestMaterializedViewWithoutFingerprint:
+    DDL = "CREATE MATERIALIZED VIEW `my_mv` REFRESH MANUAL AS SELECT 1"
+
+    def test_is_rebuilt_once(self):
+        adapter = _adapter(self.DDL)
+        changes = adapter.get_materialized_view_changes("`db`.`my_mv`", FINGERPRINT, "manual", None)
+        assert changes.rebuild
+        # no fingerprint is adopted for a query which may have changed
+        adapter.execute.assert_called_once_with("show create materialized view `db`.`my_mv`", fetch=True)
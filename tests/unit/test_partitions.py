@@ -0,0 +1,124 @@
+import datetime
+from decimal import Decimal
+from unittest.mock import MagicMock
+
+import agate
+import pytest
+
+from dbt.adapters.starrocks.column import StarRocksColumn
+from dbt.adapters.starrocks.impl import StarRocksAdapter
+
+from dbt.adapters.starrocks.partitions import (
+    MAX_PARTITION_VALUES,
+    parse_partitions,
+    partitions_for_values,
+    sql_literal,
+)
+
+RANGE_PARTITIONS = [
+    {"PartitionName": "p20240101", "Range": "[types: [DATE]; keys: [2024-01-01]; ..types: [DATE]; keys: [2024-01-02]; )"},
+    {"PartitionName": "p20240102", "Range": "[types: [DATE]; keys: [2024-01-02]; ..types: [DATE]; keys: [2024-01-03]; )"},
+    {"PartitionName": "p20240103", "Range": "[types: [DATE]; keys: [2024-01-03]; ..types: [DATE]; keys: [2024-01-04]; )"},
+]
+
+LIST_PARTITIONS = [
+    {"PartitionName": "p1", "Range": "", "List": "(('1'),('2'))"},
+    {"PartitionName": "p3", "Range": "", "List": "[[\"3\"]]"},
+]
+
+
+class TestPartitionScoping:
+    def test_range_partitions(self):
+        partitions = parse_partitions(RANGE_PARTITIONS)
+        values = [datetime.date(2024, 1, 3), datetime.datetime(2024, 1, 1, 12, 30)]
+        assert partitions_for_values(partitions, values).names == ["p20240101", "p20240103"]
+
+    def test_unbounded_range_partitions(self):
+        partitions = parse_partitions([
+            {"PartitionName": "p_old", "Range": "[types: [DATETIME]; keys: [0000-01-01 00:00:00]; ..types: [DATETIME]; keys: [2024-01-01 00:00:00]; )"},
+            {"PartitionName": "p_new", "Range": "[types: [DATETIME]; keys: [2024-01-01 00:00:00]; ..types: [DATETIME]; keys: [MAXVALUE]; )"},
+        ])
+        assert partitions_for_values(partitions, [datetime.date(1999, 5, 1)]).names == ["p_old"]
+        assert partitions_for_values(partitions, ["2030-01-01 10:00:00"]).names == ["p_new"]
+
+    def test_list_partitions(self):
+        partitions = parse_partitions(LIST_PARTITIONS, key_type="INT")
+        assert partitions_for_values(partitions, [Decimal(2), Decimal(1)]).names == ["p1"]
+        assert partitions_for_values(partitions, [Decimal(3)]).names == ["p3"]
+
+    def test_values_without_partition_need_no_overwrite(self):
+        partitions = parse_partitions(RANGE_PARTITIONS)
+        matched = partitions_for_values(partitions, [datetime.date(2024, 2, 1), datetime.date(2024, 2, 2)])
+        assert matched.names == []
+        assert matched.existing_values == []
+
+    def test_mixed_values_are_split(self):
+        new_day, existing_day = datetime.date(2024, 2, 1), datetime.date(2024, 1, 1)
+        matched = partitions_for_values(parse_partitions(RANGE_PARTITIONS), [existing_day, new_day])
+        assert matched.names == ["p20240101"]
+        assert matched.existing_values == [existing_day]
+        assert matched.new_values == [new_day]
+
+    @pytest.mark.parametrize("values", [[None], [datetime.date(2024, 1, 1), None], ["not a date"]])
+    def test_undeterminable_values(self, values):
+        assert partitions_for_values(parse_partitions(RANGE_PARTITIONS), values) is None
+
+    @pytest.mark.parametrize("value, expected", [
+        (3, "3"),
+        (Decimal("1.5"), "1.5"),
+        (datetime.date(2024, 1, 2), "'2024-01-02'"),
+        (datetime.datetime(2024, 1, 2, 3, 4, 5), "'2024-01-02 03:04:05'"),
+        ("it's", "'it\\'s'"),
+    ])
+    def test_sql_literal(self, value, expected):
+        assert sql_literal(value) == expected
+
+    @pytest.mark.parametrize("row", [
+        {"PartitionName": "orders", "Range": "", "List": ""},
+        {"PartitionName": "p1", "Range": "[types: [DATE, INT]; keys: [2024-01-01, 1]; ..types: [DATE, INT]; keys: [2024-01-02, 1]; )"},
+        {"PartitionName": "p1", "Range": "[types: [DATE]; keys: [yesterday]; ..types: [DATE]; keys: [2024-01-02]; )"},
+        {"PartitionName": "p1", "Range": "", "List": "(('1', 'a'))"},
+    ])
+    def test_unsupported_partitions(self, row):
+        assert parse_partitions([row]) is None
+
+
+
+def _adapter(values):
+    adapter = object.__new__(StarRocksAdapter)
+    cursor = MagicMock()
+    cursor.fetchall.return_value = [(v,) for v in values]
+    adapter.connections = MagicMock()
+    adapter.connections.add_select_query.return_value = (MagicMock(), cursor)
+    show_partitions = agate.Table([[row["PartitionName"], row["Range"]] for row in RANGE_PARTITIONS],
+                                  ["PartitionName", "Range"], [agate.Text(), agate.Text()])
+    adapter.execute = MagicMock(return_value=(None, show_partitions))
+    adapter.get_columns_in_relation = MagicMock(return_value=[StarRocksColumn("dt", "date")])
+    return adapter
+
+
+class TestOverwritePartitions:
+    def test_mixed_rows_are_split_with_filters(self):
+        adapter = _adapter([datetime.date(2024, 1, 2), datetime.date(2024, 2, 1)])
+
+        overwrite = adapter.get_overwrite_partitions("target", "temp", ["dt"])
+
+        assert overwrite.partitions == ["p20240102"]
+        assert overwrite.existing_filter == "`dt` in ('2024-01-02')"
+        assert overwrite.new_filter == "`dt` in ('2024-02-01')"
+        assert overwrite.unresolved is None
+
+    def test_existing_partitions_only(self):
+        overwrite = _adapter([datetime.date(2024, 1, 2)]).get_overwrite_partitions("target", "temp", ["dt"])
+
+        assert overwrite.partitions == ["p20240102"]
+        assert overwrite.existing_filter is None and overwrite.new_filter is None
+
+    @pytest.mark.parametrize("values, partition_by", [
+        ([None], ["dt"]),
+        (list(range(MAX_PARTITION_VALUES + 1)), ["dt"]),
+        ([datetime.date(2024, 1, 2)], ["date_trunc('day', dt)"]),
+    ])
+    def test_undeterminable_partitions_are_unresolved(self, values, partition_by):
+        overwrite = _adapter(values).get_overwrite_partitions("target", "temp", partition_by)
+        assert overwrite.unresolved
@@ -0,0 +1,148 @@
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import mysql.connector
+import pytest
+
+from dbt.adapters.starrocks.connections import (
+    StarRocksAdapterResponse,
+    StarRocksConnectionManager,
+    StarRocksCredentials,
+)
+from dbt.adapters.starrocks.impl import StarRocksAdapter
+from dbt.adapters.starrocks.query_profile import parse_bytes, parse_count, parse_query_profile, parse_time_ms
+
+PROFILE = """
+Query:
+  Summary:
+     - Query ID: 0c1b2a3d-0000-11ef-8000-000000000001
+     - Total: 1s234ms
+  Execution:
+     - QueryCumulativeCpuTime: 2s500ms
+     - QueryExecutionWallTime: 1s200ms
+     - QueryPeakMemoryUsagePerNode: 1.500 MB
+  Fragment 1:
+    Pipeline (id=0):
+      OLAP_SCAN (plan_node_id=0):
+        CommonMetrics:
+           - __MAX_OF_RawRowsRead: 600
+        UniqueMetrics:
+           - BytesRead: 1.000 KB
+           - RawRowsRead: 1.000K (1000)
+      OLAP_SCAN (plan_node_id=2):
+        UniqueMetrics:
+           - BytesRead: 512.000 B
+           - RawRowsRead: 24
+"""
+
+
+class TestQueryProfileParsing:
+    @pytest.mark.parametrize("value, expected", [
+        ("1s234ms", 1234), ("1m2s", 62000), ("12.5ms", 12.5), ("250us", 0.25), ("1h", 3600000),
+    ])
+    def test_parse_time(self, value, expected):
+        assert parse_time_ms(value) == pytest.approx(expected)
+
+    def test_parse_bytes_and_counts(self):
+        assert parse_bytes("1.500 MB") == 1572864
+        assert parse_count("1.234M (1234567)") == 1234567
+        assert parse_count("24") == 24
+
+    def test_parse_query_profile(self):
+        assert parse_query_profile(PROFILE) == {
+            "cpu_time_ms": 2500,
+            "peak_memory_bytes": 1572864,
+            "scan_rows": 1024,
+            "scan_bytes": 1536,
+        }
+
+    def test_missing_profile(self):
+        assert set(parse_query_profile(None).values()) == {None}
+
+
+def _manager(row=None, error=None):
+    manager = object.__new__(StarRocksConnectionManager)
+    manager.profile = SimpleNamespace(credentials=StarRocksCredentials(
+        host="localhost", port=9030, schema="db", username="root", password="", query_profile=True))
+    cursor = MagicMock()
+    cursor.fetchone.return_value = row
+    if error is not None:
+        cursor.execute.side_effect = error
+    handle = MagicMock()
+    handle.cursor.return_value = cursor
+    manager.get_thread_connection = MagicMock(return_value=SimpleNamespace(handle=handle))
+    manager._execute = MagicMock(return_value=(StarRocksAdapterResponse(
+        _message="SUCCESS 3", code="SUCCESS", rows_affected=3), "table"))
+    return manager, cursor
+
+
+class TestQueryProfileCapture:
+    def test_profile_is_added_to_the_response(self):
+        manager, cursor = _manager(("query-1", PROFILE))
+
+        response, table = manager.execute("insert into t select * from s", profile=True)
+
+        assert cursor.execute.call_args[0][0] == "select last_query_id(), get_query_profile(last_query_id())"
+        assert table == "table"
+        assert response.rows_affected == 3
+        assert response.query_id == "query-1"
+        assert response.cpu_time_ms == 2500
+        assert response.scan_rows == 1024
+        assert response.wall_time_ms >= 0
+
+    def test_unavailable_profile_keeps_the_response(self):
+        manager, _ = _manager(error=mysql.connector.Error("profile not found"))
+
+        response, _ = manager.execute("insert into t select * from s", profile=True)
+
+        assert response.rows_affected == 3
+        assert response.query_id is None
+        assert response.wall_time_ms is not None
+
+    def test_disabled_by_default(self):
+        manager, cursor = _manager()
+        manager.profile.credentials.query_profile = False
+
+        manager.execute("select 1", profile=True)
+
+        cursor.execute.assert_not_called()
+
+    def test_only_requested_statements_are_profiled(self):
+        # e.g. the metadata queries of the adapter, which are not `main` statements
+        manager, cursor = _manager(("query-1", PROFILE))
+
+        response, _ = manager.execute("select * from information_schema.columns")
+
+        cursor.execute.assert_not_called()
+        assert response.query_id is None
+        assert response.wall_time_ms is None
+
+
+def _adapter(is_async):
+    adapter = object.__new__(StarRocksAdapter)
+    adapter.config = SimpleNamespace(credentials=StarRocksCredentials(
+        host="localhost", port=9030, schema="db", username="root", password="", query_profile=True,
+        is_async=is_async))
+    adapter.connections = MagicMock()
+    adapter.connections.execute.return_value = (StarRocksAdapterResponse(_message="OK", code="OK"), None)
+    return adapter
+
+
+class TestAdapterQueryProfile:
+    @pytest.mark.parametrize("profile", [True, False])
+    def test_profile_is_passed_to_the_connection(self, profile):
+        adapter = _adapter(is_async=False)
+
+        adapter.execute("insert into t select * from s", profile=profile)
+
+        assert adapter.connections.execute.call_args.kwargs["profile"] is profile
+
+    def test_submitted_task_is_not_profiled(self):
+        adapter = _adapter(is_async=True)
+        adapter._wait_for_task = MagicMock(return_value=("response", "table"))
+
+        assert adapter.execute("insert into t select * from s", profile=True) == ("response", "table")
+
+        submit_sql = adapter.connections.execute.call_args.kwargs["sql"]
+        assert submit_sql.startswith("submit ")
+        assert not adapter.connections.execute.call_args.kwargs.get("profile")
@@ -41,4 +41,31 @@ class TestCatalogRelationRendering:
         rendered = relation.render()
         assert 'analytics' in rendered
         assert 'my_table' in rendered
-        assert rendered.index('analytics') < rendered.index('my_table')
\ No newline at end of file
+        assert rendered.index('analytics') < rendered.index('my_table')
+
+class TestComplexTypeResolution:
+    COLUMNS = [
+        ("id", "bigint", None, 19, 0),
+        ("tags", "array", None, None, None),
+        ("attrs", "map", None, None, None),
+    ]
+    DESC = [
+        ("id", "bigint", "YES", "true", None, ""),
+        ("tags", "array<varchar(10)>", "YES", "false", None, ""),
+        ("attrs", "map<varchar(10),int>", "YES", "false", None, ""),
+    ]
+
+    def test_complex_types_are_resolved_from_desc(self):
+        rows = StarRocksRelation.resolve_complex_types(self.COLUMNS, self.DESC)
+        assert [row[1] for row in rows] == ["bigint", "array<varchar(10)>", "map<varchar(10),int>"]
+
+    def test_relations_do_not_share_types(self):
+        other_desc = [("tags", "array<int>", "YES", "false", None, "")]
+        first = StarRocksRelation.resolve_complex_types(self.COLUMNS, self.DESC)
+        second = StarRocksRelation.resolve_complex_types(self.COLUMNS[:2], other_desc)
+        assert first[1][1] == "array<varchar(10)>"
+        assert second[1][1] == "array<int>"
+
+    def test_without_complex_types(self):
+        assert not StarRocksRelation.has_complex_types(self.COLUMNS[:1])
+        assert StarRocksRelation.resolve_complex_types(self.COLUMNS[:1], None) == [list(self.COLUMNS[0])]
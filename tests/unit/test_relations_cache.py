@@ -0,0 +1,43 @@
+from contextlib import nullcontext
+from unittest.mock import MagicMock
+
+import agate
+from dbt.adapters.cache import RelationsCache
+
+from dbt.adapters.starrocks.impl import LIST_RELATIONS_IN_SCHEMAS_MACRO_NAME, StarRocksAdapter
+from dbt.adapters.starrocks.relation import StarRocksRelation
+
+
+def _adapter(rows):
+    adapter = object.__new__(StarRocksAdapter)
+    adapter.cache = RelationsCache()
+    adapter.connection_named = MagicMock(return_value=nullcontext())
+    adapter.execute_macro = MagicMock(return_value=agate.Table(
+        rows, ["database", "name", "schema", "table_type"]))
+    return adapter
+
+
+def _schema(name):
+    return StarRocksRelation.create(database=None, schema=name)
+
+
+class TestRelationsCacheWarmUp:
+    def test_all_schemas_are_listed_with_one_query(self):
+        adapter = _adapter([
+            (None, "orders", "sales", "table"),
+            (None, "orders_v", "sales", "view"),
+            (None, "daily", "marts", "materialized_view"),
+        ])
+
+        adapter._relations_cache_for_schemas([], {_schema("sales"), _schema("marts"), _schema("empty")})
+
+        adapter.execute_macro.assert_called_once_with(
+            LIST_RELATIONS_IN_SCHEMAS_MACRO_NAME, kwargs={"schemas": ["empty", "marts", "sales"]})
+        assert sorted(r.identifier for r in adapter.cache.get_relations(None, "sales")) == ["orders", "orders_v"]
+        assert [r.type for r in adapter.cache.get_relations(None, "marts")] == ["materialized_view"]
+        assert (None, "empty") in adapter.cache
+
+    def test_no_query_without_schemas(self):
+        adapter = _adapter([])
+        adapter._relations_cache_for_schemas([], {StarRocksRelation.create(database=None, schema=None)})
+        adapter.execute_macro.assert_not_called()
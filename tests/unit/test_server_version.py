@@ -0,0 +1,79 @@
+import json
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+from dbt.adapters.contracts.connection import Connection
+
+from dbt.adapters.starrocks.connections import (
+    DEFAULT_VERSION,
+    ServerVersionCache,
+    StarRocksConnectionManager,
+    StarRocksCredentials,
+    _parse_version,
+)
+
+
+class TestParseVersion:
+    @pytest.mark.parametrize("result, expected", [
+        ("3.5.14-a1b2c3d", (3, 5, 14)),
+        ("3.1.0 1234567", (3, 1, 0)),
+        ("10.12.3", (10, 12, 3)),
+        ("4.0-latest", (4, 0, 0)),
+        ("2.5.22-ee-abcdef", (2, 5, 22)),
+        ("unknown", DEFAULT_VERSION),
+        ("", DEFAULT_VERSION),
+    ])
+    def test_parse_version(self, result, expected):
+        assert _parse_version(result) == expected
+
+
+class TestServerVersionCache:
+    def test_detect_called_once(self):
+        cache = ServerVersionCache()
+        detect = MagicMock(return_value=(3, 5, 0))
+        assert cache.get_or_detect(("h", 9030), detect) == (3, 5, 0)
+        assert cache.get_or_detect(("h", 9030), detect) == (3, 5, 0)
+        detect.assert_called_once()
+
+    def test_persisted_version_is_reused_within_ttl(self, tmp_path):
+        path = str(tmp_path / "version.json")
+        cache = ServerVersionCache()
+        cache.load(path, ttl=60)
+        cache.set(("h", 9030), (3, 5, 14))
+
+        other = ServerVersionCache()
+        other.load(path, ttl=60)
+        assert other.get(("h", 9030)) == (3, 5, 14)
+
+    def test_expired_persisted_version_is_ignored(self, tmp_path):
+        path = tmp_path / "version.json"
+        path.write_text(json.dumps({"h:9030": {"version": [3, 5, 14], "detected_at": time.time() - 120}}))
+        cache = ServerVersionCache()
+        cache.load(str(path), ttl=60)
+        assert cache.get(("h", 9030)) is None
+
+
+class TestOpenUsesVersionCache:
+    @pytest.fixture(autouse=True)
+    def empty_cache(self):
+        with patch.object(StarRocksConnectionManager, "_server_versions", ServerVersionCache()):
+            yield
+
+    def test_version_probed_once_per_cluster(self):
+        credentials = StarRocksCredentials(host="h", port=9030, schema="db", username="root", password="")
+        handles = []
+
+        def _connect(**kwargs):
+            handle = MagicMock()
+            handle.cursor.return_value.fetchone.return_value = ("3.5.14-a1b2c3d",)
+            handles.append(handle)
+            return handle
+
+        with patch("mysql.connector.connect", side_effect=_connect):
+            for _ in range(3):
+                connection = Connection(type="starrocks", name="model", credentials=credentials)
+                StarRocksConnectionManager.open(connection)
+                assert connection.handle.server_version == (3, 5, 14)
+
+        assert sum(h.cursor.return_value.execute.call_count for h in handles) == 1
@@ -0,0 +1,137 @@
+import datetime
+import decimal
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
+import pytest
+import dbt_common.exceptions
+
+from dbt.adapters.starrocks import stream_load
+from dbt.adapters.starrocks.stream_load import (
+    StreamLoadClient,
+    batched,
+    encode_rows,
+    format_value,
+)
+
+
+class TestEncodeRows:
+    @pytest.mark.parametrize("value, expected", [
+        (None, "\\N"),
+        (True, "true"),
+        (False, "false"),
+        (decimal.Decimal("1E+2"), "100"),
+        (decimal.Decimal("0.0625"), "0.0625"),
+        (datetime.date(2025, 1, 2), "2025-01-02"),
+        (datetime.datetime(2025, 1, 2, 3, 4, 5), "2025-01-02 03:04:05"),
+        (datetime.datetime(2025, 1, 2, 3, 4, 5, tzinfo=datetime.timezone(datetime.timedelta(hours=2))),
+         "2025-01-02 01:04:05"),
+        ("a,b\n\"c\"", "a,b\n\"c\""),
+    ])
+    def test_format_value(self, value, expected):
+        assert format_value(value) == expected
+
+    @pytest.mark.parametrize("value", ["a\x01b", "a\x02b"])
+    def test_format_value_rejects_separators(self, value):
+        with pytest.raises(dbt_common.exceptions.DbtRuntimeError, match="load_method: insert"):
+            format_value(value)
+
+    def test_encode_rows_uses_control_separators(self):
+        body = encode_rows([(1, "a"), (2, None)])
+        assert body == b"1\x01a\x022\x01\\N"
+
+    def test_batched(self):
+        assert [len(b) for b in batched(range(5), 2)] == [2, 2, 1]
+
+
+class _FakeStarRocks(BaseHTTPRequestHandler):
+    """Answers like an FE (redirect) on /api and like a BE on /be."""
+
+    protocol_version = "HTTP/1.1"
+    requests = []
+
+    def handle_expect_100(self):
+        if self.path.startswith("/api/"):
+            # the FE redirects without reading the body
+            type(self).requests.append((self.path, dict(self.headers), None))
+            self._redirect()
+            return False
+        return super().handle_expect_100()
+
+    def _redirect(self):
+        self.send_response(307)
+        self.send_header("Location", "http://127.0.0.1:{}/be{}".format(self.server.server_port, self.path))
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def do_PUT(self):
+        body = self.rfile.read(int(self.headers["Content-Length"]))
+        type(self).requests.append((self.path, dict(self.headers), body))
+        if self.path.startswith("/api/"):
+            self._redirect()
+            return
+        payload = json.dumps({
+            "Label": self.headers["label"],
+            "Status": "Success",
+            "NumberTotalRows": 3,
+            "NumberLoadedRows": 2,
+            "NumberFilteredRows": 1,
+            "LoadTimeMs": 7,
+        }).encode()
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, *args):
+        pass
+
+
+class _FakeHttp10StarRocks(_FakeStarRocks):
+    """Ignores `Expect: 100-continue`, and always reads the body."""
+
+    protocol_version = "HTTP/1.0"
+
+
+@pytest.fixture
+def fake_server(request):
+    _FakeStarRocks.requests = []
+    server = HTTPServer(("127.0.0.1", 0), getattr(request, "param", _FakeStarRocks))
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+class TestStreamLoadClient:
+    def test_load_follows_redirect_and_parses_counts(self, fake_server):
+        client = StreamLoadClient("127.0.0.1", fake_server.server_port, "root", "")
+        result = client.load("db", "seed", ["id", "name"], b"1\x01a", label="lbl")
+
+        assert result.succeeded
+        assert (result.rows_total, result.rows_loaded, result.rows_filtered) == (3, 2, 1)
+
+        (fe_path, _, fe_body), (be_path, be_headers, be_body) = _FakeStarRocks.requests
+        assert fe_path == "/api/db/seed/_stream_load"
+        assert fe_body is None
+        assert be_path == "/be/api/db/seed/_stream_load"
+        assert be_headers["Authorization"].startswith("Basic ")
+        assert be_headers["Expect"] == "100-continue"
+        assert be_headers["columns"] == "`id`,`name`"
+        assert be_body == b"1\x01a"
+
+    @pytest.mark.parametrize("fake_server", [_FakeHttp10StarRocks], indirect=True)
+    def test_load_sends_body_when_continue_is_ignored(self, fake_server, monkeypatch):
+        monkeypatch.setattr(stream_load, "CONTINUE_TIMEOUT", 0.1)
+        client = StreamLoadClient("127.0.0.1", fake_server.server_port, "root", "")
+        result = client.load("db", "seed", ["id", "name"], b"1\x01a", label="lbl")
+
+        assert result.succeeded
+        assert [body for _, _, body in _FakeStarRocks.requests] == [b"1\x01a", b"1\x01a"]
+
+    def test_connection_error_raises(self):
+        client = StreamLoadClient("127.0.0.1", 1, "root", "", timeout=1)
+        with pytest.raises(dbt_common.exceptions.DbtRuntimeError):
+            client.load("db", "seed", ["id"], b"1")
@@ -0,0 +1,109 @@
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+from dbt.adapters.contracts.connection import Connection
+
+from dbt.adapters.starrocks.connections import StarRocksConnectionManager, StarRocksCredentials
+
+
+class FakeCursor:
+    """An unbuffered cursor over *total* rows, recording the size of each fetch."""
+
+    def __init__(self, total):
+        self.description = [("id",), ("name",)]
+        self.rows = iter([(i, f"row {i}") for i in range(total)])
+        self.rowcount = 0
+        self.fetch_sizes = []
+
+    def fetchmany(self, size):
+        self.fetch_sizes.append(size)
+        rows = [row for _, row in zip(range(size), self.rows)]
+        self.rowcount += len(rows)
+        return rows
+
+    def fetchone(self):
+        return next(self.rows, None)
+
+
+def _credentials(**kwargs):
+    return StarRocksCredentials(
+        host="localhost", port=9030, schema="db", username="root", password="",
+        version="3.5.0", **kwargs,
+    )
+
+
+def _manager(credentials, cursor):
+    manager = object.__new__(StarRocksConnectionManager)
+    manager.profile = SimpleNamespace(credentials=credentials, query_comment=None)
+    manager._add_query_comment = lambda sql: sql
+    handle = MagicMock(unread_result=True)
+    manager.add_query = MagicMock(return_value=(SimpleNamespace(handle=handle), cursor))
+    return manager, handle
+
+
+class TestStreamingFetch:
+    def test_rows_are_fetched_in_chunks(self):
+        cursor = FakeCursor(25)
+        manager, _ = _manager(_credentials(buffered=False, fetch_chunk_size=10), cursor)
+
+        response, table = manager.execute("select 1", fetch=True)
+
+        assert len(table) == 25
+        assert table[24]["name"] == "row 24"
+        assert cursor.fetch_sizes == [10, 10, 10, 10]
+        assert response.rows_affected == 25
+
+    def test_fetch_max_rows_caps_and_discards_the_rest(self):
+        cursor = FakeCursor(25)
+        manager, handle = _manager(_credentials(buffered=False, fetch_chunk_size=10, fetch_max_rows=15), cursor)
+
+        _, table = manager.execute("select 1", fetch=True)
+
+        assert len(table) == 15
+        assert cursor.fetch_sizes == [10, 5]
+        handle.consume_results.assert_called_once()
+
+    def test_metadata_fetch_is_not_capped(self):
+        cursor = FakeCursor(25)
+        manager, _ = _manager(_credentials(buffered=False, fetch_chunk_size=10, fetch_max_rows=15), cursor)
+
+        with manager.metadata_fetch():
+            _, table = manager.execute("select table_name from information_schema.tables", fetch=True)
+        assert len(table) == 25
+
+        # the cap applies again once the metadata macro is done
+        manager.add_query.return_value = (manager.add_query.return_value[0], FakeCursor(25))
+        _, table = manager.execute("select 1", fetch=True)
+        assert len(table) == 15
+
+    def test_limit_overrides_fetch_max_rows(self):
+        cursor = FakeCursor(25)
+        manager, _ = _manager(_credentials(buffered=False, fetch_chunk_size=10, fetch_max_rows=15), cursor)
+
+        _, table = manager.execute("select 1", fetch=True, limit=3)
+
+        assert len(table) == 3
+        assert cursor.fetch_sizes == [3]
+
+    def test_buffered_profile_keeps_default_fetch(self):
+        cursor = FakeCursor(25)
+        manager, _ = _manager(_credentials(fetch_chunk_size=10), cursor)
+
+        with patch("dbt.adapters.sql.connections.SQLConnectionManager.execute") as execute:
+            manager.execute("select 1", fetch=True)
+        execute.assert_called_once()
+        assert cursor.fetch_sizes == []
+
+
+class TestUnbufferedOpen:
+    @pytest.mark.parametrize("buffered, expected", [(True, {"buffered": True}), (False, {"buffered": False, "consume_results": True})])
+    def test_connect_kwargs(self, buffered, expected):
+        credentials = _credentials(buffered=buffered)
+        with patch("mysql.connector.connect") as connect:
+            StarRocksConnectionManager.open(Connection(type="starrocks", name="model", credentials=credentials))
+        kwargs = connect.call_args.kwargs
+        for key, value in expected.items():
+            assert kwargs[key] == value
+        if buffered:
+            assert "consume_results" not in kwargs
@@ -42,4 +42,28 @@ class TestDBTLikeIsSubmittableETL:
         ]
     )
     def test_is_submittable_etl_suitable(self, sql, expected):
-        assert StarRocksAdapter._is_submittable_etl(sql) == expected
\ No newline at end of file
+        assert StarRocksAdapter._is_submittable_etl(sql) == expected
+
+    @pytest.mark.parametrize(
+        "sql, expected",
+        [
+            ("/* {\"app\": \"dbt\"} */\n-- the model\nINSERT OVERWRITE `t` select 1", True),
+            ("/*+ SET_VAR(query_timeout = 600) */ create table t as select 1", True),
+            ("create table t (id bigint) distributed by hash(id)", False),
+            ("create table t as with s as (select 1) select * from s", True),
+            ("set enable_profile = true;\ncreate table t as select 1", False),
+            ("select * from t where id in (select id from s) -- insert into t", False),
+            ("insertinto t select 1", False),
+            ("insert /*+SET_VAR(dynamic_overwrite = FALSE)*/ overwrite `t` select 1", True),
+            ("insert /*+SET_VAR(partial_update_mode = 'column')*/ into `t` (id, v) select 1, 2", True),
+            ("insert /* not a hint */ select 1", False),
+            ("/* unterminated comment insert into t select 1", False),
+        ]
+    )
+    def test_only_leading_tokens_are_classified(self, sql, expected):
+        assert StarRocksAdapter._is_submittable_etl(sql) == expected
+
+    def test_large_statement_is_classified_from_its_head(self):
+        values = ", ".join(str(i) for i in range(200000))
+        assert StarRocksAdapter._is_submittable_etl(f"insert into t select * from s where id in ({values})")
+        assert not StarRocksAdapter._is_submittable_etl(f"select * from s where id in ({values})")
@@ -0,0 +1,91 @@
+import threading
+
+import pytest
+import dbt_common.exceptions
+
+from dbt.adapters.starrocks.task_poller import TaskPoller
+
+
+class _FakeTaskRuns:
+    """Each task runs for `polls` polls before reaching its final state."""
+
+    def __init__(self, tasks):
+        self.tasks = tasks
+        self.queries = []
+        self.lock = threading.Lock()
+
+    def __call__(self, task_ids):
+        with self.lock:
+            self.queries.append(sorted(task_ids))
+            task_runs = {}
+            for task_id in task_ids:
+                if task_id not in self.tasks:
+                    continue
+                polls, final_state = self.tasks[task_id]
+                state = "RUNNING" if polls > 0 else final_state
+                self.tasks[task_id] = (polls - 1, final_state)
+                task_runs[task_id] = {"TASK_NAME": task_id, "STATE": state, "ERROR_MESSAGE": "boom", "PROGRESS": "50%"}
+            return task_runs
+
+
+def _poller(fake):
+    return TaskPoller(fake, lambda attempt: 0.01)
+
+
+class TestTaskPoller:
+    def test_concurrent_tasks_are_polled_in_one_query(self):
+        fake = _FakeTaskRuns({"a": (1, "SUCCESS"), "b": (1, "SUCCESS"), "c": (1, "MERGED")})
+        poller = _poller(fake)
+        # Hold the poller lock so that all the tasks are due on the first tick
+        with poller._condition:
+            futures = [poller.submit(task_id) for task_id in ("a", "b", "c")]
+        results = [future.result(timeout=5) for future in futures]
+
+        assert [r["STATE"] for r in results] == ["SUCCESS", "SUCCESS", "MERGED"]
+        assert fake.queries == [["a", "b", "c"], ["a", "b", "c"]]
+
+    def test_failed_task_raises(self):
+        poller = _poller(_FakeTaskRuns({"a": (0, "FAILED")}))
+        with pytest.raises(dbt_common.exceptions.DbtRuntimeError, match="boom"):
+            poller.wait("a")
+
+    def test_missing_task_returns_none(self):
+        poller = _poller(_FakeTaskRuns({}))
+        assert poller.wait("a") is None
+
+    def test_cancel_wakes_up_waiter(self):
+        poller = TaskPoller(_FakeTaskRuns({"a": (10 ** 6, "SUCCESS")}), lambda attempt: 60)
+        future = poller.submit("a")
+        poller.cancel("a")
+        with pytest.raises(dbt_common.exceptions.DbtRuntimeError, match="cancelled"):
+            future.result(timeout=5)
+
+    def test_fetch_error_is_propagated(self):
+        def _fail(task_ids):
+            raise RuntimeError("connection lost")
+
+        with pytest.raises(RuntimeError, match="connection lost"):
+            _poller(_fail).wait("a")
+
+    def test_thread_stops_when_idle_and_restarts(self):
+        fake = _FakeTaskRuns({"a": (0, "SUCCESS"), "b": (0, "SUCCESS")})
+        poller = _poller(fake)
+        assert poller.wait("a")["STATE"] == "SUCCESS"
+        assert poller.wait("b")["STATE"] == "SUCCESS"
+
+    def test_unexpected_error_fails_waiters_and_restarts(self):
+        fake = _FakeTaskRuns({"a": (1, "SUCCESS"), "b": (0, "SUCCESS")})
+        delays = iter([ValueError("bad delay")])
+
+        def _compute_delay(attempt):
+            delay = next(delays, 0.01)
+            if isinstance(delay, Exception):
+                raise delay
+            return delay
+
+        poller = TaskPoller(fake, _compute_delay)
+        with pytest.raises(ValueError, match="bad delay"):
+            poller.wait("a")
+
+        # the poller is restarted: a later task is not left waiting forever
+        assert poller.submit("b").result(timeout=5)["STATE"] == "SUCCESS"
@@ -0,0 +1,204 @@
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+import dbt.exceptions
+
+from dbt.adapters.sql import SQLAdapter
+
+from dbt.adapters.starrocks.connections import StarRocksCredentials
+from dbt.adapters.starrocks.impl import StarRocksAdapter
+from dbt.adapters.starrocks.relation import StarRocksRelation
+
+
+def _adapter(rows):
+    """An adapter whose connection answers the lean poll query with *rows*, one per poll."""
+    adapter = object.__new__(StarRocksAdapter)
+    adapter.config = SimpleNamespace(credentials=StarRocksCredentials(
+        host="localhost", port=9030, schema="db", username="root", password="",
+        poll_interval=1, poll_factor=2.0, poll_max_delay=600,
+    ))
+    cursor = MagicMock()
+    cursor.fetchone.side_effect = rows
+    adapter.connections = MagicMock()
+    adapter.connections.add_select_query.return_value = (MagicMock(), cursor)
+    return adapter
+
+
+class TestLeanTaskPolling:
+    def test_poll_query_selects_only_needed_columns(self):
+        adapter = _adapter([("SUCCESS", None, "100%")])
+        adapter._fetch_task_run("abc")
+
+        sql = adapter.connections.add_select_query.call_args[0][0]
+        assert sql.startswith("select state, error_message, progress from information_schema.task_runs")
+        assert "task_name = 'abc'" in sql
+        assert sql.endswith("limit 1")
+
+    def test_fetch_task_run_parses_cursor_tuple(self):
+        adapter = _adapter([("RUNNING", None, "42%")])
+        assert adapter._fetch_task_run("abc") == {"STATE": "RUNNING", "ERROR_MESSAGE": None, "PROGRESS": "42%"}
+
+    def test_fetch_missing_task_run(self):
+        adapter = _adapter([None])
+        assert adapter._fetch_task_run("abc") is None
+
+    @patch("dbt.adapters.starrocks.impl.time.sleep")
+    def test_poll_until_success(self, sleep):
+        adapter = _adapter([("PENDING", None, "0%"), ("RUNNING", None, "50%"), ("SUCCESS", None, "100%")])
+        response, table = adapter._poll_for_complete_task("abc")
+
+        assert response.code == "SUCCESS"
+        assert table[0]["STATE"] == "SUCCESS"
+        assert [c.args[0] for c in sleep.call_args_list] == [2.0, 4.0]
+
+    @patch("dbt.adapters.starrocks.impl.time.sleep")
+    def test_poll_failed_task_raises(self, sleep):
+        adapter = _adapter([("FAILED", "out of memory", "10%")])
+        with pytest.raises(dbt.exceptions.DbtRuntimeError, match="out of memory"):
+            adapter._poll_for_complete_task("abc")
+
+    def test_poll_missing_task_returns_empty_table(self):
+        adapter = _adapter([None])
+        _, table = adapter._poll_for_complete_task("abc")
+        assert len(table) == 0
+
+
+class TestSharedTaskPolling:
+    def test_only_the_latest_run_of_each_task_is_fetched(self):
+        adapter = _adapter([])
+        adapter.acquire_connection = MagicMock()
+        adapter.release_connection = MagicMock()
+        adapter.connections.add_select_query.return_value[1].fetchall.return_value = [
+            ("mv-1", "RUNNING", None, "50%"), ("abc", "SUCCESS", None, "100%")]
+
+        task_runs = adapter._fetch_task_runs(["mv-1", "abc"])
+
+        sql = adapter.connections.add_select_query.call_args.args[0]
+        assert "task_name in ('mv-1', 'abc')" in sql
+        assert "row_number() over (partition by task_name order by create_time desc)" in sql
+        assert sql.endswith("where run_rank = 1")
+        assert task_runs["mv-1"]["STATE"] == "RUNNING"
+        assert task_runs["abc"] == {"STATE": "SUCCESS", "ERROR_MESSAGE": None, "PROGRESS": "100%"}
+
+
+class TestMaterializedViewRefreshPolling:
+    @patch("dbt.adapters.starrocks.impl.time.sleep")
+    def test_wait_polls_the_refresh_task(self, sleep):
+        adapter = _adapter([("q-1",), ("RUNNING", None, "50%"), ("SUCCESS", None, "100%")])
+        adapter.connections.add_select_query.return_value[1].fetchall.return_value = [("mv-10042",)]
+        relation = SimpleNamespace(schema="db", identifier="my_mv")
+
+        adapter.wait_for_materialized_view_refresh(relation)
+
+        queries = [c.args[0] for c in adapter.connections.add_select_query.call_args_list]
+        assert "table_schema = 'db' and table_name = 'my_mv'" in queries[0]
+        assert all("task_name = 'mv-10042'" in sql for sql in queries[1:])
+        assert sleep.call_count == 1
+
+    @patch("dbt.adapters.starrocks.impl.time.sleep")
+    def test_wait_ignores_a_stale_finished_run(self, sleep):
+        # the latest run is the stale one, then the new refresh shows up, running
+        adapter = _adapter([("q-old",), ("q-new",), ("RUNNING", None, "50%"), ("SUCCESS", None, "100%")])
+        adapter.connections.add_select_query.return_value[1].fetchall.return_value = [("mv-10042",)]
+        relation = SimpleNamespace(schema="db", identifier="my_mv")
+
+        adapter.wait_for_materialized_view_refresh(relation, after="q-old")
+
+        queries = [c.args[0] for c in adapter.connections.add_select_query.call_args_list]
+        assert all(sql.startswith("select query_id from information_schema.task_runs") for sql in queries[1:3])
+        assert all(sql.startswith("select state, error_message") for sql in queries[3:])
+        assert len(queries) == 5
+        assert sleep.call_count == 2
+
+    @patch("dbt.adapters.starrocks.impl.time.sleep")
+    def test_wait_for_the_first_run_of_a_new_materialized_view(self, sleep):
+        # the immediate refresh of a created materialized view has no run yet
+        adapter = _adapter([None, ("q-1",), ("SUCCESS", None, "100%")])
+        adapter.connections.add_select_query.return_value[1].fetchall.return_value = [("mv-10042",)]
+
+        adapter.wait_for_materialized_view_refresh(SimpleNamespace(schema="db", identifier="my_mv"))
+
+        queries = [c.args[0] for c in adapter.connections.add_select_query.call_args_list]
+        assert all(sql.startswith("select query_id from information_schema.task_runs") for sql in queries[1:3])
+        assert queries[3].startswith("select state, error_message")
+        assert sleep.call_count == 1
+
+    @patch("dbt.adapters.starrocks.impl.time.sleep")
+    def test_wait_for_the_first_run_times_out(self, sleep):
+        adapter = _adapter([None] * 3)
+        adapter.config.credentials.async_query_timeout = 0
+        adapter.connections.add_select_query.return_value[1].fetchall.return_value = [("mv-10042",)]
+
+        with pytest.raises(dbt.exceptions.DbtRuntimeError, match="No run of task"):
+            adapter.wait_for_materialized_view_refresh(SimpleNamespace(schema="db", identifier="my_mv"))
+
+    @patch("dbt.adapters.starrocks.impl.time.sleep")
+    def test_wait_for_a_new_run_times_out(self, sleep):
+        adapter = _adapter([("q-old",)] * 3)
+        adapter.config.credentials.async_query_timeout = 0
+        adapter.connections.add_select_query.return_value[1].fetchall.return_value = [("mv-10042",)]
+
+        with pytest.raises(dbt.exceptions.DbtRuntimeError, match="No new run"):
+            adapter.wait_for_materialized_view_refresh(SimpleNamespace(schema="db", identifier="my_mv"), after="q-old")
+
+    def test_refresh_marker_is_the_latest_run(self):
+        adapter = _adapter([("q-old",)])
+        adapter.connections.add_select_query.return_value[1].fetchall.return_value = [("mv-10042",)]
+
+        assert adapter.get_materialized_view_refresh_marker(SimpleNamespace(schema="db", identifier="my_mv")) == "q-old"
+        assert "task_name = 'mv-10042'" in adapter.connections.add_select_query.call_args.args[0]
+
+    def test_wait_without_refresh_task(self):
+        adapter = _adapter([])
+        adapter.connections.add_select_query.return_value[1].fetchall.return_value = []
+
+        assert adapter.wait_for_materialized_view_refresh(SimpleNamespace(schema="db", identifier="my_mv")) == ""
+        assert adapter.connections.add_select_query.call_count == 1
+
+    def test_refresh_is_canceled_while_waiting(self):
+        adapter = _adapter([("q-1",)])
+        adapter.connections.add_select_query.return_value[1].fetchall.return_value = [("mv-10042",)]
+        adapter.connections.get_if_exists.return_value = SimpleNamespace(name="model.my_mv")
+        relation = StarRocksRelation.create(schema="db", identifier="my_mv")
+
+        def wait(task_id):
+            assert adapter._running_tasks["model.my_mv"] == task_id
+            with patch.object(SQLAdapter, "execute") as execute:
+                adapter._cancel_task(task_id)
+            assert execute.call_args.kwargs["sql"] == f"CANCEL REFRESH MATERIALIZED VIEW {relation}"
+
+        adapter._wait_for_task = MagicMock(side_effect=wait)
+        adapter.wait_for_materialized_view_refresh(relation)
+
+        adapter._wait_for_task.assert_called_once_with("mv-10042")
+        assert "model.my_mv" not in adapter._running_tasks
+        assert "mv-10042" not in adapter._task_cancel_statements
+
+
+class TestAsyncAddQuery:
+    @pytest.fixture
+    def adapter(self):
+        adapter = _adapter([("SUCCESS", None, "100%")])
+        adapter.config.credentials.is_async = True
+        adapter.connections.add_query.return_value = ("connection", "cursor")
+        return adapter
+
+    def test_seed_insert_is_submitted_with_its_bindings(self, adapter):
+        result = adapter.add_query("insert into `db`.`seed` (`id`) values (%s),(%s)", bindings=[1, 2],
+                                   abridge_sql_log=True)
+
+        assert result == ("connection", "cursor")
+        sql, auto_begin, bindings, abridge_sql_log = adapter.connections.add_query.call_args.args
+        assert sql.startswith("submit /*+set_var(query_timeout=300)*/ task ")
+        assert sql.endswith(" as insert into `db`.`seed` (`id`) values (%s),(%s)")
+        assert bindings == [1, 2]
+        assert abridge_sql_log
+        # the submitted task is polled until it is finished
+        assert "information_schema.task_runs" in adapter.connections.add_select_query.call_args.args[0]
+
+    def test_other_statements_are_not_submitted(self, adapter):
+        adapter.add_query("update `db`.`t` set a = %s", bindings=[1])
+
+        adapter.connections.add_query.assert_called_once_with("update `db`.`t` set a = %s", True, [1], False)
+        adapter.connections.add_select_query.assert_not_called()